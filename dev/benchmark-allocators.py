@@ -0,0 +1,56 @@
+import argparse
+import random
+import time
+
+from supriya.contexts.allocators import BlockAllocator
+
+
+def fill(allocator: BlockAllocator, live_blocks: int, seed: int) -> list[int]:
+    # allocate twice the target, then free every other block to leave holes
+    rng = random.Random(seed)
+    block_ids = [allocator.allocate(rng.randint(1, 8)) for _ in range(live_blocks * 2)]
+    for block_id in block_ids[::2]:
+        allocator.free(block_id)
+    return block_ids[1::2]
+
+
+def churn(allocator: BlockAllocator, block_ids: list[int], operations: int, seed: int):
+    rng = random.Random(seed)
+    start_time = time.perf_counter()
+    for _ in range(operations):
+        index = rng.randrange(len(block_ids))
+        allocator.free(block_ids[index])
+        block_ids[index] = allocator.allocate(rng.randint(1, 8))
+    return (time.perf_counter() - start_time) / operations
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Time BlockAllocator free/allocate pairs against a fragmented heap"
+    )
+    parser.add_argument(
+        "--live-blocks", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--operations", type=int, default=10_000)
+    parser.add_argument("--fit", choices=["best", "first"], default="first")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    for live_blocks in args.live_blocks:
+        allocator = BlockAllocator(fit=args.fit)
+        start_time = time.perf_counter()
+        block_ids = fill(allocator, live_blocks, args.seed)
+        fill_time = time.perf_counter() - start_time
+        per_operation = churn(allocator, block_ids, args.operations, args.seed)
+        print(
+            f"{live_blocks:>8} live blocks: "
+            f"fill {fill_time:8.3f}s, "
+            f"free+allocate {per_operation * 1e6:10.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
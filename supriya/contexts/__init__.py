@@ -13,21 +13,58 @@ from .entities import (
     Node,
     Synth,
 )
+from .latency import LatencyChange, LatencyController
+from .manifests import BootManifest, ManifestResources
+from .monitors import (
+    BusMonitor,
+    LateMonitor,
+    ReplyStream,
+    ScopeMonitor,
+    ServerTelemetry,
+    TelemetrySample,
+)
 from .nonrealtime import Score
+from .pools import (
+    AsyncBufferPool,
+    AsyncServerPool,
+    BufferPool,
+    ServerPool,
+    Voice,
+    VoicePool,
+)
 from .realtime import AsyncServer, BaseServer, Server
+from .streams import ControlStream, ControlStreamFlusher
 
 __all__ = [
+    "AsyncBufferPool",
     "AsyncServer",
+    "AsyncServerPool",
     "BaseServer",
+    "BootManifest",
     "Buffer",
     "BufferGroup",
+    "BufferPool",
     "Bus",
     "BusGroup",
+    "BusMonitor",
     "Context",
     "ContextObject",
+    "ControlStream",
+    "ControlStreamFlusher",
     "Group",
+    "LateMonitor",
+    "LatencyChange",
+    "LatencyController",
+    "ManifestResources",
     "Node",
+    "ReplyStream",
     "Score",
+    "ScopeMonitor",
     "Server",
+    "ServerPool",
+    "ServerTelemetry",
     "Synth",
+    "TelemetrySample",
+    "Voice",
+    "VoicePool",
 ]
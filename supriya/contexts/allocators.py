@@ -1,21 +1,178 @@
+import bisect
 import dataclasses
 import threading
-from typing import Optional, Set
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+# Size class reserved for the unbounded block at the top of an unbounded heap
+UNBOUNDED_SIZE_CLASS = 64
+
+
+class SortedList:
+    """
+    A sorted list stored as a list of bounded chunks.
+
+    Searches bisect the chunk maxima and then a single chunk, and inserts and
+    removals only shift one chunk, so large lists stay cheap to update.
+
+    ::
+
+        >>> from supriya.contexts.allocators import SortedList
+        >>> sorted_list = SortedList()
+        >>> for x in [5, 1, 9, 3]:
+        ...     sorted_list.add(x)
+        ...
+        >>> sorted_list.floor(4), sorted_list.ceiling(4), sorted_list.first()
+        (3, 5, 1)
 
-from ..utils import Interval, IntervalTree
+    ::
+
+        >>> sorted_list.remove(5)
+        >>> sorted_list.ceiling(4), len(sorted_list)
+        (9, 3)
+    """
+
+    ### CLASS VARIABLES ###
+
+    _chunk_size = 512
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._chunks: List[List[Any]] = []
+        self._length = 0
+        self._maxima: List[Any] = []
+
+    ### SPECIAL METHODS ###
+
+    def __bool__(self) -> bool:
+        return bool(self._length)
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __len__(self) -> int:
+        return self._length
+
+    ### PUBLIC METHODS ###
+
+    def add(self, value: Any) -> None:
+        self._length += 1
+        if not self._chunks:
+            self._chunks.append([value])
+            self._maxima.append(value)
+            return
+        index = bisect.bisect_left(self._maxima, value)
+        if index == len(self._maxima):
+            index -= 1
+            chunk = self._chunks[index]
+            chunk.append(value)
+            self._maxima[index] = value
+        else:
+            chunk = self._chunks[index]
+            bisect.insort(chunk, value)
+        if len(chunk) > self._chunk_size * 2:
+            half = self._chunk_size
+            self._chunks[index : index + 1] = [chunk[:half], chunk[half:]]
+            self._maxima[index : index + 1] = [chunk[half - 1], chunk[-1]]
+
+    def ceiling(self, value: Any) -> Any:
+        """
+        Get the smallest item greater than or equal to ``value``, or ``None``.
+        """
+        index = bisect.bisect_left(self._maxima, value)
+        if index == len(self._maxima):
+            return None
+        chunk = self._chunks[index]
+        return chunk[bisect.bisect_left(chunk, value)]
+
+    def first(self) -> Any:
+        """
+        Get the smallest item, or ``None``.
+        """
+        return self._chunks[0][0] if self._chunks else None
+
+    def floor(self, value: Any) -> Any:
+        """
+        Get the largest item less than or equal to ``value``, or ``None``.
+        """
+        index = bisect.bisect_left(self._maxima, value)
+        if index < len(self._maxima):
+            chunk = self._chunks[index]
+            position = bisect.bisect_right(chunk, value) - 1
+            if position >= 0:
+                return chunk[position]
+        return self._maxima[index - 1] if index else None
+
+    def last(self) -> Any:
+        """
+        Get the largest item, or ``None``.
+        """
+        return self._maxima[-1] if self._maxima else None
+
+    def remove(self, value: Any) -> None:
+        index = bisect.bisect_left(self._maxima, value)
+        if index == len(self._maxima):
+            raise ValueError(value)
+        chunk = self._chunks[index]
+        position = bisect.bisect_left(chunk, value)
+        if chunk[position] != value:
+            raise ValueError(value)
+        del chunk[position]
+        self._length -= 1
+        if not chunk:
+            del self._chunks[index]
+            del self._maxima[index]
+        elif position == len(chunk):
+            self._maxima[index] = chunk[-1]
 
 
 @dataclasses.dataclass(frozen=True)
-class Block(Interval):
-    start_offset: float = float("-inf")
-    stop_offset: float = float("inf")
-    used: bool = False
+class BlockAllocatorStats:
+    """
+    A snapshot of a block allocator's occupancy.
+
+    :param live_block_count: The number of allocated blocks.
+    :param used_size: The total size of all allocated blocks.
+    :param free_block_count: The number of bounded free blocks.
+    :param free_size: The total size of all bounded free blocks.
+    :param largest_free_block_size: The size of the largest bounded free block.
+    :param fragmentation: The share of bounded free space outside the largest
+        bounded free block, from ``0.0`` (one contiguous hole) towards ``1.0``.
+    :param failure_count: The number of allocations which found no fitting block.
+    :param unbounded: Whether the heap also ends in an unbounded free block.
+    """
+
+    live_block_count: int
+    used_size: int
+    free_block_count: int
+    free_size: int
+    largest_free_block_size: int
+    fragmentation: float
+    failure_count: int
+    unbounded: bool
 
 
 class BlockAllocator:
     """
     A block allocator.
 
+    Free blocks are kept in segregated lists by power-of-two size class, each
+    sorted by size then start, alongside a sorted index of block starts.
+    Allocation searches only the size classes which can satisfy the request,
+    and freeing coalesces with adjacent free blocks.
+
     ::
 
         >>> from supriya.contexts.allocators import BlockAllocator
@@ -48,24 +205,51 @@ class BlockAllocator:
         >>> allocator.free(8)
         >>> allocator.allocate(8)
         8
+
+    :param heap_maximum: The exclusive upper bound of allocatable indices, or
+        ``None`` for an unbounded heap.
+    :param heap_minimum: The inclusive lower bound of allocatable indices.
+    :param fit: The placement policy. ``"first"`` picks the lowest-addressed free
+        block which fits. ``"best"`` picks the smallest free block which fits,
+        lowest start first among equals.
     """
 
     ### INITIALIZER ###
 
     def __init__(
-        self, heap_maximum: Optional[int] = None, heap_minimum: int = 0
+        self,
+        heap_maximum: Optional[int] = None,
+        heap_minimum: int = 0,
+        fit: Literal["best", "first"] = "first",
     ) -> None:
-        self._free_heap = IntervalTree(accelerated=True)
+        if fit not in ("best", "first"):
+            raise ValueError(fit)
+        self._failure_count = 0
+        self._fit = fit
+        self._free_block_count = 0
+        self._free_size = 0
         self._heap_maximum = heap_maximum
         self._heap_minimum = heap_minimum
         self._lock = threading.Lock()
-        self._used_heap = IntervalTree(accelerated=True)
-        free_block = Block(
-            start_offset=heap_minimum,
-            stop_offset=heap_maximum or float("inf"),
-            used=False,
-        )
-        self._free_heap.add(free_block)
+        # start -> stop, for free and used blocks respectively
+        self._free_blocks: Dict[int, Union[int, float]] = {}
+        self._used_blocks: Dict[int, int] = {}
+        self._used_size = 0
+        # stop -> start for free blocks, for coalescing with a preceding block
+        self._free_stops: Dict[Union[int, float], int] = {}
+        # sorted starts, for finding the block containing an index
+        self._free_starts = SortedList()
+        self._used_starts = SortedList()
+        # segregated free lists of (size, start), sorted, indexed by size class
+        self._size_classes = [SortedList() for _ in range(UNBOUNDED_SIZE_CLASS + 1)]
+        # the same free lists as sorted starts, for first fit
+        self._size_class_starts = [
+            SortedList() for _ in range(UNBOUNDED_SIZE_CLASS + 1)
+        ]
+        if heap_maximum is None:
+            self._add_free_block(heap_minimum, float("inf"))
+        elif heap_minimum < heap_maximum:
+            self._add_free_block(heap_minimum, heap_maximum)
 
     ### SPECIAL METHODS ###
 
@@ -78,101 +262,259 @@ class BlockAllocator:
         self.__dict__.update(state)
         self._lock = threading.Lock()
 
+    ### PRIVATE METHODS ###
+
+    def _add_free_block(self, start: int, stop: Union[int, float]) -> None:
+        size = stop - start
+        if size != float("inf"):
+            self._free_block_count += 1
+            self._free_size += int(size)
+        self._free_blocks[start] = stop
+        self._free_stops[stop] = start
+        self._free_starts.add(start)
+        size_class = self._get_size_class(size)
+        self._size_classes[size_class].add((size, start))
+        self._size_class_starts[size_class].add(start)
+
+    def _add_used_block(self, start: int, stop: int) -> None:
+        self._used_blocks[start] = stop
+        self._used_size += stop - start
+        self._used_starts.add(start)
+
+    def _find_free_block(self, size: int) -> Optional[int]:
+        size_class = self._get_size_class(size)
+        if self._fit == "first":
+            # every block in a class whose minimum size covers the request fits
+            first_class = size_class if (1 << size_class) >= size else size_class + 1
+            candidates = [
+                starts.first()
+                for starts in self._size_class_starts[first_class:]
+                if starts
+            ]
+            first_fit = min(candidates) if candidates else None
+            # the request's own class may hold smaller blocks at lower addresses
+            if first_class != size_class:
+                for start in self._size_class_starts[size_class]:
+                    if first_fit is not None and first_fit < start:
+                        break
+                    if start + size <= self._free_blocks[start]:
+                        return start
+            return first_fit
+        # the request's own class may hold blocks smaller than the request
+        best_fit = self._size_classes[size_class].ceiling((size, float("-inf")))
+        if best_fit is not None:
+            return best_fit[1]
+        for bucket in self._size_classes[size_class + 1 :]:
+            if bucket:
+                return bucket.first()[1]
+        return None
+
+    def _free_range(self, start: int, stop: Union[int, float]) -> None:
+        # coalesce with free neighbours on either side
+        if (previous_start := self._free_stops.get(start)) is not None:
+            self._remove_free_block(previous_start)
+            start = previous_start
+        if stop in self._free_blocks:
+            stop = self._remove_free_block(stop)
+        self._add_free_block(start, stop)
+
+    def _get_size_class(self, size: Union[int, float]) -> int:
+        if size == float("inf"):
+            return UNBOUNDED_SIZE_CLASS
+        return min(int(size).bit_length() - 1, UNBOUNDED_SIZE_CLASS - 1)
+
+    def _remove_free_block(self, start: int) -> Union[int, float]:
+        stop = self._free_blocks.pop(start)
+        size = stop - start
+        if size != float("inf"):
+            self._free_block_count -= 1
+            self._free_size -= int(size)
+        del self._free_stops[stop]
+        self._free_starts.remove(start)
+        size_class = self._get_size_class(size)
+        self._size_classes[size_class].remove((size, start))
+        self._size_class_starts[size_class].remove(start)
+        return stop
+
+    def _remove_used_block(self, start: int) -> int:
+        stop = self._used_blocks.pop(start)
+        self._used_size -= stop - start
+        self._used_starts.remove(start)
+        return stop
+
     ### PUBLIC METHODS ###
 
     def allocate(self, desired_block_size: int = 1) -> Optional[int]:
         desired_block_size = int(desired_block_size)
         assert 0 < desired_block_size
-        block_id = None
         with self._lock:
-            free_block = None
-            for block in self._free_heap:
-                if desired_block_size <= block.duration:
-                    free_block = block
-                    break
-            if free_block is not None:
-                split_offset = free_block.start_offset + desired_block_size
-                self._free_heap.remove(free_block)
-                if desired_block_size < free_block.duration:
-                    new_free_block = dataclasses.replace(
-                        free_block, start_offset=split_offset, used=False
-                    )
-                    self._free_heap.add(new_free_block)
-                    used_block = dataclasses.replace(
-                        free_block, stop_offset=split_offset, used=True
-                    )
-                else:
-                    used_block = dataclasses.replace(free_block, used=True)
-                self._used_heap.add(used_block)
-                block_id = used_block.start_offset
-        return int(block_id) if block_id is not None else None
+            if (start := self._find_free_block(desired_block_size)) is None:
+                self._failure_count += 1
+                return None
+            stop = self._remove_free_block(start)
+            split_offset = start + desired_block_size
+            if split_offset < stop:
+                self._add_free_block(split_offset, stop)
+            self._add_used_block(start, split_offset)
+        return start
 
     def allocate_at(self, index: int, desired_block_size: int = 1) -> Optional[int]:
         index = int(index)
         desired_block_size = int(desired_block_size)
-        block_id = None
+        start_offset = index
+        stop_offset = index + desired_block_size
         with self._lock:
-            start_offset = index
-            stop_offset = index + desired_block_size
-            start_cursor = self._free_heap.get_moment_at(start_offset)
-            starting_blocks = sorted(
-                start_cursor.start_intervals + start_cursor.overlap_intervals
-            )
-            stop_cursor = self._free_heap.get_moment_at(stop_offset)
-            stop_blocks = sorted(
-                stop_cursor.overlap_intervals + stop_cursor.stop_intervals
-            )
-            if starting_blocks == stop_blocks:
-                if len(starting_blocks) == 0:
-                    return None
-                assert len(starting_blocks) == 1
-                free_block = starting_blocks[0]
-                used_block = Block(
-                    start_offset=start_offset, stop_offset=stop_offset, used=True
-                )
-                self._used_heap.add(used_block)
-                self._free_heap.remove(free_block)
-                free_blocks = free_block - used_block
-                for free_block in free_blocks:
-                    self._free_heap.add(free_block)
-                block_id = index
-        if block_id is None:
-            return block_id
-        return int(block_id)
+            if (start := self._free_starts.floor(start_offset)) is None or (
+                self._free_blocks[start] < stop_offset
+            ):
+                self._failure_count += 1
+                return None
+            stop = self._remove_free_block(start)
+            if start < start_offset:
+                self._add_free_block(start, start_offset)
+            if stop_offset < stop:
+                self._add_free_block(stop_offset, stop)
+            self._add_used_block(start_offset, stop_offset)
+        return index
 
     def free(self, block_id: int) -> None:
         block_id = int(block_id)
         with self._lock:
-            cursor = self._used_heap.get_moment_at(block_id)
-            blocks = sorted(
-                set(cursor.start_intervals) or set(cursor.overlap_intervals)
-            )
-            if len(blocks) == 0:
+            if (start_offset := self._used_starts.floor(block_id)) is None:
                 return None
-            assert len(blocks) == 1
-            used_block = blocks[0]
-            self._used_heap.remove(used_block)
-            start_offset = used_block.start_offset
-            stopping_blocks = self._free_heap.find_intervals_stopping_at(start_offset)
-            if stopping_blocks:
-                assert len(stopping_blocks) == 1
-                stopping_block = stopping_blocks[0]
-                self._free_heap.remove(stopping_block)
-                start_offset = stopping_block.start_offset
-            stop_offset = used_block.stop_offset
-            starting_blocks = self._free_heap.find_intervals_starting_at(stop_offset)
-            if starting_blocks:
-                assert len(starting_blocks) == 1
-                starting_block = starting_blocks[0]
-                self._free_heap.remove(starting_block)
-                stop_offset = starting_block.stop_offset
-            free_block = Block(
-                start_offset=start_offset, stop_offset=stop_offset, used=False
+            if self._used_blocks[start_offset] <= block_id:
+                return None
+            self._free_range(start_offset, self._remove_used_block(start_offset))
+
+    def plan_compaction(self) -> List[Tuple[int, int, int]]:
+        """
+        Suggest relocations which would defragment the heap.
+
+        Walks allocated blocks from the top of the heap down, moving each into the
+        best-fitting hole below it, if any. The allocator itself is unchanged:
+        applying a move means allocating the destination, moving whatever the
+        block holds (e.g. copying bus values and re-mapping synth controls), and
+        freeing the source.
+
+        ::
+
+            >>> allocator = BlockAllocator(heap_maximum=16)
+            >>> [allocator.allocate(size) for size in (2, 4, 2, 4)]
+            [0, 2, 6, 8]
+            >>> allocator.free(2)
+            >>> allocator.plan_compaction()
+            [(8, 2, 4)]
+
+        Returns a list of ``(source, destination, size)`` triples.
+        """
+        with self._lock:
+            used_blocks = sorted(self._used_blocks.items())
+        simulation = BlockAllocator(
+            heap_maximum=self._heap_maximum,
+            heap_minimum=self._heap_minimum,
+            fit="best",
+        )
+        for start, stop in used_blocks:
+            simulation.allocate_at(start, stop - start)
+        moves: List[Tuple[int, int, int]] = []
+        for start, stop in reversed(used_blocks):
+            size = stop - start
+            simulation.free(start)
+            destination = cast(int, simulation.allocate(size))
+            if destination < start:
+                moves.append((start, destination, size))
+            elif destination != start:
+                simulation.free(destination)
+                simulation.allocate_at(start, size)
+        return moves
+
+    def split(self, block_id: int, blocks: Sequence[Tuple[int, int]]) -> None:
+        """
+        Split a used block into smaller used blocks, freeing everything else.
+
+        Lets a caller reserve one large block, hand out pieces of it without
+        locking, and then settle the reservation in a single operation.
+
+        ::
+
+            >>> allocator = BlockAllocator(heap_maximum=16)
+            >>> allocator.allocate(8)
+            0
+            >>> allocator.split(0, [(0, 2), (4, 1)])
+            >>> allocator.allocate(2), allocator.allocate(3)
+            (2, 5)
+
+        :param block_id: The start of the used block to split.
+        :param blocks: The ``(start, size)`` pairs to keep, which must lie within
+            the used block and not overlap.
+        """
+        block_id = int(block_id)
+        with self._lock:
+            if (stop_offset := self._used_blocks.get(block_id)) is None:
+                raise ValueError(block_id)
+            cursor = block_id
+            for start, size in sorted(blocks):
+                if start < cursor or stop_offset < start + size or size < 1:
+                    raise ValueError(blocks)
+                cursor = start + size
+            self._remove_used_block(block_id)
+            cursor = block_id
+            for start, size in sorted(blocks):
+                if cursor < start:
+                    self._free_range(cursor, start)
+                self._add_used_block(start, start + size)
+                cursor = start + size
+            if cursor < stop_offset:
+                self._free_range(cursor, stop_offset)
+
+    def stats(self) -> BlockAllocatorStats:
+        """
+        Get a snapshot of the allocator's occupancy.
+
+        All counters are maintained incrementally, so this is constant-time.
+
+        ::
+
+            >>> allocator = BlockAllocator(heap_maximum=16)
+            >>> [allocator.allocate(4) for _ in range(4)]
+            [0, 4, 8, 12]
+            >>> allocator.free(4)
+            >>> allocator.free(12)
+            >>> allocator.allocate(8) is None
+            True
+            >>> allocator.stats()
+            BlockAllocatorStats(live_block_count=2, used_size=8, free_block_count=2, free_size=8, largest_free_block_size=4, fragmentation=0.5, failure_count=1, unbounded=False)
+        """
+        with self._lock:
+            largest_free_block_size = 0
+            for bucket in reversed(self._size_classes[:UNBOUNDED_SIZE_CLASS]):
+                if bucket:
+                    largest_free_block_size = int(bucket.last()[0])
+                    break
+            return BlockAllocatorStats(
+                live_block_count=len(self._used_blocks),
+                used_size=self._used_size,
+                free_block_count=self._free_block_count,
+                free_size=self._free_size,
+                largest_free_block_size=largest_free_block_size,
+                fragmentation=(
+                    1 - largest_free_block_size / self._free_size
+                    if self._free_size
+                    else 0.0
+                ),
+                failure_count=self._failure_count,
+                unbounded=bool(self._size_classes[UNBOUNDED_SIZE_CLASS]),
             )
-            self._free_heap.add(free_block)
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def fit(self) -> str:
+        """
+        Placement policy.
+        """
+        return self._fit
+
     @property
     def heap_maximum(self) -> Optional[int]:
         """
@@ -220,16 +562,39 @@ class NodeIdAllocator:
 
         >>> allocator.allocate_permanent_node_id()
         2
+
+    Temporary node IDs wrap around within their range:
+
+    ::
+
+        >>> allocator = NodeIdAllocator(maximum_node_id=1001)
+        >>> [allocator.allocate_node_id() for _ in range(3)]
+        [1000, 1001, 1000]
+
+    Blocks of IDs which would run past the end of the range restart at its start:
+
+    ::
+
+        >>> allocator = NodeIdAllocator(maximum_node_id=1009)
+        >>> [allocator.allocate_node_id(4) for _ in range(4)]
+        [1000, 1004, 1000, 1004]
     """
 
     ### INITIALIZER ###
 
     def __init__(
-        self, client_id: int = 0, initial_node_id: int = 1000, locked=True
+        self,
+        client_id: int = 0,
+        initial_node_id: int = 1000,
+        locked=True,
+        maximum_node_id: int = 0x03FFFFFF,
     ) -> None:
         if client_id > 31:
             raise ValueError
+        if not initial_node_id < maximum_node_id <= 0x03FFFFFF:
+            raise ValueError(maximum_node_id)
         self._initial_node_id = initial_node_id
+        self._maximum_node_id = maximum_node_id
         self._client_id = client_id
         self._mask = self._client_id << 26
         self._temp = self._initial_node_id
@@ -254,11 +619,16 @@ class NodeIdAllocator:
         return self.allocate_node_id(count)
 
     def allocate_node_id(self, count: int = 1) -> int:
+        if count > self._maximum_node_id + 1 - self._initial_node_id:
+            raise ValueError(count)
         with self._lock:
             x = self._temp
+            # restart blocks which would run past the range, keeping them contiguous
+            if self._maximum_node_id < x + count - 1:
+                x = self._initial_node_id
             temp = x + count
-            if 0x03FFFFFF < temp:
-                temp = (temp % 0x03FFFFFF) + self._initial_node_id
+            if self._maximum_node_id < temp:
+                temp = self._initial_node_id
             self._temp = temp
             x = x | self._mask
             return x
@@ -278,6 +648,31 @@ class NodeIdAllocator:
         if node_id < self._initial_node_id:
             self.free_permanent_node_id(node_id)
 
+    def free_node_ids(self, node_id: int, count: int = 1) -> bool:
+        """
+        Return a contiguous range of temporary node IDs to the allocator.
+
+        Temporary node IDs are handed out by a rolling counter, so the range can
+        only be returned if nothing has been allocated since. Returns whether the
+        range was returned.
+
+        ::
+
+            >>> allocator = NodeIdAllocator()
+            >>> allocator.allocate_node_id(count=8)
+            1000
+            >>> allocator.free_node_ids(1004, 4)
+            True
+            >>> allocator.allocate_node_id()
+            1004
+        """
+        with self._lock:
+            node_id = node_id & 0x03FFFFFF
+            if node_id + count != self._temp:
+                return False
+            self._temp = node_id
+            return True
+
     def free_permanent_node_id(self, node_id: int) -> None:
         with self._lock:
             node_id = node_id & 0x03FFFFFF
@@ -6,6 +6,7 @@ Context subclasses expose a common interface for realtime and non-realtime synth
 
 import abc
 import contextlib
+import contextvars
 import dataclasses
 import itertools
 import shlex
@@ -15,6 +16,7 @@ from typing import (
     Callable,
     Dict,
     List,
+    NamedTuple,
     Optional,
     Sequence,
     SupportsFloat,
@@ -56,6 +58,7 @@ from .entities import (
 )
 from .errors import AllocationError, ContextError, InvalidCalculationRate, MomentClosed
 from .requests import (
+    BUFFER_TRANSFER_CHUNK_SIZE,
     AllocateBuffer,
     AllocateReadBuffer,
     AllocateReadBufferChannel,
@@ -101,6 +104,134 @@ from .requests import (
     ZeroBuffer,
 )
 
+_AllocationKey = Tuple[Type[ContextObject], Optional[CalculationRate]]
+
+
+class AllocationBatch:
+    """
+    A context manager reserving IDs up front for building many objects at once.
+
+    Entering the batch reserves all requested IDs in one pass. Nodes, buses and
+    buffers added in the same thread or task while the batch is active draw from
+    the reservation without touching the context's allocators, falling back to
+    them once a reservation runs out. Exiting the batch, normally or via an exception,
+    returns every reserved ID which was not handed out.
+
+    :param context: The batch's context.
+    :param nodes: The number of temporary node IDs to reserve.
+    :param audio_buses: The number of contiguous audio bus IDs to reserve.
+    :param control_buses: The number of contiguous control bus IDs to reserve.
+    :param buffers: The number of contiguous buffer IDs to reserve.
+    """
+
+    def __init__(
+        self,
+        context: "Context",
+        nodes: int = 0,
+        audio_buses: int = 0,
+        control_buses: int = 0,
+        buffers: int = 0,
+    ) -> None:
+        self.context = context
+        self.counts: Dict[_AllocationKey, int] = {
+            (Node, None): nodes,
+            (Bus, CalculationRate.AUDIO): audio_buses,
+            (Bus, CalculationRate.CONTROL): control_buses,
+            (Buffer, None): buffers,
+        }
+        # key -> [start, cursor, stop]
+        self.ranges: Dict[_AllocationKey, List[int]] = {}
+        # key -> {start: size} of blocks handed out and not yet freed
+        self.blocks: Dict[_AllocationKey, Dict[int, int]] = {}
+
+    def __enter__(self) -> "AllocationBatch":
+        """
+        Reserve this batch's IDs and make it the current allocation batch.
+        """
+        if self.ranges:
+            raise ContextError("Allocation batch already entered")
+        with self.context._allocation_lock:
+            try:
+                for (type_, calculation_rate), count in self.counts.items():
+                    if count < 1:
+                        continue
+                    if type_ is Node:
+                        start = self.context._node_id_allocator.allocate_node_id(count)
+                    else:
+                        allocator = self.context._get_allocator(type_, calculation_rate)
+                        if (start := allocator.allocate(count)) is None:
+                            raise AllocationError(type_, calculation_rate, count)
+                    self.ranges[type_, calculation_rate] = [start, start, start + count]
+                    self.blocks[type_, calculation_rate] = {}
+            except Exception:
+                self._release()
+                raise
+            self.context._allocation_batches.append(self)
+        self.context._push_allocation_batch(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Unset this batch as the current allocation batch and return unused IDs.
+        """
+        self.context._pop_allocation_batch()
+        with self.context._allocation_lock:
+            self.context._allocation_batches.remove(self)
+            self._release()
+
+    def _allocate(
+        self,
+        type_: Type[ContextObject],
+        calculation_rate: Optional[CalculationRate],
+        count: int,
+    ) -> Optional[int]:
+        if (range_ := self.ranges.get((type_, calculation_rate))) is None:
+            return None
+        start, cursor, stop = range_
+        if stop < cursor + count:
+            return None
+        range_[1] = cursor + count
+        self.blocks[type_, calculation_rate][cursor] = count
+        return cursor
+
+    def _free(
+        self,
+        type_: Type[ContextObject],
+        calculation_rate: Optional[CalculationRate],
+        id_: int,
+    ) -> bool:
+        if (range_ := self.ranges.get((type_, calculation_rate))) is None:
+            return False
+        if not range_[0] <= id_ < range_[2]:
+            return False
+        blocks = self.blocks[type_, calculation_rate]
+        # free by any index inside a handed-out block, as BlockAllocator.free() does
+        for start, size in blocks.items():
+            if start <= id_ < start + size:
+                del blocks[start]
+                return True
+        # the reservation is still one allocator block, so it must not be freed
+        raise ValueError(id_)
+
+    def _release(self) -> None:
+        for (type_, calculation_rate), (start, cursor, stop) in self.ranges.items():
+            if type_ is Node:
+                self.context._node_id_allocator.free_node_ids(cursor, stop - cursor)
+            else:
+                allocator = self.context._get_allocator(type_, calculation_rate)
+                cast(BlockAllocator, allocator).split(
+                    start, sorted(self.blocks[type_, calculation_rate].items())
+                )
+        self.ranges.clear()
+        self.blocks.clear()
+
+    @property
+    def remaining(self) -> Dict[_AllocationKey, int]:
+        """
+        Get the number of reserved IDs not yet handed out, keyed by type and rate.
+        """
+        return {key: stop - cursor for key, (_, cursor, stop) in self.ranges.items()}
+
 
 @dataclasses.dataclass
 class Moment:
@@ -195,6 +326,25 @@ class Completion:
         self.context._pop_completion()
 
 
+class RequestScope(NamedTuple):
+    """
+    The allocation batches, completions and moments open in one thread or task.
+
+    Immutable, so that asyncio tasks which inherit a scope never share updates.
+    """
+
+    allocation_batches: Tuple[AllocationBatch, ...] = ()
+    completions: Tuple[Completion, ...] = ()
+    moments: Tuple[Moment, ...] = ()
+
+
+# The request scopes open in the current thread or task, keyed by context ID. The
+# mapping is replaced rather than mutated, and contexts' empty scopes are dropped.
+_request_scopes: contextvars.ContextVar[Dict[int, RequestScope]] = (
+    contextvars.ContextVar("request_scopes", default={})
+)
+
+
 class Context(metaclass=abc.ABCMeta):
     """
     A synthesis execution context.
@@ -211,27 +361,29 @@ class Context(metaclass=abc.ABCMeta):
         name: Optional[str] = None,
         **kwargs,
     ) -> None:
+        self._allocation_batches: List[AllocationBatch] = []
+        self._allocation_lock = threading.Lock()
         self._audio_bus_allocator = BlockAllocator()
         self._boot_status = BootStatus.OFFLINE
         self._buffer_allocator = BlockAllocator()
         self._client_id = 0
         self._control_bus_allocator = BlockAllocator()
         self._latency = 0.0
-        self._lock = threading.RLock()
         self._name = name
+        self._node_control_cache: Dict[int, Dict[str, object]] = {}
         self._node_id_allocator = NodeIdAllocator()
         self._options = new(options or Options(), **kwargs)
         self._sync_id = self._sync_id_minimum = 0
+        self._sync_id_lock = threading.Lock()
         self._sync_id_maximum = 32 << 26
-        self._thread_local = threading.local()
         self._setup_allocators()
 
     ### SPECIAL METHODS ###
 
     def __getstate__(self):
         state = self.__dict__.copy()
-        del state["_lock"]
-        del state["_thread_local"]
+        del state["_allocation_lock"]
+        del state["_sync_id_lock"]
         return state
 
     def __repr__(self) -> str:
@@ -239,8 +391,8 @@ class Context(metaclass=abc.ABCMeta):
 
     def __setstate__(self, state):
         self.__dict__.update(state)
-        self._lock = threading.RLock()
-        self._thread_local = threading.local()
+        self._allocation_lock = threading.Lock()
+        self._sync_id_lock = threading.Lock()
 
     ### PRIVATE METHODS ###
 
@@ -277,6 +429,10 @@ class Context(metaclass=abc.ABCMeta):
         permanent: bool = False,
     ) -> int:
         id_: Optional[int] = None
+        if (batch := self._get_allocation_batch()) is not None and not permanent:
+            rate = calculation_rate if type_ is Bus else None
+            if (id_ := batch._allocate(type_, rate, count)) is not None:
+                return id_
         if type_ is Node:
             if permanent:
                 id_ = self._node_id_allocator.allocate_permanent_node_id()
@@ -312,6 +468,18 @@ class Context(metaclass=abc.ABCMeta):
             requests.extend(key.merge(list(group)))
         return requests
 
+    def _free_batched_id(
+        self,
+        type_: Type[ContextObject],
+        id_: int,
+        calculation_rate: Optional[CalculationRate] = None,
+    ) -> bool:
+        rate = calculation_rate if type_ is Bus else None
+        with self._allocation_lock:
+            return any(
+                batch._free(type_, rate, id_) for batch in self._allocation_batches
+            )
+
     @abc.abstractmethod
     def _free_id(
         self,
@@ -321,6 +489,12 @@ class Context(metaclass=abc.ABCMeta):
     ) -> None:
         raise NotImplementedError
 
+    def _get_allocation_batch(self) -> Optional[AllocationBatch]:
+        batches = self._get_request_scope().allocation_batches
+        if not batches:
+            return None
+        return batches[-1]
+
     def _get_allocator(
         self,
         type_: Type[ContextObject],
@@ -338,13 +512,13 @@ class Context(metaclass=abc.ABCMeta):
         raise ValueError
 
     def _get_moment(self) -> Optional[Moment]:
-        moments = self._thread_local.__dict__.get("moments", [])
+        moments = self._get_request_scope().moments
         if not moments:
             return None
         return moments[-1]
 
     def _get_next_sync_id(self) -> int:
-        with self._lock:
+        with self._sync_id_lock:
             sync_id = self._sync_id
             self._sync_id += 1
             if self._sync_id > self._sync_id_maximum:
@@ -352,30 +526,70 @@ class Context(metaclass=abc.ABCMeta):
             return sync_id
 
     def _get_request_context(self) -> Optional[Union[Completion, Moment]]:
-        moments = self._thread_local.__dict__.get("moments", [])
-        completions = self._thread_local.__dict__.get("completions", [])
+        _, completions, moments = self._get_request_scope()
         if completions:
             return completions[-1]
         if moments:
             return moments[-1]
         return None
 
+    def _get_request_scope(self) -> RequestScope:
+        scope = _request_scopes.get().get(id(self), RequestScope())
+        # tasks copy the scope they were created in, including moments which the
+        # creating task may since have closed and sent
+        if any(moment.closed for moment in scope.moments):
+            scope = scope._replace(
+                completions=tuple(
+                    completion
+                    for completion in scope.completions
+                    if not completion.moment.closed
+                ),
+                moments=tuple(moment for moment in scope.moments if not moment.closed),
+            )
+        return scope
+
+    def _pop_allocation_batch(self) -> None:
+        scope = self._get_request_scope()
+        self._set_request_scope(
+            scope._replace(allocation_batches=scope.allocation_batches[:-1])
+        )
+
     def _pop_completion(self) -> None:
-        self._thread_local.__dict__.setdefault("completions", []).pop()
+        scope = self._get_request_scope()
+        self._set_request_scope(scope._replace(completions=scope.completions[:-1]))
 
     def _pop_moment(self) -> None:
-        self._thread_local.__dict__.setdefault("moments", []).pop()
+        scope = self._get_request_scope()
+        self._set_request_scope(scope._replace(moments=scope.moments[:-1]))
+
+    def _push_allocation_batch(self, batch: AllocationBatch) -> None:
+        scope = self._get_request_scope()
+        self._set_request_scope(
+            scope._replace(allocation_batches=scope.allocation_batches + (batch,))
+        )
 
     def _push_completion(self, completion: Completion) -> None:
-        self._thread_local.__dict__.setdefault("completions", []).append(completion)
+        scope = self._get_request_scope()
+        self._set_request_scope(
+            scope._replace(completions=scope.completions + (completion,))
+        )
 
     def _push_moment(self, moment: Moment) -> None:
-        self._thread_local.__dict__.setdefault("moments", []).append(moment)
+        scope = self._get_request_scope()
+        self._set_request_scope(scope._replace(moments=scope.moments + (moment,)))
 
     @abc.abstractmethod
     def _resolve_node(self, node: Union[Node, SupportsInt, None]) -> int:
         raise NotImplementedError
 
+    def _set_request_scope(self, scope: RequestScope) -> None:
+        scopes = dict(_request_scopes.get())
+        if any(scope):
+            scopes[id(self)] = scope
+        else:
+            scopes.pop(id(self), None)
+        _request_scopes.set(scopes)
+
     def _setup_allocators(self) -> None:
         # audio buses
         audio_bus_minimum, audio_bus_maximum = self.options.get_audio_bus_ids(
@@ -398,7 +612,9 @@ class Context(metaclass=abc.ABCMeta):
         )
         # node IDs
         self._node_id_allocator = NodeIdAllocator(
-            initial_node_id=self.options.initial_node_id, client_id=self.client_id
+            initial_node_id=self.options.initial_node_id,
+            client_id=self.client_id,
+            maximum_node_id=self.options.maximum_node_id,
         )
         # sync IDs
         self._sync_id_minimum, self._sync_id_maximum = self.options.get_sync_ids(
@@ -582,6 +798,7 @@ class Context(metaclass=abc.ABCMeta):
                 raise ValueError(add_action_)
         target_node_id = self._resolve_node(target_node)
         id_ = self._allocate_id(Node, permanent=permanent)
+        self._node_control_cache.pop(id_, None)
         items = [(id_, add_action_, target_node_id)]
         if parallel:
             request: Request = NewParallelGroup(items=items)
@@ -597,6 +814,7 @@ class Context(metaclass=abc.ABCMeta):
         add_action: AddActionLike = AddAction.ADD_TO_HEAD,
         target_node: Optional[SupportsInt] = None,
         permanent: bool = False,
+        use_control_indices: bool = False,
         **settings,
     ) -> Synth:
         """
@@ -608,6 +826,8 @@ class Context(metaclass=abc.ABCMeta):
         :param add_action: The :term:`add action` to use when placing the new synth.
         :param target_node: The node to place the new synth relative to.
         :param permanent: Flag for using a permanent node ID.
+        :param use_control_indices: Flag for addressing controls by index rather
+            than by name, producing smaller datagrams.
         :param settings: The new synth's control settings.
         """
         self._validate_can_request()
@@ -619,19 +839,19 @@ class Context(metaclass=abc.ABCMeta):
         synthdef_kwargs: Dict[
             Union[int, str], Union[float, str, Tuple[Union[float, str], ...]]
         ] = {}
-        for _, parameter in synthdef.indexed_parameters:
-            if parameter.name not in settings:
+        layout = synthdef.control_layout
+        for position in layout.name_order:
+            name = layout.names[position]
+            if name not in settings:
                 continue
-            value = settings[parameter.name]
+            value = settings[name]
             if not isinstance(value, Sequence) or isinstance(value, str):
                 value = (value,)
-            if value == parameter.value:
+            if value == layout.defaults[position]:
                 continue
-            if parameter.rate is ParameterRate.SCALAR or parameter.name in (
-                "in_",
-                "out",
-            ):
-                synthdef_kwargs[parameter.name] = tuple(float(v) for v in value)
+            key = layout.indices[position] if use_control_indices else name
+            if not layout.mappable[position]:
+                synthdef_kwargs[key] = tuple(float(v) for v in value)
             else:
                 processed_values: List[Union[float, str]] = []
                 for v in value:
@@ -642,10 +862,11 @@ class Context(metaclass=abc.ABCMeta):
                     else:
                         processed_values.append(float(v))
                 if len(processed_values) == 1:
-                    synthdef_kwargs[parameter.name] = processed_values[0]
+                    synthdef_kwargs[key] = processed_values[0]
                 else:
-                    synthdef_kwargs[parameter.name] = tuple(processed_values)
+                    synthdef_kwargs[key] = tuple(processed_values)
         id_ = self._allocate_id(Node, permanent=permanent)
+        self._node_control_cache.pop(id_, None)
         self._add_requests(
             NewSynth(
                 add_action=add_action_,
@@ -678,6 +899,52 @@ class Context(metaclass=abc.ABCMeta):
         request = ReceiveSynthDefs(synthdefs=synthdefs)
         return self._add_request_with_completion(request, on_completion)
 
+    def allocation_batch(
+        self,
+        *,
+        nodes: int = 0,
+        audio_buses: int = 0,
+        control_buses: int = 0,
+        buffers: int = 0,
+    ) -> AllocationBatch:
+        """
+        Create an allocation batch.
+
+        Reserve IDs for many nodes, buses and buffers at once. Objects added in the
+        same thread or task inside the batch draw from the reservation, and any
+        reserved IDs left over are returned when the batch exits, even on error.
+
+        ::
+
+            >>> from supriya import Score
+            >>> score = Score()
+            >>> with score.at(0), score.allocation_batch(control_buses=8) as batch:
+            ...     bus_group = score.add_bus_group("CONTROL", count=4)
+            ...     bus = score.add_bus("CONTROL")
+            ...     list(batch.remaining.values())
+            ...
+            [3]
+
+        ::
+
+            >>> with score.at(1):
+            ...     int(bus_group), int(bus), int(score.add_bus("CONTROL"))
+            ...
+            (0, 4, 5)
+
+        :param nodes: The number of temporary node IDs to reserve.
+        :param audio_buses: The number of contiguous audio bus IDs to reserve.
+        :param control_buses: The number of contiguous control bus IDs to reserve.
+        :param buffers: The number of contiguous buffer IDs to reserve.
+        """
+        return AllocationBatch(
+            context=self,
+            nodes=nodes,
+            audio_buses=audio_buses,
+            control_buses=control_buses,
+            buffers=buffers,
+        )
+
     def at(self, seconds=None) -> Moment:
         """
         Create a Moment.
@@ -889,6 +1156,7 @@ class Context(metaclass=abc.ABCMeta):
             force=force,
             has_gate=isinstance(node, Synth) and "gate" in node.synthdef.parameters,
         )
+        self._node_control_cache.pop(node.id_, None)
         self._add_requests(request)
 
     def free_synthdefs(self, *synthdefs: SynthDef) -> None:
@@ -1028,6 +1296,7 @@ class Context(metaclass=abc.ABCMeta):
                     control[key] = int(value)
             elif value is None:
                 control[key] = -1
+        self._node_control_cache.pop(node.id_, None)
         requests: List[Request] = []
         if control:
             requests.append(
@@ -1115,6 +1384,45 @@ class Context(metaclass=abc.ABCMeta):
         request = RunNode(items=[(node, False)])
         self._add_requests(request)
 
+    def plan_bus_compaction(
+        self, calculation_rate: CalculationRateLike = CalculationRate.CONTROL
+    ) -> List[Tuple[BusGroup, int]]:
+        """
+        Suggest relocations which would defragment the context's buses.
+
+        Emit no requests.
+
+        Plans moves for the bus allocator of one calculation rate, from the top of
+        its range down, without changing it. Buses added one at a time are
+        reported as single-bus groups. Applying a move means adding a bus group
+        at the destination, copying values and re-mapping node controls to it,
+        and freeing the original.
+
+        ::
+
+            >>> from supriya import Server
+            >>> server = Server().boot()  # doctest: +SKIP
+            >>> bus_groups = [server.add_bus_group(count=x) for x in (2, 4, 2)]  # doctest: +SKIP
+            >>> bus_groups[0].free()  # doctest: +SKIP
+            >>> server.plan_bus_compaction() == [(bus_groups[2], 0)]  # doctest: +SKIP
+            True
+
+        Returns a list of ``(bus group, destination ID)`` pairs.
+
+        :param calculation_rate: The calculation rate of the buses to compact.
+        """
+        rate = CalculationRate.from_expr(calculation_rate)
+        if rate not in (CalculationRate.AUDIO, CalculationRate.CONTROL):
+            raise InvalidCalculationRate(rate)
+        allocator = cast(BlockAllocator, self._get_allocator(Bus, rate))
+        return [
+            (
+                BusGroup(calculation_rate=rate, context=self, count=size, id_=source),
+                destination,
+            )
+            for source, destination, size in allocator.plan_compaction()
+        ]
+
     def read_buffer(
         self,
         buffer: Buffer,
@@ -1197,15 +1505,24 @@ class Context(metaclass=abc.ABCMeta):
         """
         Set a buffer sample range.
 
-        Emit ``/b_setn`` requests.
+        Emit ``/b_setn`` requests, split into datagram-sized chunks.
 
         :param buffer: The buffer to modify.
         :param index: The sample index to start writing at.
-        :param values: The values to write.
+        :param values: The values to write, e.g. a sequence or NumPy array.
         """
         self._validate_can_request()
-        request = SetBufferRange(buffer_id=buffer, items=[(index, values)])
-        self._add_requests(request)
+        if hasattr(values, "tolist"):  # NumPy arrays
+            values = values.tolist()
+        self._add_requests(
+            *(
+                SetBufferRange(
+                    buffer_id=buffer,
+                    items=[(index + i, values[i : i + BUFFER_TRANSFER_CHUNK_SIZE])],
+                )
+                for i in range(0, len(values), BUFFER_TRANSFER_CHUNK_SIZE)
+            )
+        )
 
     def set_bus(self, bus: Bus, value: float) -> None:
         """
@@ -1265,6 +1582,7 @@ class Context(metaclass=abc.ABCMeta):
             else:
                 coerced_settings[key] = float(values)
         request = SetNodeControl(node_id=node.id_, items=list(coerced_settings.items()))
+        self._node_control_cache.pop(node.id_, None)
         self._add_requests(request)
 
     def set_node_range(
@@ -1291,8 +1609,84 @@ class Context(metaclass=abc.ABCMeta):
         request = SetNodeControlRange(
             node_id=node.id_, items=list(coerced_settings.items())
         )
+        self._node_control_cache.pop(node.id_, None)
         self._add_requests(request)
 
+    def set_nodes(
+        self,
+        nodes: Sequence[Node],
+        *,
+        skip_unchanged: bool = False,
+        **controls: Union[SupportsFloat, str, Sequence],
+    ) -> None:
+        """
+        Set controls across many nodes at once.
+
+        Emit ``/n_set`` requests for scalar controls and ``/n_setn`` requests for
+        array controls, all within a single moment.
+
+        Each control's value is either a scalar, broadcast to every node, or an
+        array-like (including NumPy arrays) with one entry per node. An entry
+        which is itself a sequence (e.g. a row of a 2-D array) sets an array
+        control on that node. Strings are bus-mapping symbols (e.g. ``"c0"``)
+        rather than sequences.
+
+        :param nodes: The nodes whose controls will be set.
+        :param skip_unchanged: Drop values identical to those sent to the same
+            node by a previous ``set_nodes()`` call. Any other write to a node's
+            controls (``set_node()``, ``set_node_range()``, ``map_node()``) or
+            freeing it forgets what was sent to it.
+        :param controls: A mapping of control names to scalars or per-node values.
+        """
+        self._validate_can_request()
+        per_node_values: Dict[str, Sequence] = {}
+        for key, values in sorted(controls.items()):
+            if hasattr(values, "tolist"):  # NumPy arrays and scalars
+                values = values.tolist()
+            if isinstance(values, Sequence) and not isinstance(values, str):
+                if len(values) != len(nodes):
+                    raise ValueError(
+                        f"{key!r} has {len(values)} values for {len(nodes)} nodes"
+                    )
+                per_node_values[key] = values
+            else:
+                per_node_values[key] = [values] * len(nodes)
+        scalar_requests: List[Request] = []
+        array_requests: List[Request] = []
+        for i, node in enumerate(nodes):
+            scalar_items: List[Tuple[Union[int, str], Union[float, str]]] = []
+            array_items: List[Tuple[Union[int, str], Sequence[float]]] = []
+            cache = self._node_control_cache.setdefault(node.id_, {})
+            for key, values in per_node_values.items():
+                value = values[i]
+                if isinstance(value, str):
+                    coerced: Union[float, str, Tuple[float, ...]] = value
+                elif isinstance(value, Sequence):
+                    coerced = tuple(float(x) for x in value)
+                else:
+                    coerced = float(value)
+                if skip_unchanged and cache.get(key) == coerced:
+                    continue
+                cache[key] = coerced
+                if isinstance(coerced, tuple):
+                    array_items.append((key, coerced))
+                else:
+                    scalar_items.append((key, coerced))
+            if scalar_items:
+                scalar_requests.append(
+                    SetNodeControl(node_id=node.id_, items=scalar_items)
+                )
+            if array_items:
+                array_requests.append(
+                    SetNodeControlRange(node_id=node.id_, items=array_items)
+                )
+        if not scalar_requests and not array_requests:
+            return
+        with contextlib.ExitStack() as stack:
+            if not self._get_request_context():
+                stack.enter_context(self.at())
+            self._add_requests(*scalar_requests, *array_requests)
+
     def unpause_node(self, node: Node) -> None:
         """
         Unpause a node.
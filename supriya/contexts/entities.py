@@ -24,17 +24,20 @@ except ImportError:
 
 from ..assets.synthdefs.default import default
 from ..enums import AddAction, CalculationRate
-from ..io import PlayMemo
+from ..io import PlayMemo, read_float_wav
 from ..typing import AddActionLike, HeaderFormatLike, SampleFormatLike, SupportsRender
 from ..ugens import SynthDef
 from .errors import InvalidCalculationRate, InvalidMoment
 from .responses import BufferInfo, NodeInfo, QueryTreeGroup
 
 if TYPE_CHECKING:
+    import asyncio
+    import concurrent.futures
+
     import numpy
 
     from .core import Completion, Context
-    from .realtime import AsyncServer, BaseServer, Server
+    from .realtime import AsyncServer, BaseServer, NodeWatch, Server
 
 
 @dataclasses.dataclass(frozen=True)
@@ -98,13 +101,16 @@ class Buffer(ContextObject):
         return self.completion.__exit__(*args)
 
     def __plot__(self) -> Tuple["numpy.ndarray", float]:
-        import librosa
+        import numpy
 
         with tempfile.TemporaryDirectory() as temp_directory:
             file_path = Path(temp_directory) / "tmp.wav"
-            self.write(file_path=file_path, header_format="wav", sample_format="int32")
+            self.write(file_path=file_path, header_format="wav", sample_format="float")
             cast("Server", self.context).sync()
-            return librosa.load(file_path, mono=False, sr=None)
+            array, sample_rate = read_float_wav(file_path)
+            # Channels-first, as plotting expects
+            array = numpy.array(array[:, 0] if array.shape[1] == 1 else array.T)
+            return array, float(sample_rate)
 
     def __render_memo__(
         self,
@@ -185,6 +191,21 @@ class Buffer(ContextObject):
         """
         return self.context.free_buffer(self, on_completion=on_completion)
 
+    def from_numpy(
+        self, array: "numpy.ndarray", timeout: float = 10.0
+    ) -> Union[Awaitable[None], None]:
+        """
+        Replace the buffer's contents with a NumPy array via a temporary file.
+
+        Emit ``/b_allocRead`` requests.
+
+        :param array: The ``(frames, channels)`` array to upload.
+        :param timeout: The number of seconds to wait for the upload to complete.
+        """
+        return cast(Union["AsyncServer", "Server"], self.context).set_buffer_array(
+            self, array, timeout=timeout
+        )
+
     def generate(
         self,
         command_name: Literal["sine1", "sine2", "sine3", "cheby"],
@@ -236,20 +257,24 @@ class Buffer(ContextObject):
         )
 
     def get_range(
-        self, index: int, count: int, sync: bool = True
-    ) -> Union[Awaitable[Optional[Sequence[float]]], Optional[Sequence[float]]]:
+        self, index: int, count: int, sync: bool = True, as_array: bool = False
+    ) -> Union[
+        Awaitable[Optional[Union[Sequence[float], "numpy.ndarray"]]],
+        Optional[Union[Sequence[float], "numpy.ndarray"]],
+    ]:
         """
         Get a sample range.
 
-        Emit ``/b_getn`` requests.
+        Emit ``/b_getn`` requests, split into datagram-sized chunks.
 
         :param index: The sample index to start reading at.
         :param count: The number of samples to read.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
+        :param as_array: If true, return a NumPy array rather than a tuple.
         """
         return cast(Union["AsyncServer", "Server"], self.context).get_buffer_range(
-            self, index, count, sync=sync
+            self, index, count, sync=sync, as_array=as_array
         )
 
     def normalize(self, new_maximum: float = 1.0, as_wavetable: bool = False) -> None:
@@ -330,17 +355,34 @@ class Buffer(ContextObject):
         """
         self.context.set_buffer(buffer=self, index=index, value=value)
 
-    def set_range(self, index: int, values: Sequence[float]) -> None:
+    def set_range(
+        self, index: int, values: Union[Sequence[float], "numpy.ndarray"]
+    ) -> None:
         """
         Set a sample range.
 
-        Emit ``/b_setn`` requests.
+        Emit ``/b_setn`` requests, split into datagram-sized chunks.
 
         :param index: The sample index to start writing at.
-        :param values: The values to write.
+        :param values: The values to write, e.g. a sequence or NumPy array.
         """
         self.context.set_buffer_range(buffer=self, index=index, values=values)
 
+    def to_numpy(
+        self, timeout: float = 10.0
+    ) -> Union[Awaitable["numpy.ndarray"], "numpy.ndarray"]:
+        """
+        Get the buffer's contents as a ``(frames, channels)`` NumPy array via a
+        temporary file.
+
+        Emit ``/b_write`` requests.
+
+        :param timeout: The number of seconds to wait for the download to complete.
+        """
+        return cast(Union["AsyncServer", "Server"], self.context).get_buffer_array(
+            self, timeout=timeout
+        )
+
     def write(
         self,
         file_path: PathLike,
@@ -471,7 +513,7 @@ class Bus(ContextObject):
         """
         Get the control bus' value.
 
-        Emit ``/c_get`` requests.
+        Emit ``/c_get`` requests, or read shared memory directly on local servers.
 
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
@@ -486,7 +528,7 @@ class Bus(ContextObject):
         """
         Get a range of control bus values.
 
-        Emit ``/c_getn`` requests.
+        Emit ``/c_getn`` requests, or read shared memory directly on local servers.
 
         :param count: The number of contiguous buses whose values to get.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
@@ -510,7 +552,8 @@ class Bus(ContextObject):
         """
         Set the control bus's value.
 
-        Emit ``/c_set`` requests.
+        Emit ``/c_set`` requests, or write shared memory directly on local servers
+        outside of a moment.
 
         :param value: The value to set the control bus to.
         """
@@ -520,7 +563,8 @@ class Bus(ContextObject):
         """
         Set a range of control buses.
 
-        Emit ``/c_setn`` requests.
+        Emit ``/c_setn`` requests, or write shared memory directly on local servers
+        outside of a moment.
 
         :param values: The values to write.
         """
@@ -568,6 +612,21 @@ class BusGroup(ContextObject):
         """
         self.context.free_bus_group(self)
 
+    def get_range(
+        self, sync: bool = True
+    ) -> Union[Awaitable[Optional[Sequence[float]]], Optional[Sequence[float]]]:
+        """
+        Get the values of all control buses in the group.
+
+        Emit ``/c_getn`` requests, or read shared memory directly on local servers.
+
+        :param sync: If true, communicate the request immediately. Otherwise bundle it
+            with the current request context.
+        """
+        return cast(Union["AsyncServer", "Server"], self.context).get_bus_range(
+            self.buses[0], len(self), sync=sync
+        )
+
     def map_symbol(self) -> str:
         """
         Get the bus group's map symbol.
@@ -578,6 +637,17 @@ class BusGroup(ContextObject):
             return f"c{self.id_}"
         raise InvalidCalculationRate
 
+    def set_range(self, values: Sequence[float]) -> None:
+        """
+        Set the values of all control buses in the group.
+
+        Emit ``/c_setn`` requests, or write shared memory directly on local servers
+        outside of a moment.
+
+        :param values: The values to write.
+        """
+        self.context.set_bus_range(self.buses[0], values)
+
 
 @dataclasses.dataclass(frozen=True)
 class Node(ContextObject):
@@ -636,6 +706,14 @@ class Node(ContextObject):
             **settings,
         )
 
+    def ended(
+        self,
+    ) -> Union["asyncio.Future[NodeInfo]", "concurrent.futures.Future[NodeInfo]"]:
+        """
+        Get a future resolved with the node's next ``/n_end`` notification.
+        """
+        return cast(Union["AsyncServer", "Server"], self.context).node_ended(self)
+
     def free(self, force: bool = False) -> None:
         """
         Free the node.
@@ -674,6 +752,24 @@ class Node(ContextObject):
             node=self, add_action=add_action, target_node=target_node
         )
 
+    def on_end(self, callback: Callable[[NodeInfo], None]) -> Callable[[], None]:
+        """
+        Call ``callback`` with the node's next ``/n_end`` notification.
+
+        :param callback: The callable to call.
+        :returns: A callable that removes the callback.
+        """
+        return cast("BaseServer", self.context).on_node_end(self, callback)
+
+    def on_off(self, callback: Callable[[NodeInfo], None]) -> Callable[[], None]:
+        """
+        Call ``callback`` with the node's next ``/n_off`` notification.
+
+        :param callback: The callable to call.
+        :returns: A callable that removes the callback.
+        """
+        return cast("BaseServer", self.context).on_node_off(self, callback)
+
     def order(self, *nodes: "Node", add_action: AddActionLike = None) -> None:
         """
         Re-order nodes relative to the node.
@@ -734,6 +830,14 @@ class Node(ContextObject):
         """
         self.context.set_node_range(self, *indexed_settings, **settings)
 
+    def started(
+        self,
+    ) -> Union["asyncio.Future[NodeInfo]", "concurrent.futures.Future[NodeInfo]"]:
+        """
+        Get a future resolved once the node is running.
+        """
+        return cast(Union["AsyncServer", "Server"], self.context).node_started(self)
+
     def unpause(self) -> None:
         """
         Unpause the node.
@@ -844,6 +948,12 @@ class Group(Node):
             group=self, include_controls=include_controls, sync=sync
         )
 
+    def watch(self) -> "NodeWatch":
+        """
+        Watch node notifications for the group and everything beneath it.
+        """
+        return cast("BaseServer", self.context).watch(self)
+
     @property
     def children(self) -> List[Node]:
         """
@@ -0,0 +1,436 @@
+"""
+Tools for adapting realtime servers' latency.
+"""
+
+import asyncio
+import collections
+import dataclasses
+import functools
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Deque, Dict, List, Optional, Tuple, cast
+
+from ..clocks import BaseClock, ClockContext, Quantization
+from ..scsynth import LateEvent
+from .monitors import TelemetrySample
+from .realtime import AsyncServer, BaseServer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class LatencyChange:
+    """
+    A change of a server's latency by its latency controller.
+
+    The demand and its inputs are the controller's estimates when the change was
+    made, each the worst observed within the controller's window.
+    """
+
+    timestamp: float
+    previous_latency: float
+    latency: float
+    demand: float
+    round_trip_time: float
+    jitter: float
+    late_demand: float
+
+
+class LatencyController:
+    """
+    An adaptive controller of the latency applied to timestamped bundles.
+
+    The controller estimates the latency currently needed, its *demand*, from the
+    worst observations within the last ``window`` seconds: half the round-trip time
+    of telemetry ``/status`` requests plus the clock's scheduling jitter, or the
+    latency in effect when scsynth reported a late bundle plus its lateness. A
+    ``margin`` is added to either.
+
+    A PID-style step in velocity form moves the latency towards the demand ``rate``
+    times per second, clamped between ``minimum`` and ``maximum``. Late bundles
+    bypass the controller, raising the latency immediately. Hysteresis keeps the
+    applied latency steady: changes smaller than ``hysteresis`` are held back, and
+    decreases wait until ``hold`` seconds have passed since starting or the last
+    increase. Latencies set elsewhere, such as by
+    :py:meth:`~supriya.contexts.realtime.BaseServer.set_latency`, become the
+    controller's new starting point.
+
+    Starting the controller starts the server's telemetry if needed. Clock jitter is
+    measured by cueing a probe on ``clock``, if given, and may also be recorded from
+    any clock callback via :py:meth:`observe`.
+
+    ::
+
+        >>> from supriya.clocks import Clock
+        >>> from supriya.contexts import LatencyController, Server
+        >>> server = Server().boot()  # doctest: +SKIP
+        >>> clock = Clock()
+        >>> controller = LatencyController(
+        ...     server, clock=clock, minimum=0.01, maximum=0.25
+        ... ).start()  # doctest: +SKIP
+        >>> server.latency  # doctest: +SKIP
+        0.0213...
+
+    :param server: The server whose latency to control.
+    :param clock: The clock whose scheduling jitter to probe.
+    :param minimum: The smallest latency applied, in seconds.
+    :param maximum: The largest latency applied, in seconds.
+    :param margin: The safety margin added to the demand, in seconds.
+    :param hysteresis: The smallest change applied, in seconds.
+    :param hold: The number of seconds after an increase before decreasing.
+    :param window: The number of seconds observations are kept.
+    :param rate: The number of controller steps per second.
+    :param proportional_gain: The gain on changes of the error.
+    :param integral_gain: The gain on the error, per second.
+    :param derivative_gain: The gain on the error's acceleration.
+    :param quantization: The clock tick to probe on.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        server: BaseServer,
+        *,
+        clock: Optional[BaseClock] = None,
+        minimum: float = 0.01,
+        maximum: float = 0.5,
+        margin: float = 0.005,
+        hysteresis: float = 0.002,
+        hold: float = 5.0,
+        window: float = 10.0,
+        rate: float = 4.0,
+        proportional_gain: float = 0.25,
+        integral_gain: float = 1.0,
+        derivative_gain: float = 0.0,
+        quantization: Quantization = "1/16",
+    ) -> None:
+        if not 0 <= minimum <= maximum:
+            raise ValueError(minimum, maximum)
+        if rate <= 0:
+            raise ValueError(rate)
+        if window <= 0:
+            raise ValueError(window)
+        self._applied: Optional[float] = None
+        self._change_count = 0
+        self._changes: Deque[LatencyChange] = collections.deque(maxlen=256)
+        self._clock = clock
+        self._clock_event_id: Optional[int] = None
+        self._demand: Optional[float] = None
+        self._derivative_gain = float(derivative_gain)
+        self._errors: Tuple[Optional[float], Optional[float]] = (None, None)
+        self._hold = float(hold)
+        self._hysteresis = float(hysteresis)
+        self._integral_gain = float(integral_gain)
+        # (monotonic time, value) observations, pruned to the window
+        self._jitters: Deque[Tuple[float, float]] = collections.deque()
+        self._late_demands: Deque[Tuple[float, float]] = collections.deque()
+        self._round_trip_times: Deque[Tuple[float, float]] = collections.deque()
+        self._last_increase_time = -float("inf")
+        self._last_step_time: Optional[float] = None
+        self._lock = threading.RLock()
+        self._margin = float(margin)
+        self._maximum = float(maximum)
+        self._minimum = float(minimum)
+        self._output: Optional[float] = None
+        self._owns_telemetry = False
+        self._proportional_gain = float(proportional_gain)
+        self._quantization = quantization
+        self._rate = float(rate)
+        self._server = server
+        self._stop_event = threading.Event()
+        self._subscription_ids = itertools.count()
+        self._subscriptions: Dict[int, Callable[[LatencyChange], None]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._unsubscribers: List[Callable[[], None]] = []
+        self._window = float(window)
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "LatencyController":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ### PRIVATE METHODS ###
+
+    def _apply(self, latency: float, now: float) -> Optional[LatencyChange]:
+        # call with the lock held
+        previous_latency = self._server.latency
+        if latency == previous_latency:
+            return None
+        if latency > previous_latency:
+            self._last_increase_time = now
+        self._applied = latency
+        self._server.set_latency(latency)
+        change = LatencyChange(
+            timestamp=time.time(),
+            previous_latency=previous_latency,
+            latency=latency,
+            demand=self._demand if self._demand is not None else latency,
+            round_trip_time=self._get_maximum(self._round_trip_times),
+            jitter=self._get_maximum(self._jitters),
+            late_demand=self._get_maximum(self._late_demands),
+        )
+        self._change_count += 1
+        self._changes.append(change)
+        return change
+
+    def _clamp(self, latency: float) -> float:
+        return min(max(latency, self._minimum), self._maximum)
+
+    def _clock_callback(self, clock_context: ClockContext, *args, **kwargs) -> float:
+        self.observe(clock_context)
+        return cast(BaseClock, self._clock).quantization_to_beats(self._quantization)
+
+    def _get_demand(self) -> Optional[float]:
+        # call with the lock held
+        if not (self._jitters or self._late_demands or self._round_trip_times):
+            return None
+        timing = self._get_maximum(self._round_trip_times) / 2 + self._get_maximum(
+            self._jitters
+        )
+        # late reports are recorded as the latency which would have sufficed
+        return max(timing, self._get_maximum(self._late_demands)) + self._margin
+
+    def _get_maximum(self, observations: Deque[Tuple[float, float]]) -> float:
+        return max((value for _, value in observations), default=0.0)
+
+    def _notify(self, change: Optional[LatencyChange]) -> None:
+        if change is None:
+            return
+        with self._lock:
+            callbacks = list(self._subscriptions.values())
+        for callback in callbacks:
+            try:
+                callback(change)
+            except Exception:
+                logger.exception("Latency controller subscriber raised")
+
+    def _on_late_event(self, event: LateEvent) -> None:
+        now = time.monotonic()
+        with self._lock:
+            needed = self._server.latency + event.lateness
+            self._late_demands.append((now, needed))
+            self._prune(now)
+            self._demand = self._get_demand()
+            # late bundles are audible, so raise at once rather than stepping
+            if (output := self._clamp(needed + self._margin)) <= self._server.latency:
+                return
+            self._errors = (None, None)
+            self._output = output
+            change = self._apply(output, now)
+        self._notify(change)
+
+    def _on_telemetry_sample(self, sample: TelemetrySample) -> None:
+        with self._lock:
+            self._round_trip_times.append((time.monotonic(), sample.round_trip_time))
+
+    def _prune(self, now: float) -> None:
+        # call with the lock held
+        for observations in (self._jitters, self._late_demands, self._round_trip_times):
+            while observations and observations[0][0] < now - self._window:
+                observations.popleft()
+
+    async def _run_async(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            self.step()
+            await asyncio.sleep(1 / self._rate)
+
+    def _run_threaded(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            self.step()
+            stop_event.wait(1 / self._rate)
+
+    def _unsubscribe(self, subscription_id: int) -> None:
+        with self._lock:
+            self._subscriptions.pop(subscription_id, None)
+
+    ### PUBLIC METHODS ###
+
+    def observe(self, clock_context: ClockContext) -> None:
+        """
+        Record the scheduling jitter of a clock callback.
+
+        Call from clock callbacks scheduling bundles to include their jitter in the
+        demand.
+
+        :param clock_context: The clock context passed to the callback.
+        """
+        jitter = (
+            clock_context.current_moment.seconds - clock_context.desired_moment.seconds
+        )
+        with self._lock:
+            self._jitters.append((time.monotonic(), max(jitter, 0.0)))
+
+    def start(self) -> "LatencyController":
+        """
+        Start controlling the server's latency.
+        """
+        if self._task is not None or self._thread is not None:
+            return self
+        with self._lock:
+            self._applied = self._server.latency
+            self._errors = (None, None)
+            self._last_increase_time = now = time.monotonic()
+            self._last_step_time = None
+            self._output = self._clamp(self._server.latency)
+            change = self._apply(self._output, now)
+        self._notify(change)
+        if (controller := self._server._latency_controller) not in (None, self):
+            cast(LatencyController, controller).stop()
+        self._server._latency_controller = self
+        self._unsubscribers[:] = [
+            self._server.late_monitor.subscribe(self._on_late_event),
+            self._server.telemetry.subscribe(self._on_telemetry_sample),
+        ]
+        if not self._server.telemetry.is_running:
+            self._owns_telemetry = True
+            self._server.telemetry.start()
+        self._stop_event = threading.Event()
+        if self._clock is not None:
+            self._clock_event_id = self._clock.cue(
+                self._clock_callback, quantization=self._quantization
+            )
+        if isinstance(self._server, AsyncServer):
+            self._task = asyncio.get_running_loop().create_task(
+                self._run_async(self._stop_event)
+            )
+        else:
+            self._thread = threading.Thread(
+                target=self._run_threaded, args=(self._stop_event,), daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def step(self) -> float:
+        """
+        Move the latency one step towards the demand and return the latency.
+
+        Called automatically while the controller is running.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._demand = self._get_demand()
+            if self._demand is None:
+                return self._server.latency
+            if self._output is None or self._server.latency != self._applied:
+                # restart from latencies set elsewhere
+                self._applied = self._server.latency
+                self._errors = (None, None)
+                self._output = self._clamp(self._server.latency)
+            dt = now - self._last_step_time if self._last_step_time else 1 / self._rate
+            self._last_step_time = now
+            error = self._demand - self._output
+            previous_error, previous_previous_error = self._errors
+            delta = self._integral_gain * error * dt
+            if previous_error is not None:
+                delta += self._proportional_gain * (error - previous_error)
+                if previous_previous_error is not None and dt > 0:
+                    delta += (
+                        self._derivative_gain
+                        * (error - 2 * previous_error + previous_previous_error)
+                        / dt
+                    )
+            self._errors = (error, previous_error)
+            # clamping the output rather than the error keeps the integral unwound
+            self._output = self._clamp(self._output + delta)
+            latency = self._server.latency
+            if abs(self._output - latency) < self._hysteresis or (
+                self._output < latency and now - self._last_increase_time < self._hold
+            ):
+                return latency
+            change = self._apply(self._output, now)
+        self._notify(change)
+        return self._server.latency
+
+    def stop(self) -> None:
+        """
+        Stop controlling the server's latency, leaving it as last applied.
+        """
+        self._stop_event.set()
+        if self._clock_event_id is not None:
+            cast(BaseClock, self._clock).cancel(self._clock_event_id)
+        if self._task is not None:
+            self._task.cancel()
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers.clear()
+        if self._owns_telemetry:
+            self._server.telemetry.stop()
+        if self._server._latency_controller is self:
+            self._server._latency_controller = None
+        self._clock_event_id = self._task = self._thread = None
+        self._owns_telemetry = False
+
+    def subscribe(
+        self, callback: Callable[[LatencyChange], None]
+    ) -> Callable[[], None]:
+        """
+        Subscribe to latency changes.
+
+        Returns a callable which cancels the subscription.
+
+        :param callback: The callable to notify of each change.
+        """
+        subscription_id = next(self._subscription_ids)
+        with self._lock:
+            self._subscriptions[subscription_id] = callback
+        return functools.partial(self._unsubscribe, subscription_id)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def change_count(self) -> int:
+        """
+        Get the number of latency changes applied.
+        """
+        return self._change_count
+
+    @property
+    def changes(self) -> List[LatencyChange]:
+        """
+        Get the most recent latency changes, oldest first.
+        """
+        with self._lock:
+            return list(self._changes)
+
+    @property
+    def demand(self) -> Optional[float]:
+        """
+        Get the latest estimate of the latency needed, if anything was observed.
+        """
+        return self._demand
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Get the controller's running state.
+        """
+        return self._task is not None or self._thread is not None
+
+    @property
+    def latency(self) -> float:
+        """
+        Get the server's effective latency.
+        """
+        return self._server.latency
+
+    @property
+    def maximum(self) -> float:
+        """
+        Get the largest latency applied.
+        """
+        return self._maximum
+
+    @property
+    def minimum(self) -> float:
+        """
+        Get the smallest latency applied.
+        """
+        return self._minimum
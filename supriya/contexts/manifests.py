@@ -0,0 +1,226 @@
+"""
+Tools for preloading realtime servers at boot.
+"""
+
+import dataclasses
+from os import PathLike
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..assets.synthdefs import system_synthdefs
+from ..enums import AddAction
+from ..osc.protocols import MAXIMUM_DATAGRAM_SIZE
+from ..typing import CalculationRateLike
+from ..ugens import SynthDef, compile_synthdefs
+from .entities import Buffer, BusGroup, Group
+
+if TYPE_CHECKING:
+    from .realtime import BaseServer
+
+# room for the bundle header, the /d_recv address, type tags and blob padding
+MANIFEST_SYNTHDEF_BLOB_SIZE = MAXIMUM_DATAGRAM_SIZE - 64
+
+# the SCgf header: magic, version and synthdef count
+_SCGF_HEADER_SIZE = 10
+
+
+@dataclasses.dataclass(frozen=True)
+class ManifestResources:
+    """
+    The buffers, buses and groups a boot manifest added to a server, by name.
+    """
+
+    buffers: Dict[str, Buffer] = dataclasses.field(default_factory=dict)
+    buses: Dict[str, BusGroup] = dataclasses.field(default_factory=dict)
+    groups: Dict[str, Group] = dataclasses.field(default_factory=dict)
+
+
+class BootManifest:
+    """
+    The synthdefs, buffers, groups and buses to set up on a server at boot.
+
+    A manifest is applied while booting, along with the server's system groups and
+    synthdefs, as a single moment: ``/g_new`` requests for the groups (each added to
+    the tail of the default group, in order), ``/d_recv`` requests packing the
+    synthdefs into as few blobs as fit in a datagram, and ``/b_allocRead`` requests
+    for the buffers. Oversized bundles are split into consecutive datagrams by the
+    server's OSC protocol, and the server syncs once, after everything is loaded.
+    Buses are allocated client-side only.
+
+    Servers keep their manifest, re-applying it when rebooted or reset. The handles
+    to what the manifest added are available by name from
+    :py:attr:`~supriya.contexts.realtime.BaseServer.manifest_resources`.
+
+    ::
+
+        >>> from supriya import default
+        >>> from supriya.contexts import BootManifest, Server
+        >>> manifest = BootManifest(
+        ...     synthdefs=[default],
+        ...     buffers={"kick": "kick.wav"},
+        ...     buses={"lfo": ("CONTROL", 1)},
+        ...     groups=["sources", "effects"],
+        ... )
+        >>> server = Server().boot(manifest=manifest)  # doctest: +SKIP
+        >>> int(server.manifest_resources.groups["effects"])  # doctest: +SKIP
+        1001
+
+    :param synthdefs: The synthdefs to load.
+    :param buffers: The sound files to read into buffers, by name.
+    :param buses: The calculation rates and channel counts of bus groups to
+        allocate, by name.
+    :param groups: The names of the groups to add.
+    :param timeout: The number of seconds to wait for the server to sync after
+        applying the manifest.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        *,
+        synthdefs: Iterable[SynthDef] = (),
+        buffers: Optional[Dict[str, PathLike]] = None,
+        buses: Optional[Dict[str, Tuple[CalculationRateLike, int]]] = None,
+        groups: Iterable[str] = (),
+        timeout: float = 10.0,
+    ) -> None:
+        self._buffers = dict(buffers or {})
+        self._buses = dict(buses or {})
+        self._groups = tuple(groups)
+        if len(set(self._groups)) != len(self._groups):
+            raise ValueError(self._groups)
+        self._synthdefs = tuple(synthdefs)
+        self._timeout = timeout
+        self._packed_synthdefs: Dict[bool, List[Tuple[SynthDef, ...]]] = {}
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} synthdefs={len(self._synthdefs)} "
+            f"buffers={len(self._buffers)} buses={len(self._buses)} "
+            f"groups={len(self._groups)}>"
+        )
+
+    ### PRIVATE METHODS ###
+
+    def _apply(
+        self, server: "BaseServer", include_system_synthdefs: bool = True
+    ) -> ManifestResources:
+        resources = ManifestResources()
+        with server.at():
+            for name in self._groups:
+                resources.groups[name] = server.add_group(
+                    add_action=AddAction.ADD_TO_TAIL, target_node=server.default_group
+                )
+            for synthdefs in self._pack_synthdefs(include_system_synthdefs):
+                server.add_synthdefs(*synthdefs)
+            for name, file_path in self._buffers.items():
+                resources.buffers[name] = server.add_buffer(file_path=file_path)
+        for name, (calculation_rate, count) in self._buses.items():
+            resources.buses[name] = server.add_bus_group(
+                calculation_rate=calculation_rate, count=count
+            )
+        return resources
+
+    def _pack_synthdefs(
+        self, include_system_synthdefs: bool
+    ) -> List[Tuple[SynthDef, ...]]:
+        # packed once per manifest, and reused across boots
+        if (packed := self._packed_synthdefs.get(include_system_synthdefs)) is None:
+            synthdefs: List[SynthDef] = []
+            if include_system_synthdefs:
+                for name in dir(system_synthdefs):
+                    if isinstance(
+                        synthdef := getattr(system_synthdefs, name), SynthDef
+                    ):
+                        synthdefs.append(synthdef)
+            synthdefs.extend(
+                synthdef for synthdef in self._synthdefs if synthdef not in synthdefs
+            )
+            packed = self._packed_synthdefs[include_system_synthdefs] = pack_synthdefs(
+                synthdefs
+            )
+        return packed
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def buffers(self) -> Dict[str, PathLike]:
+        """
+        Get the manifest's buffer file paths, by name.
+        """
+        return dict(self._buffers)
+
+    @property
+    def buses(self) -> Dict[str, Tuple[CalculationRateLike, int]]:
+        """
+        Get the manifest's bus group rates and counts, by name.
+        """
+        return dict(self._buses)
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Get the manifest's emptiness flag.
+        """
+        return not (self._buffers or self._buses or self._groups or self._synthdefs)
+
+    @property
+    def groups(self) -> Tuple[str, ...]:
+        """
+        Get the manifest's group names.
+        """
+        return self._groups
+
+    @property
+    def synthdefs(self) -> Tuple[SynthDef, ...]:
+        """
+        Get the manifest's synthdefs.
+        """
+        return self._synthdefs
+
+    @property
+    def timeout(self) -> float:
+        """
+        Get the manifest's sync timeout.
+        """
+        return self._timeout
+
+
+def pack_synthdefs(
+    synthdefs: Sequence[SynthDef], maximum_size: int = MANIFEST_SYNTHDEF_BLOB_SIZE
+) -> List[Tuple[SynthDef, ...]]:
+    """
+    Pack synthdefs, in order, into as few ``/d_recv`` blobs as fit in
+    ``maximum_size`` bytes.
+
+    Synthdefs larger than ``maximum_size`` are packed alone.
+
+    ::
+
+        >>> from supriya import default
+        >>> from supriya.assets.synthdefs import system_link_audio_1, system_link_audio_2
+        >>> from supriya.contexts.manifests import pack_synthdefs
+        >>> synthdefs = [default, system_link_audio_1, system_link_audio_2]
+        >>> [len(x) for x in pack_synthdefs(synthdefs)]
+        [3]
+        >>> [len(x) for x in pack_synthdefs(synthdefs, maximum_size=1024)]
+        [1, 2]
+
+    :param synthdefs: The synthdefs to pack.
+    :param maximum_size: The maximum size of each blob in bytes.
+    """
+    packed: List[Tuple[SynthDef, ...]] = []
+    chunk: List[SynthDef] = []
+    size = _SCGF_HEADER_SIZE
+    for synthdef in synthdefs:
+        synthdef_size = len(compile_synthdefs(synthdef)) - _SCGF_HEADER_SIZE
+        if chunk and size + synthdef_size > maximum_size:
+            packed.append(tuple(chunk))
+            chunk, size = [], _SCGF_HEADER_SIZE
+        chunk.append(synthdef)
+        size += synthdef_size
+    if chunk:
+        packed.append(tuple(chunk))
+    return packed
@@ -0,0 +1,1385 @@
+"""
+Tools for observing realtime servers.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import dataclasses
+import functools
+import itertools
+import logging
+import math
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    SupportsInt,
+    Tuple,
+    Union,
+    cast,
+)
+
+from ..enums import AddAction, BootStatus, CalculationRate
+from ..scsynth import LateEvent
+from ..typing import AddActionLike
+from ..ugens import In, ScopeOut2, SynthDef, SynthDefBuilder
+from .entities import Bus, BusGroup, Node, Synth
+from .errors import ContextError
+from .realtime import AsyncServer, BaseServer, Server
+from .requests import BUFFER_TRANSFER_CHUNK_SIZE, GetControlBusRange
+from .responses import GetControlBusRangeInfo, StatusInfo
+
+if TYPE_CHECKING:
+    import numpy
+
+    from .shm import ScopeBufferReader
+
+logger = logging.getLogger(__name__)
+
+# Largest run of unmonitored buses read rather than starting a new /c_getn range
+BUS_MONITOR_MAXIMUM_GAP = 2
+
+# Quantiles of late bundle reports rendered by telemetry exports
+LATE_QUANTILES = (0.5, 0.9, 0.99)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_scope_synthdef(
+    calculation_rate: CalculationRate, channel_count: int
+) -> SynthDef:
+    with SynthDefBuilder(in_=0, scope_id=0, scope_frames=4096) as builder:
+        if calculation_rate == CalculationRate.AUDIO:
+            ScopeOut2.ar(
+                scope_id=builder["scope_id"],
+                max_frames=4096,
+                scope_frames=builder["scope_frames"],
+                source=In.ar(bus=builder["in_"], channel_count=channel_count),
+            )
+        else:
+            ScopeOut2.kr(
+                scope_id=builder["scope_id"],
+                max_frames=4096,
+                scope_frames=builder["scope_frames"],
+                source=In.kr(bus=builder["in_"], channel_count=channel_count),
+            )
+    return builder.build(
+        name=f"system_scope_{calculation_rate.name.lower()}_{channel_count}"
+    )
+
+
+def _format_metric_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    elif math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _coalesce_bus_ids(
+    bus_ids: Iterable[int], maximum_gap: int = BUS_MONITOR_MAXIMUM_GAP
+) -> List[Tuple[int, int]]:
+    """
+    Coalesce bus IDs into ``(index, count)`` ranges.
+
+    Runs separated by at most ``maximum_gap`` unmonitored buses are merged, as
+    reading a few extra values is cheaper than another range in the request and
+    reply. Ranges are split so no single range exceeds the transfer chunk size.
+
+    ::
+
+        >>> from supriya.contexts.monitors import _coalesce_bus_ids
+        >>> _coalesce_bus_ids([0, 1, 2, 4, 9, 10, 16])
+        [(0, 5), (9, 2), (16, 1)]
+
+    """
+    ranges: List[Tuple[int, int]] = []
+    for bus_id in sorted(set(bus_ids)):
+        if ranges:
+            index, count = ranges[-1]
+            if (
+                bus_id - (index + count) <= maximum_gap
+                and bus_id - index < BUFFER_TRANSFER_CHUNK_SIZE
+            ):
+                ranges[-1] = (index, bus_id - index + 1)
+                continue
+        ranges.append((bus_id, 1))
+    return ranges
+
+
+class BusMonitor:
+    """
+    A shared poller for control bus values.
+
+    Subscribers register interest in any number of control buses. While at least
+    one subscription exists, the monitor reads every subscribed bus once per tick
+    and calls each subscriber with only those of its buses whose values changed.
+    Subscriptions are pooled, so any number of subscribers costs one read per tick:
+    a shared memory read on local servers, otherwise a single ``/c_getn`` request
+    covering the coalesced ranges of all subscribed buses.
+
+    Polling runs on a daemon thread for :py:class:`~supriya.contexts.realtime.Server`
+    and as a task on the running event loop for
+    :py:class:`~supriya.contexts.realtime.AsyncServer`.
+
+    :param server: The server to monitor.
+    :param rate: The number of reads per second.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, server: BaseServer, rate: float = 30.0) -> None:
+        if rate <= 0:
+            raise ValueError(rate)
+        self._server = server
+        self._rate = float(rate)
+        self._bus_counts: Dict[int, int] = {}
+        self._bus_ids: Tuple[int, ...] = ()
+        self._lock = threading.RLock()
+        self._ranges: List[Tuple[int, int]] = []
+        self._stop_event = threading.Event()
+        self._subscription_ids = itertools.count()
+        self._subscriptions: Dict[
+            int, Tuple[Dict[int, Bus], Callable[[Dict[Bus, float]], None]]
+        ] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._values: Dict[int, float] = {}
+
+    ### PRIVATE METHODS ###
+
+    def _dispatch(self, changes: Dict[int, float]) -> None:
+        if not changes:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions.values())
+        for buses, callback in subscriptions:
+            if not (
+                changed := {
+                    bus: changes[bus_id]
+                    for bus_id, bus in buses.items()
+                    if bus_id in changes
+                }
+            ):
+                continue
+            try:
+                callback(changed)
+            except Exception:
+                logger.exception("Bus monitor subscriber raised")
+
+    def _get_requests(self) -> List[GetControlBusRange]:
+        requests: List[GetControlBusRange] = []
+        items: List[Tuple[int, int]] = []
+        size = 0
+        for index, count in self._ranges:
+            if items and size + count > BUFFER_TRANSFER_CHUNK_SIZE:
+                requests.append(GetControlBusRange(items=items))
+                items, size = [], 0
+            items.append((index, count))
+            size += count
+        if items:
+            requests.append(GetControlBusRange(items=items))
+        return requests
+
+    async def _run_async(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            await asyncio.sleep(1 / self._rate)
+            if self._server.boot_status != BootStatus.ONLINE:
+                continue
+            try:
+                await cast(Awaitable[Dict[int, float]], self.poll())
+            except (asyncio.TimeoutError, ContextError):
+                continue
+            except Exception:
+                logger.exception("Bus monitor poll failed")
+
+    def _run_threaded(self, stop_event: threading.Event) -> None:
+        while not stop_event.wait(1 / self._rate):
+            if self._server.boot_status != BootStatus.ONLINE:
+                continue
+            try:
+                self.poll()
+            except (concurrent.futures.TimeoutError, ContextError):
+                continue
+            except Exception:
+                logger.exception("Bus monitor poll failed")
+
+    def _start(self) -> None:
+        if self._task is not None or self._thread is not None:
+            return
+        self._stop_event = threading.Event()
+        if isinstance(self._server, AsyncServer):
+            self._task = asyncio.get_running_loop().create_task(
+                self._run_async(self._stop_event)
+            )
+        else:
+            self._thread = threading.Thread(
+                target=self._run_threaded, args=(self._stop_event,), daemon=True
+            )
+            self._thread.start()
+
+    def _unsubscribe(self, subscription_id: int) -> None:
+        with self._lock:
+            if (subscription := self._subscriptions.pop(subscription_id, None)) is None:
+                return
+            for bus_id in subscription[0]:
+                if self._bus_counts[bus_id] > 1:
+                    self._bus_counts[bus_id] -= 1
+                else:
+                    del self._bus_counts[bus_id]
+                    self._values.pop(bus_id, None)
+            self._bus_ids = tuple(sorted(self._bus_counts))
+            self._ranges = _coalesce_bus_ids(self._bus_ids)
+            # decided under the lock, so a concurrent subscribe() can't be stopped
+            if not self._subscriptions:
+                self.stop()
+
+    def _update(
+        self, values: Iterable[Tuple[int, Sequence[float]]]
+    ) -> Dict[int, float]:
+        changes: Dict[int, float] = {}
+        with self._lock:
+            for index, range_values in values:
+                for bus_id, value in enumerate(range_values, index):
+                    if bus_id not in self._bus_counts:
+                        continue
+                    if self._values.get(bus_id) != value:
+                        self._values[bus_id] = changes[bus_id] = value
+        self._dispatch(changes)
+        return changes
+
+    async def _update_async(
+        self, ranges: List[Tuple[int, int]], requests: List[GetControlBusRange]
+    ) -> Dict[int, float]:
+        server = cast(AsyncServer, self._server)
+        if (shm := server._shm) is not None:
+            return self._update(
+                (index, shm[index : index + count]) for index, count in ranges
+            )
+        values: List[Tuple[int, Sequence[float]]] = []
+        for response in await asyncio.gather(
+            *(request.communicate_async(server=server) for request in requests)
+        ):
+            values.extend(cast(GetControlBusRangeInfo, response).items)
+        return self._update(values)
+
+    ### PUBLIC METHODS ###
+
+    def poll(self) -> Union[Awaitable[Dict[int, float]], Dict[int, float]]:
+        """
+        Read all subscribed buses once and notify subscribers of changes.
+
+        Emit ``/c_getn`` requests, or read shared memory directly on local servers.
+
+        Returns a mapping of changed bus IDs to their new values. Called
+        automatically while the monitor has subscribers.
+        """
+        with self._lock:
+            ranges = list(self._ranges)
+            requests = self._get_requests()
+        if isinstance(self._server, AsyncServer):
+            return self._update_async(ranges, requests)
+        if (shm := self._server._shm) is not None:
+            return self._update(
+                (index, shm[index : index + count]) for index, count in ranges
+            )
+        responses = cast(Server, self._server)._communicate_windowed(
+            requests, window=max(len(requests), 1), timeout=1.0
+        )
+        return self._update(
+            item
+            for response in responses
+            for item in cast(GetControlBusRangeInfo, response).items
+        )
+
+    def snapshot(self) -> "numpy.ndarray":
+        """
+        Get the latest values of all subscribed buses as a float32 NumPy array.
+
+        Values are ordered by bus ID, matching :py:attr:`bus_ids`. Buses not yet read
+        are NaN.
+        """
+        import numpy
+
+        with self._lock:
+            return numpy.array(
+                [self._values.get(bus_id, numpy.nan) for bus_id in self._bus_ids],
+                dtype=numpy.float32,
+            )
+
+    def stop(self) -> None:
+        """
+        Stop polling and remove all subscriptions.
+        """
+        with self._lock:
+            self._subscriptions.clear()
+            self._bus_counts.clear()
+            self._bus_ids = ()
+            self._ranges = []
+            self._values.clear()
+            self._stop_event.set()
+            if self._task is not None:
+                self._task.cancel()
+            self._task = self._thread = None
+
+    def subscribe(
+        self,
+        buses: Union[Bus, BusGroup, Iterable[Bus]],
+        callback: Callable[[Dict[Bus, float]], None],
+    ) -> Callable[[], None]:
+        """
+        Subscribe to changes in one or more control buses.
+
+        The callback receives a mapping of changed buses to their new values. Values
+        already known to the monitor are delivered immediately.
+
+        Returns a callable which cancels the subscription.
+
+        :param buses: The control buses to watch.
+        :param callback: The callable to notify of changes.
+        """
+        if isinstance(buses, Bus):
+            buses = [buses]
+        buses_by_id = {bus.id_: bus for bus in buses}
+        if any(
+            bus.calculation_rate != CalculationRate.CONTROL
+            for bus in buses_by_id.values()
+        ):
+            raise ValueError(buses)
+        subscription_id = next(self._subscription_ids)
+        with self._lock:
+            self._subscriptions[subscription_id] = (buses_by_id, callback)
+            for bus_id in buses_by_id:
+                self._bus_counts[bus_id] = self._bus_counts.get(bus_id, 0) + 1
+            self._bus_ids = tuple(sorted(self._bus_counts))
+            self._ranges = _coalesce_bus_ids(self._bus_ids)
+            known = {
+                bus: self._values[bus_id]
+                for bus_id, bus in buses_by_id.items()
+                if bus_id in self._values
+            }
+            self._start()
+        if known:
+            callback(known)
+        return functools.partial(self._unsubscribe, subscription_id)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def bus_ids(self) -> Tuple[int, ...]:
+        """
+        Get the IDs of all subscribed buses, in snapshot order.
+        """
+        return self._bus_ids
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Get the monitor's running state.
+        """
+        return self._thread is not None or self._task is not None
+
+    @property
+    def ranges(self) -> List[Tuple[int, int]]:
+        """
+        Get the coalesced ``(index, count)`` ranges read each tick.
+        """
+        return list(self._ranges)
+
+    @property
+    def rate(self) -> float:
+        """
+        Get the number of reads per second.
+        """
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError(rate)
+        self._rate = float(rate)
+
+
+class ScopeMonitor:
+    """
+    A shared memory oscilloscope tap on one or more contiguous buses.
+
+    Starting the monitor allocates a scope buffer index and adds a ``ScopeOut2``
+    synth reading from the buses. Frames are then read directly from the server's
+    shared memory segment, without any OSC traffic.
+
+    Only available for servers booted by this process on the same host.
+
+    :param server: The server to monitor.
+    :param source: The bus or bus group to monitor.
+    :param frame_count: The number of frames per published block, up to 4096.
+    :param poll_interval: The interval in seconds between reads when iterating.
+    :param add_action: The add action to use when placing the scope synth.
+    :param target_node: The node to place the scope synth relative to. Defaults to
+        the server's default group.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        server: BaseServer,
+        source: Union[Bus, BusGroup],
+        *,
+        frame_count: int = 4096,
+        poll_interval: float = 1 / 30,
+        add_action: AddActionLike = AddAction.ADD_TO_TAIL,
+        target_node: Optional[SupportsInt] = None,
+    ) -> None:
+        if not 0 < frame_count <= 4096:
+            raise ValueError(frame_count)
+        self._server = server
+        self._source = source
+        self._frame_count = frame_count
+        self._poll_interval = poll_interval
+        self._add_action = add_action
+        self._target_node = target_node
+        self._reader: Optional["ScopeBufferReader"] = None
+        self._scope_id: Optional[int] = None
+        self._synth: Optional[Synth] = None
+
+    ### SPECIAL METHODS ###
+
+    def __aiter__(self) -> AsyncIterator["numpy.ndarray"]:
+        return self.frames()
+
+    def __enter__(self) -> "ScopeMonitor":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ### PUBLIC METHODS ###
+
+    async def frames(self) -> AsyncIterator["numpy.ndarray"]:
+        """
+        Iterate over newly published blocks as ``(frames, channels)`` NumPy arrays.
+
+        Polls every ``poll_interval`` seconds until the monitor is stopped.
+        """
+        while self._reader is not None:
+            if (array := self.read(changed_only=True)) is not None:
+                yield array
+            await asyncio.sleep(self._poll_interval)
+
+    def read(self, changed_only: bool = False) -> Optional["numpy.ndarray"]:
+        """
+        Read the most recently published block as a ``(frames, channels)`` NumPy array.
+
+        Returns ``None`` if the monitor is stopped or no block has been published yet.
+
+        :param changed_only: Flag for returning ``None`` rather than re-reading a
+            block which has already been read.
+        """
+        import numpy
+
+        if self._reader is None:
+            return None
+        if (view := self._reader.read(changed_only)) is None:
+            return None
+        return numpy.asarray(view)
+
+    def start(self) -> "ScopeMonitor":
+        """
+        Start the monitor.
+
+        Emit ``/d_recv`` and ``/s_new`` requests.
+        """
+        if self._reader is not None:
+            return self
+        if (shm := self._server._shm) is None:
+            raise ContextError("Shared memory is unavailable")
+        if (scope_id := self._server._scope_buffer_allocator.allocate(1)) is None:
+            raise ContextError("No free scope buffers")
+        if isinstance(self._source, Bus):
+            calculation_rate, channel_count = self._source.calculation_rate, 1
+        else:
+            calculation_rate = self._source.calculation_rate
+            channel_count = len(self._source)
+        synthdef = _build_scope_synthdef(calculation_rate, channel_count)
+        with self._server.at():
+            with self._server.add_synthdefs(synthdef):
+                self._synth = self._server.add_synth(
+                    synthdef,
+                    add_action=self._add_action,
+                    target_node=self._target_node,
+                    in_=int(self._source),
+                    scope_frames=self._frame_count,
+                    scope_id=scope_id,
+                )
+        self._scope_id = scope_id
+        self._reader = shm.get_scope_buffer_reader(scope_id)
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop the monitor.
+
+        Emit ``/n_free`` requests.
+        """
+        if self._reader is None:
+            return
+        self._reader = None
+        if self._synth is not None and self._server._shm is not None:
+            self._synth.free()
+        if self._scope_id is not None:
+            self._server._scope_buffer_allocator.free(self._scope_id)
+        self._scope_id = self._synth = None
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Get the monitor's running state.
+        """
+        return self._reader is not None
+
+    @property
+    def scope_id(self) -> Optional[int]:
+        """
+        Get the monitor's scope buffer index, if running.
+        """
+        return self._scope_id
+
+    @property
+    def synth(self) -> Optional[Synth]:
+        """
+        Get the monitor's scope synth, if running.
+        """
+        return self._synth
+
+
+class ReplyStream:
+    """
+    A ring buffer of ``SendReply`` values from one node and reply ID.
+
+    Matching replies are decoded straight from the datagram with a precompiled
+    unpacker and written into a preallocated ``(capacity, channel_count)`` float32
+    NumPy array, bypassing ``OscMessage`` decoding and callback dispatch entirely.
+    Replies from other nodes or reply IDs still reach registered callbacks.
+
+    Read the most recent replies with :py:meth:`latest`, or iterate over
+    consecutive blocks of ``block_size`` replies with ``async for``. Iteration ends
+    when the stream stops, which happens automatically when the node ends.
+
+    ::
+
+        >>> from supriya import SynthDefBuilder, default
+        >>> from supriya.contexts import AsyncServer, ReplyStream
+        >>> from supriya.ugens import Amplitude, In, Impulse, SendReply
+        >>> with SynthDefBuilder() as builder:
+        ...     _ = SendReply.kr(
+        ...         reply_id=7,
+        ...         source=Amplitude.kr(source=In.ar(channel_count=2)),
+        ...         trigger=Impulse.kr(frequency=1000),
+        ...     )
+        ...
+        >>> async def analyze():
+        ...     server = await AsyncServer().boot()
+        ...     with server.add_synthdefs(synthdef := builder.build()):
+        ...         synth = server.add_synth(synthdef)
+        ...     with ReplyStream(server, synth, 7, channel_count=2) as stream:
+        ...         async for block in stream:
+        ...             print(block.mean(axis=0))
+        ...
+
+    Requires NumPy.
+
+    :param server: The server receiving replies.
+    :param node: The node sending replies.
+    :param reply_id: The ``SendReply`` reply ID.
+    :param channel_count: The number of values per reply.
+    :param capacity: The number of replies held before the oldest are overwritten.
+    :param block_size: The number of replies per block when iterating.
+    :param address: The ``SendReply`` command name.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        server: BaseServer,
+        node: Node,
+        reply_id: int = -1,
+        *,
+        channel_count: int = 1,
+        capacity: int = 4096,
+        block_size: int = 64,
+        address: str = "/reply",
+    ) -> None:
+        import numpy
+
+        if channel_count < 1:
+            raise ValueError(channel_count)
+        if not 0 < block_size <= capacity:
+            raise ValueError(block_size)
+        self._address = address
+        self._array = numpy.zeros((capacity, channel_count), dtype=numpy.float32)
+        self._async_event: Optional[asyncio.Event] = None
+        self._block_size = block_size
+        self._capacity = capacity
+        self._channel_count = channel_count
+        # the next reply's block boundary, for waking iterators once per block
+        self._next_block_count = block_size
+        self._key = (address.encode(), node.id_, reply_id)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._node = node
+        self._overrun_count = 0
+        self._remove_on_end: Optional[Callable[[], None]] = None
+        self._reply_count = 0
+        self._reply_id = reply_id
+        self._server = server
+
+    ### SPECIAL METHODS ###
+
+    def __aiter__(self) -> AsyncIterator["numpy.ndarray"]:
+        return self.blocks()
+
+    def __enter__(self) -> "ReplyStream":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ### PRIVATE METHODS ###
+
+    def _append(self, values: Sequence[float]) -> None:
+        # only ever called from the server's OSC receive path, so single-writer
+        self._array[self._reply_count % self._capacity] = values
+        self._reply_count += 1
+        if self._reply_count >= self._next_block_count:
+            self._next_block_count = self._reply_count + self._block_size
+            self._wake()
+
+    def _read(self, start: int, count: int) -> "numpy.ndarray":
+        import numpy
+
+        index = start % self._capacity
+        if index + count <= self._capacity:
+            return self._array[index : index + count].copy()
+        return numpy.concatenate(
+            (self._array[index:], self._array[: index + count - self._capacity])
+        )
+
+    def _wake(self) -> None:
+        if self._loop is not None and self._async_event is not None:
+            self._loop.call_soon_threadsafe(self._async_event.set)
+
+    ### PUBLIC METHODS ###
+
+    async def blocks(self) -> AsyncIterator["numpy.ndarray"]:
+        """
+        Iterate over consecutive blocks as ``(block_size, channel_count)`` arrays.
+
+        Blocks overwritten before being read are skipped, counting towards
+        :py:attr:`overrun_count`. Iteration ends when the stream stops.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._async_event = event = asyncio.Event()
+        block_size = self._block_size
+        read_count = self._reply_count - self._reply_count % block_size
+        while True:
+            while self._reply_count - read_count >= block_size:
+                # skip whole blocks until the oldest one still fully held
+                if (overrun := self._reply_count - self._capacity - read_count) > 0:
+                    skipped = -(-overrun // block_size) * block_size
+                    self._overrun_count += skipped
+                    read_count += skipped
+                    continue
+                block = self._read(read_count, block_size)
+                if self._reply_count - self._capacity > read_count:
+                    continue  # overwritten while copying
+                read_count += block_size
+                yield block
+            if not self.is_running:
+                return
+            event.clear()
+            await event.wait()
+
+    def latest(self, count: Optional[int] = None) -> "numpy.ndarray":
+        """
+        Get a copy of the most recent replies as a ``(count, channel_count)`` array.
+
+        :param count: The number of replies, defaulting to all held replies.
+        """
+        available = min(self._reply_count, self._capacity)
+        count = available if count is None else min(count, available)
+        return self._read(self._reply_count - count, count)
+
+    def start(self) -> "ReplyStream":
+        """
+        Start routing the node's replies into the stream.
+        """
+        if self._remove_on_end is not None:
+            return self
+        self._server._add_reply_stream(self)
+        self._remove_on_end = self._server.on_node_end(
+            self._node, lambda node_info: self.stop()
+        )
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop routing replies, ending iteration once buffered blocks are consumed.
+        """
+        if (remove_on_end := self._remove_on_end) is None:
+            return
+        self._remove_on_end = None
+        remove_on_end()
+        self._server._remove_reply_stream(self)
+        self._wake()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def address(self) -> str:
+        """
+        Get the stream's ``SendReply`` command name.
+        """
+        return self._address
+
+    @property
+    def capacity(self) -> int:
+        """
+        Get the number of replies held.
+        """
+        return self._capacity
+
+    @property
+    def channel_count(self) -> int:
+        """
+        Get the number of values per reply.
+        """
+        return self._channel_count
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Get the stream's running state.
+        """
+        return self._remove_on_end is not None
+
+    @property
+    def node(self) -> Node:
+        """
+        Get the node sending replies.
+        """
+        return self._node
+
+    @property
+    def overrun_count(self) -> int:
+        """
+        Get the number of replies overwritten before iteration could read them.
+        """
+        return self._overrun_count
+
+    @property
+    def reply_count(self) -> int:
+        """
+        Get the total number of replies received.
+        """
+        return self._reply_count
+
+    @property
+    def reply_id(self) -> int:
+        """
+        Get the stream's ``SendReply`` reply ID.
+        """
+        return self._reply_id
+
+
+@dataclasses.dataclass(frozen=True)
+class TelemetrySample:
+    """
+    A server's ``/status`` and the client's traffic counters at one moment.
+
+    Counters are cumulative since the server's OSC protocol was created.
+    """
+
+    timestamp: float
+    round_trip_time: float
+    actual_sample_rate: float
+    average_cpu_usage: float
+    group_count: int
+    peak_cpu_usage: float
+    synth_count: int
+    synthdef_count: int
+    target_sample_rate: float
+    ugen_count: int
+    bytes_received: int
+    bytes_sent: int
+    callback_seconds: float
+    datagrams_received: int
+    datagrams_sent: int
+
+    @property
+    def sample_rate_drift(self) -> float:
+        """
+        Get the actual sample rate's deviation from the target, as a ratio.
+        """
+        if not self.target_sample_rate:
+            return 0.0
+        return self.actual_sample_rate / self.target_sample_rate - 1.0
+
+
+class ServerTelemetry:
+    """
+    A sampler of server and client health metrics.
+
+    Each sample sends ``/status``, timing the round trip, and pairs the reply with
+    the client's OSC traffic counters. The most recent ``history`` samples are kept,
+    every sample is passed to subscribers, and the latest can be rendered as
+    Prometheus or OpenMetrics text for existing scrapers.
+
+    Sampling runs on a daemon thread for :py:class:`~supriya.contexts.realtime.Server`
+    and as a task on the running event loop for
+    :py:class:`~supriya.contexts.realtime.AsyncServer`.
+
+    ::
+
+        >>> from supriya.contexts import Server
+        >>> server = Server().boot()  # doctest: +SKIP
+        >>> telemetry = server.telemetry.start()  # doctest: +SKIP
+        >>> print(telemetry.export())  # doctest: +SKIP
+        # HELP supriya_server_cpu_average_percent Average DSP CPU usage.
+        # TYPE supriya_server_cpu_average_percent gauge
+        supriya_server_cpu_average_percent{server="127.0.0.1:57110"} 0.0521...
+        ...
+
+    :param server: The server to sample.
+    :param rate: The number of samples per second.
+    :param history: The number of samples kept.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self, server: BaseServer, rate: float = 1.0, history: int = 600
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(rate)
+        if history < 1:
+            raise ValueError(history)
+        self._lock = threading.RLock()
+        self._rate = float(rate)
+        self._samples: Deque[TelemetrySample] = collections.deque(maxlen=history)
+        self._server = server
+        self._stop_event = threading.Event()
+        self._subscription_ids = itertools.count()
+        self._subscriptions: Dict[int, Callable[[TelemetrySample], None]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "ServerTelemetry":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ### PRIVATE METHODS ###
+
+    def _get_metrics(
+        self,
+    ) -> List[Tuple[str, str, str, List[Tuple[str, str, float]]]]:
+        # (name, type, help, [(suffix, labels, value), ...]), names without _total
+        metrics: List[Tuple[str, str, str, List[Tuple[str, str, float]]]] = []
+        if (sample := self.latest) is not None:
+            metrics.extend(
+                (
+                    name,
+                    type_,
+                    help_,
+                    [("_total" if type_ == "counter" else "", "", value)],
+                )
+                for name, type_, help_, value in self._get_sample_metrics(sample)
+            )
+        metrics.append(
+            (
+                "supriya_client_latency_seconds",
+                "gauge",
+                "Latency applied to timestamped bundles.",
+                [("", "", self._server.latency)],
+            )
+        )
+        if (controller := self._server._latency_controller) is not None:
+            metrics.extend(
+                [
+                    (
+                        "supriya_client_latency_demand_seconds",
+                        "gauge",
+                        "Latency estimated as needed by the latency controller.",
+                        [("", "", controller.demand or math.nan)],
+                    ),
+                    (
+                        "supriya_client_latency_changes",
+                        "counter",
+                        "Latency changes applied by the latency controller.",
+                        [("_total", "", controller.change_count)],
+                    ),
+                ]
+            )
+        if (late_monitor := self._server._late_monitor) is not None:
+            quantiles = late_monitor.percentiles(*LATE_QUANTILES)
+            metrics.append(
+                (
+                    "supriya_server_late_seconds",
+                    "summary",
+                    "Lateness of bundles reaching the server after their time.",
+                    [
+                        ("", f',quantile="{quantile}"', value)
+                        for quantile, value in quantiles.items()
+                    ]
+                    + [
+                        ("_sum", "", late_monitor.total),
+                        ("_count", "", late_monitor.count),
+                    ],
+                )
+            )
+        return metrics
+
+    def _get_sample_metrics(
+        self, sample: TelemetrySample
+    ) -> List[Tuple[str, str, str, float]]:
+        return [
+            (
+                "supriya_server_cpu_average_percent",
+                "gauge",
+                "Average DSP CPU usage.",
+                sample.average_cpu_usage,
+            ),
+            (
+                "supriya_server_cpu_peak_percent",
+                "gauge",
+                "Peak DSP CPU usage.",
+                sample.peak_cpu_usage,
+            ),
+            (
+                "supriya_server_groups",
+                "gauge",
+                "Groups on the server.",
+                sample.group_count,
+            ),
+            (
+                "supriya_server_synths",
+                "gauge",
+                "Synths on the server.",
+                sample.synth_count,
+            ),
+            (
+                "supriya_server_synthdefs",
+                "gauge",
+                "SynthDefs loaded on the server.",
+                sample.synthdef_count,
+            ),
+            (
+                "supriya_server_ugens",
+                "gauge",
+                "UGens running on the server.",
+                sample.ugen_count,
+            ),
+            (
+                "supriya_server_sample_rate_hertz",
+                "gauge",
+                "Actual sample rate.",
+                sample.actual_sample_rate,
+            ),
+            (
+                "supriya_server_sample_rate_drift_ratio",
+                "gauge",
+                "Deviation of the actual sample rate from the target.",
+                sample.sample_rate_drift,
+            ),
+            (
+                "supriya_server_round_trip_seconds",
+                "gauge",
+                "Round-trip time of the latest /status request.",
+                sample.round_trip_time,
+            ),
+            (
+                "supriya_client_received_bytes",
+                "counter",
+                "Bytes received from the server.",
+                sample.bytes_received,
+            ),
+            (
+                "supriya_client_received_datagrams",
+                "counter",
+                "Datagrams received from the server.",
+                sample.datagrams_received,
+            ),
+            (
+                "supriya_client_sent_bytes",
+                "counter",
+                "Bytes sent to the server.",
+                sample.bytes_sent,
+            ),
+            (
+                "supriya_client_sent_datagrams",
+                "counter",
+                "Datagrams sent to the server.",
+                sample.datagrams_sent,
+            ),
+            (
+                "supriya_client_callback_seconds",
+                "counter",
+                "Time spent handling received datagrams.",
+                sample.callback_seconds,
+            ),
+        ]
+
+    def _record(
+        self, status: Optional[StatusInfo], round_trip_time: float
+    ) -> Optional[TelemetrySample]:
+        if status is None:
+            return None
+        osc_protocol = self._server.osc_protocol
+        sample = TelemetrySample(
+            timestamp=time.time(),
+            round_trip_time=round_trip_time,
+            actual_sample_rate=status.actual_sample_rate,
+            average_cpu_usage=status.average_cpu_usage,
+            group_count=status.group_count,
+            peak_cpu_usage=status.peak_cpu_usage,
+            synth_count=status.synth_count,
+            synthdef_count=status.synthdef_count,
+            target_sample_rate=status.target_sample_rate,
+            ugen_count=status.ugen_count,
+            bytes_received=osc_protocol.bytes_received,
+            bytes_sent=osc_protocol.bytes_sent,
+            callback_seconds=osc_protocol.callback_seconds,
+            datagrams_received=osc_protocol.datagrams_received,
+            datagrams_sent=osc_protocol.datagrams_sent,
+        )
+        with self._lock:
+            self._samples.append(sample)
+            callbacks = list(self._subscriptions.values())
+        for callback in callbacks:
+            try:
+                callback(sample)
+            except Exception:
+                logger.exception("Telemetry subscriber raised")
+        return sample
+
+    async def _run_async(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            if self._server.boot_status == BootStatus.ONLINE:
+                try:
+                    await cast(Awaitable[Optional[TelemetrySample]], self.sample())
+                except (asyncio.TimeoutError, ContextError):
+                    pass
+                except Exception:
+                    logger.exception("Telemetry sample failed")
+            await asyncio.sleep(1 / self._rate)
+
+    def _run_threaded(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            if self._server.boot_status == BootStatus.ONLINE:
+                try:
+                    self.sample()
+                except (concurrent.futures.TimeoutError, ContextError):
+                    pass
+                except Exception:
+                    logger.exception("Telemetry sample failed")
+            stop_event.wait(1 / self._rate)
+
+    async def _sample_async(self) -> Optional[TelemetrySample]:
+        start_time = time.perf_counter()
+        status = await cast(AsyncServer, self._server).query_status()
+        return self._record(status, time.perf_counter() - start_time)
+
+    def _unsubscribe(self, subscription_id: int) -> None:
+        with self._lock:
+            self._subscriptions.pop(subscription_id, None)
+
+    ### PUBLIC METHODS ###
+
+    def export(self, openmetrics: bool = False) -> str:
+        """
+        Render the latest sample in the Prometheus text exposition format.
+
+        Every metric is labelled with the server's address. Late bundle reports, if
+        the server's late monitor is in use, are rendered as a summary, and the
+        latency controller's demand and changes, if one is running, as a gauge and
+        counter.
+
+        :param openmetrics: Flag for rendering OpenMetrics text instead, which names
+            counter families without their ``_total`` suffix and ends with
+            ``# EOF``.
+        """
+        options = self._server.options
+        server = f"{options.ip_address}:{options.port}".replace("\\", "\\\\")
+        server = server.replace('"', '\\"').replace("\n", "\\n")
+        lines: List[str] = []
+        for name, type_, help_, samples in self._get_metrics():
+            family = name if openmetrics or type_ != "counter" else f"{name}_total"
+            lines.append(f"# HELP {family} {help_}")
+            lines.append(f"# TYPE {family} {type_}")
+            for suffix, labels, value in samples:
+                lines.append(
+                    f'{name}{suffix}{{server="{server}"{labels}}} '
+                    + _format_metric_value(value)
+                )
+        if openmetrics:
+            lines.append("# EOF")
+        return "".join(f"{line}\n" for line in lines)
+
+    def sample(
+        self,
+    ) -> Union[Awaitable[Optional[TelemetrySample]], Optional[TelemetrySample]]:
+        """
+        Take a sample now and notify subscribers.
+
+        Emit ``/status`` requests.
+
+        Called automatically while the telemetry is running.
+        """
+        if isinstance(self._server, AsyncServer):
+            return self._sample_async()
+        start_time = time.perf_counter()
+        status = cast(Server, self._server).query_status()
+        return self._record(status, time.perf_counter() - start_time)
+
+    def start(self) -> "ServerTelemetry":
+        """
+        Start sampling.
+        """
+        if self._task is not None or self._thread is not None:
+            return self
+        self._stop_event = threading.Event()
+        if isinstance(self._server, AsyncServer):
+            self._task = asyncio.get_running_loop().create_task(
+                self._run_async(self._stop_event)
+            )
+        else:
+            self._thread = threading.Thread(
+                target=self._run_threaded, args=(self._stop_event,), daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop sampling, keeping samples taken so far.
+        """
+        self._stop_event.set()
+        if self._task is not None:
+            self._task.cancel()
+        self._task = self._thread = None
+
+    def subscribe(
+        self, callback: Callable[[TelemetrySample], None]
+    ) -> Callable[[], None]:
+        """
+        Subscribe to new samples.
+
+        Returns a callable which cancels the subscription.
+
+        :param callback: The callable to notify of each sample.
+        """
+        subscription_id = next(self._subscription_ids)
+        with self._lock:
+            self._subscriptions[subscription_id] = callback
+        return functools.partial(self._unsubscribe, subscription_id)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def history(self) -> List[TelemetrySample]:
+        """
+        Get the kept samples, oldest first.
+        """
+        with self._lock:
+            return list(self._samples)
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Get the telemetry's running state.
+        """
+        return self._task is not None or self._thread is not None
+
+    @property
+    def latest(self) -> Optional[TelemetrySample]:
+        """
+        Get the most recent sample, if any.
+        """
+        with self._lock:
+            return self._samples[-1] if self._samples else None
+
+    @property
+    def rate(self) -> float:
+        """
+        Get the number of samples per second.
+        """
+        return self._rate
+
+
+class LateMonitor:
+    """
+    An aggregator of late bundle reports from a server's scsynth output.
+
+    scsynth prints ``late <seconds>`` whenever a timestamped bundle arrives after its
+    scheduled time. Every report is counted, kept in a bounded window for
+    percentiles, and passed to subscribers and ``async for`` iterators.
+
+    Only servers booted by this process report late bundles.
+
+    ::
+
+        >>> from supriya.contexts import Server
+        >>> server = Server().boot()  # doctest: +SKIP
+        >>> server.late_monitor.percentiles(0.5, 0.99)  # doctest: +SKIP
+        {0.5: 0.0021, 0.99: 0.0153}
+
+    :param server: The server whose reports to aggregate.
+    :param history: The number of most recent reports kept for percentiles.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, server: BaseServer, history: int = 1024) -> None:
+        if history < 1:
+            raise ValueError(history)
+        self._count = 0
+        self._events: Deque[LateEvent] = collections.deque(maxlen=history)
+        self._lock = threading.RLock()
+        self._maximum = 0.0
+        self._server = server
+        self._subscription_ids = itertools.count()
+        self._subscriptions: Dict[int, Callable[[LateEvent], None]] = {}
+        self._total = 0.0
+
+    ### SPECIAL METHODS ###
+
+    def __aiter__(self) -> AsyncIterator[LateEvent]:
+        return self.events()
+
+    ### PRIVATE METHODS ###
+
+    def _record(self, event: LateEvent) -> None:
+        with self._lock:
+            self._count += 1
+            self._events.append(event)
+            self._maximum = max(self._maximum, event.lateness)
+            self._total += event.lateness
+            callbacks = list(self._subscriptions.values())
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Late monitor subscriber raised")
+
+    def _unsubscribe(self, subscription_id: int) -> None:
+        with self._lock:
+            self._subscriptions.pop(subscription_id, None)
+
+    ### PUBLIC METHODS ###
+
+    async def events(self) -> AsyncIterator[LateEvent]:
+        """
+        Iterate over late bundle reports as they arrive.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[LateEvent] = asyncio.Queue()
+        unsubscribe = self.subscribe(
+            lambda event: loop.call_soon_threadsafe(queue.put_nowait, event)
+        )
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+
+    def percentiles(self, *quantiles: float) -> Dict[float, float]:
+        """
+        Get lateness percentiles over the kept reports, interpolating linearly.
+
+        Percentiles are NaN until a report arrives.
+
+        :param quantiles: The quantiles to compute, between 0 and 1. Defaults to
+            the median, 90th and 99th percentiles.
+        """
+        if any(not 0 <= quantile <= 1 for quantile in quantiles):
+            raise ValueError(quantiles)
+        with self._lock:
+            latenesses = sorted(event.lateness for event in self._events)
+        percentiles: Dict[float, float] = {}
+        for quantile in quantiles or LATE_QUANTILES:
+            if not latenesses:
+                percentiles[quantile] = math.nan
+                continue
+            index, fraction = divmod(quantile * (len(latenesses) - 1), 1)
+            lower = latenesses[int(index)]
+            upper = latenesses[min(int(index) + 1, len(latenesses) - 1)]
+            percentiles[quantile] = lower + (upper - lower) * fraction
+        return percentiles
+
+    def reset(self) -> None:
+        """
+        Discard all reports and zero the counts.
+        """
+        with self._lock:
+            self._count = 0
+            self._events.clear()
+            self._maximum = self._total = 0.0
+
+    def subscribe(self, callback: Callable[[LateEvent], None]) -> Callable[[], None]:
+        """
+        Subscribe to late bundle reports.
+
+        Returns a callable which cancels the subscription.
+
+        :param callback: The callable to notify of each report.
+        """
+        subscription_id = next(self._subscription_ids)
+        with self._lock:
+            self._subscriptions[subscription_id] = callback
+        return functools.partial(self._unsubscribe, subscription_id)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def count(self) -> int:
+        """
+        Get the number of reports since the monitor was created or reset.
+        """
+        return self._count
+
+    @property
+    def history(self) -> List[LateEvent]:
+        """
+        Get the kept reports, oldest first.
+        """
+        with self._lock:
+            return list(self._events)
+
+    @property
+    def maximum(self) -> float:
+        """
+        Get the greatest lateness reported, in seconds.
+        """
+        return self._maximum
+
+    @property
+    def total(self) -> float:
+        """
+        Get the sum of all reported lateness, in seconds.
+        """
+        return self._total
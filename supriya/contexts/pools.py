@@ -0,0 +1,1096 @@
+"""
+Tools for pooling realtime server resources.
+"""
+
+import abc
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import dataclasses
+import heapq
+import itertools
+import threading
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    SupportsFloat,
+    SupportsInt,
+    Tuple,
+    cast,
+)
+
+try:
+    from typing import Literal
+except ImportError:
+    from typing_extensions import Literal
+
+from uqbar.objects import new
+
+from ..enums import AddAction, BootStatus
+from ..exceptions import ServerOffline
+from ..scsynth import Options
+from ..typing import AddActionLike
+from ..ugens import SynthDef
+from .entities import Buffer, Group, Node, Synth
+from .realtime import AsyncServer, BaseServer, Server
+from .responses import NodeInfo, StatusInfo
+
+# Estimated CPU usage percentage of a synth placed on a server without synths
+SERVER_POOL_CPU_USAGE_PER_SYNTH = 1.0
+
+
+class BaseBufferPool(metaclass=abc.ABCMeta):
+    """
+    Base class for pools of preallocated buffers sharing one shape.
+
+    Buffers are allocated in batches, each a single bundle of ``/b_alloc`` requests,
+    and become available as soon as their ``/done`` replies arrive, so acquiring an
+    available buffer costs no round trip. Released buffers are optionally zeroed and
+    return to the pool once their ``/b_zero`` completes. A pool which runs dry with
+    no buffers pending grows by another batch.
+
+    :param context: The server to allocate buffers on.
+    :param frame_count: The frame count of each buffer.
+    :param channel_count: The channel count of each buffer.
+    :param size: The number of buffers to allocate on creation.
+    :param growth_size: The number of buffers to allocate whenever the pool runs
+        dry, defaulting to ``size``.
+    :param zero_on_release: Flag for zeroing released buffers before reuse.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        context: BaseServer,
+        frame_count: int,
+        channel_count: int = 1,
+        size: int = 16,
+        *,
+        growth_size: Optional[int] = None,
+        zero_on_release: bool = True,
+    ) -> None:
+        if frame_count < 1:
+            raise ValueError(frame_count)
+        if channel_count < 1:
+            raise ValueError(channel_count)
+        if size < 0:
+            raise ValueError(size)
+        if (growth_size := growth_size or size) < 1:
+            raise ValueError(growth_size)
+        self._buffers: Dict[int, Buffer] = {}
+        self._channel_count = channel_count
+        self._condition = threading.Condition()
+        self._context = context
+        self._frame_count = frame_count
+        self._free: Deque[Buffer] = collections.deque()
+        self._growth_size = growth_size
+        self._high_water_mark = 0
+        self._in_use: Set[int] = set()
+        self._pending_count = 0
+        self._zero_on_release = zero_on_release
+        if size:
+            with self._condition:
+                self._grow(size)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, buffer: Buffer) -> bool:
+        return buffer.id_ in self._buffers
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    ### PRIVATE METHODS ###
+
+    def _grow(self, count: int) -> None:
+        # one bundle for the whole batch, with every /done watched before it's sent
+        with self._context.at():
+            for _ in range(count):
+                buffer = self._context.add_buffer(
+                    channel_count=self._channel_count, frame_count=self._frame_count
+                )
+                self._buffers[buffer.id_] = buffer
+                self._pending_count += 1
+                self._context._osc_protocol.register(
+                    pattern=["/done", "/b_alloc", buffer.id_],
+                    procedure=lambda message, buffer=buffer: self._recycle(buffer),
+                    once=True,
+                )
+
+    @abc.abstractmethod
+    def _on_recycle(self) -> None:
+        raise NotImplementedError
+
+    def _recycle(self, buffer: Buffer) -> None:
+        with self._condition:
+            # the pool may have been freed while the buffer was pending
+            if buffer.id_ not in self._buffers:
+                return
+            self._pending_count -= 1
+            self._free.append(buffer)
+            self._on_recycle()
+
+    def _take(self) -> Buffer:
+        buffer = self._free.popleft()
+        self._in_use.add(buffer.id_)
+        self._high_water_mark = max(self._high_water_mark, len(self._in_use))
+        return buffer
+
+    ### PUBLIC METHODS ###
+
+    def free(self) -> None:
+        """
+        Free every buffer in the pool, including any still acquired.
+
+        Emit ``/b_free`` requests.
+        """
+        with self._condition:
+            buffers = list(self._buffers.values())
+            self._buffers.clear()
+            self._free.clear()
+            self._in_use.clear()
+            self._pending_count = 0
+        if not buffers:
+            return
+        with self._context.at():
+            for buffer in buffers:
+                buffer.free()
+
+    def release(self, buffer: Buffer) -> None:
+        """
+        Return an acquired buffer to the pool.
+
+        Emit ``/b_zero`` requests if zeroing on release.
+
+        :param buffer: The buffer to release.
+        """
+        with self._condition:
+            if buffer.id_ not in self._in_use:
+                raise ValueError(buffer)
+            self._in_use.remove(buffer.id_)
+            self._pending_count += 1
+            if not self._zero_on_release:
+                self._recycle(buffer)
+                return
+            self._context._osc_protocol.register(
+                pattern=["/done", "/b_zero", buffer.id_],
+                procedure=lambda message: self._recycle(buffer),
+                once=True,
+            )
+        buffer.zero()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def channel_count(self) -> int:
+        """
+        Get the channel count of each buffer.
+        """
+        return self._channel_count
+
+    @property
+    def frame_count(self) -> int:
+        """
+        Get the frame count of each buffer.
+        """
+        return self._frame_count
+
+    @property
+    def free_count(self) -> int:
+        """
+        Get the number of buffers ready to be acquired.
+        """
+        return len(self._free)
+
+    @property
+    def high_water_mark(self) -> int:
+        """
+        Get the largest number of buffers ever acquired at once.
+        """
+        return self._high_water_mark
+
+    @property
+    def in_use_count(self) -> int:
+        """
+        Get the number of acquired buffers.
+        """
+        return len(self._in_use)
+
+    @property
+    def pending_count(self) -> int:
+        """
+        Get the number of buffers awaiting allocation or zeroing.
+        """
+        return self._pending_count
+
+
+class BufferPool(BaseBufferPool):
+    """
+    A thread-safe pool of preallocated buffers for
+    :py:class:`~supriya.contexts.realtime.Server`.
+
+    ::
+
+        >>> from supriya.contexts import BufferPool, Server
+        >>> server = Server().boot()  # doctest: +SKIP
+        >>> pool = BufferPool(server, frame_count=1024, size=64)  # doctest: +SKIP
+        >>> buffer = pool.acquire()  # doctest: +SKIP
+        >>> pool.release(buffer)  # doctest: +SKIP
+
+    :param context: The server to allocate buffers on.
+    :param frame_count: The frame count of each buffer.
+    :param channel_count: The channel count of each buffer.
+    :param size: The number of buffers to allocate on creation.
+    :param growth_size: The number of buffers to allocate whenever the pool runs
+        dry, defaulting to ``size``.
+    :param zero_on_release: Flag for zeroing released buffers before reuse.
+    """
+
+    ### PRIVATE METHODS ###
+
+    def _on_recycle(self) -> None:
+        self._condition.notify()
+
+    ### PUBLIC METHODS ###
+
+    def acquire(self, timeout: float = 1.0) -> Buffer:
+        """
+        Acquire a buffer from the pool.
+
+        Return immediately if a buffer is ready. Otherwise wait for a pending buffer,
+        growing the pool first if none are pending.
+
+        :param timeout: The number of seconds to wait for a buffer.
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while not self._free:
+                if not self._pending_count:
+                    self._grow(self._growth_size)
+                if not self._condition.wait(deadline - time.monotonic()):
+                    raise concurrent.futures.TimeoutError
+            return self._take()
+
+
+class AsyncBufferPool(BaseBufferPool):
+    """
+    An asyncio-safe pool of preallocated buffers for
+    :py:class:`~supriya.contexts.realtime.AsyncServer`.
+
+    ::
+
+        >>> from supriya.contexts import AsyncBufferPool, AsyncServer
+        >>> server = await AsyncServer().boot()  # doctest: +SKIP
+        >>> pool = AsyncBufferPool(server, frame_count=1024, size=64)  # doctest: +SKIP
+        >>> buffer = await pool.acquire()  # doctest: +SKIP
+        >>> pool.release(buffer)  # doctest: +SKIP
+
+    :param context: The server to allocate buffers on.
+    :param frame_count: The frame count of each buffer.
+    :param channel_count: The channel count of each buffer.
+    :param size: The number of buffers to allocate on creation.
+    :param growth_size: The number of buffers to allocate whenever the pool runs
+        dry, defaulting to ``size``.
+    :param zero_on_release: Flag for zeroing released buffers before reuse.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        context: AsyncServer,
+        frame_count: int,
+        channel_count: int = 1,
+        size: int = 16,
+        *,
+        growth_size: Optional[int] = None,
+        zero_on_release: bool = True,
+    ) -> None:
+        self._available = asyncio.Event()
+        super().__init__(
+            context,
+            frame_count,
+            channel_count,
+            size,
+            growth_size=growth_size,
+            zero_on_release=zero_on_release,
+        )
+
+    ### PRIVATE METHODS ###
+
+    def _on_recycle(self) -> None:
+        self._available.set()
+
+    ### PUBLIC METHODS ###
+
+    async def acquire(self, timeout: float = 1.0) -> Buffer:
+        """
+        Acquire a buffer from the pool.
+
+        Return without suspending if a buffer is ready. Otherwise wait for a pending
+        buffer, growing the pool first if none are pending.
+
+        :param timeout: The number of seconds to wait for a buffer.
+        """
+        deadline = time.monotonic() + timeout
+        while not self._free:
+            with self._condition:
+                if not self._pending_count:
+                    self._grow(self._growth_size)
+            self._available.clear()
+            await asyncio.wait_for(
+                self._available.wait(), timeout=max(0.0, deadline - time.monotonic())
+            )
+        with self._condition:
+            return self._take()
+
+
+@dataclasses.dataclass(eq=False)
+class Voice:
+    """
+    A single activation of a :py:class:`VoicePool` voice.
+
+    :param pool: The voice's pool.
+    :param synth: The synth sounding the voice.
+    :param settings: The settings the voice was activated with.
+    """
+
+    pool: "VoicePool"
+    synth: Synth
+    settings: Dict[str, SupportsFloat]
+
+    def release(self) -> None:
+        """
+        Release the voice.
+
+        Emit ``/n_set <synth.id_> gate 0`` requests.
+        """
+        self.pool.release(self)
+
+    @property
+    def is_active(self) -> bool:
+        """
+        Get whether the voice is still sounding and not yet released.
+        """
+        return self.pool._active.get(self.synth.id_) is self
+
+
+class VoicePool:
+    """
+    A pool of preallocated, paused synths sharing one synthdef.
+
+    Every synth is spawned up front into the pool's own group with ``/s_new`` and
+    immediately paused with ``/n_run``, all in a single bundle. Activating a voice
+    sends one bundle of ``/n_set`` and ``/n_run`` to an idle synth, and releasing
+    it sets its gate to zero.
+
+    Voices return to the pool by themselves: a synthdef whose envelope ends with
+    :py:attr:`~supriya.enums.DoneAction.PAUSE_SYNTH` is reused directly when its
+    ``/n_off`` arrives, while one ending with
+    :py:attr:`~supriya.enums.DoneAction.FREE_SYNTH` is replaced by a freshly spawned
+    paused synth when its ``/n_end`` arrives.
+
+    When every voice is busy, activating steals one: the oldest releasing voice if
+    any, otherwise the oldest, quietest or lowest active voice depending on
+    ``stealing``. A stolen voice is freed and a new synth started in its place.
+
+    ::
+
+        >>> from supriya import default
+        >>> from supriya.contexts import Server, VoicePool
+        >>> server = Server().boot()  # doctest: +SKIP
+        >>> pool = VoicePool(server, default, size=32)  # doctest: +SKIP
+        >>> voice = pool.activate(frequency=440, amplitude=0.2)  # doctest: +SKIP
+        >>> voice.release()  # doctest: +SKIP
+
+    :param context: The server to spawn synths on.
+    :param synthdef: The synthdef of every voice.
+    :param size: The number of voices.
+    :param add_action: The add action of the pool's group.
+    :param target_node: The target of the pool's group.
+    :param stealing: The policy for picking an active voice to steal.
+    :param amplitude_control: The control compared when stealing the quietest voice.
+    :param frequency_control: The control compared when stealing the lowest voice.
+    :param gate_control: The control opened on activation and closed on release.
+    :param settings: Default settings for every voice.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        context: BaseServer,
+        synthdef: SynthDef,
+        size: int = 16,
+        *,
+        add_action: AddActionLike = AddAction.ADD_TO_HEAD,
+        target_node: Optional[Node] = None,
+        stealing: Literal["oldest", "quietest", "lowest"] = "oldest",
+        amplitude_control: str = "amplitude",
+        frequency_control: str = "frequency",
+        gate_control: str = "gate",
+        **settings: SupportsFloat,
+    ) -> None:
+        if size < 1:
+            raise ValueError(size)
+        if stealing not in ("oldest", "quietest", "lowest"):
+            raise ValueError(stealing)
+        self._active: collections.OrderedDict[int, Voice] = collections.OrderedDict()
+        self._context = context
+        self._gate_control = (
+            gate_control if gate_control in synthdef.parameters else None
+        )
+        # voices ordered by loudness or pitch, invalidated lazily on steal
+        self._heap: List[Tuple[float, int, Voice]] = []
+        self._heap_counter = itertools.count()
+        self._idle: collections.OrderedDict[int, Synth] = collections.OrderedDict()
+        # /n_off replies expected from pausing freshly spawned synths
+        self._ignored_offs: Dict[int, int] = {}
+        self._lock = threading.RLock()
+        self._releasing: collections.OrderedDict[int, Voice] = collections.OrderedDict()
+        self._settings = settings
+        self._size = size
+        self._stealing = stealing
+        self._steal_control = {
+            "oldest": None,
+            "quietest": amplitude_control,
+            "lowest": frequency_control,
+        }[stealing]
+        self._steal_count = 0
+        self._synthdef = synthdef
+        self._synths: Dict[int, Synth] = {}
+        with self._lock, context.at():
+            self._group = context.add_group(
+                add_action=add_action, target_node=target_node
+            )
+            for _ in range(size):
+                self._spawn()
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self) -> int:
+        return self._size
+
+    ### PRIVATE METHODS ###
+
+    def _get_steal_key(self, voice: Voice) -> float:
+        name = cast(str, self._steal_control)
+        if name in voice.settings:
+            return float(voice.settings[name])
+        if name in self._synthdef.parameters:
+            return float(self._synthdef.parameters[name][0].value[0])
+        return 0.0
+
+    def _add_synth(self, **settings: SupportsFloat) -> Synth:
+        synth = self._group.add_synth(self._synthdef, **settings)
+        # dispatched by node ID, rather than matching every /n_end and /n_off
+        self._context.on_node_end(synth, self._on_n_end)
+        self._context.on_node_off(synth, self._on_n_off)
+        self._synths[synth.id_] = synth
+        return synth
+
+    def _on_n_end(self, node_info: NodeInfo) -> None:
+        node_id = node_info.node_id
+        with self._lock:
+            if self._synths.pop(node_id, None) is None:
+                return
+            self._active.pop(node_id, None)
+            self._idle.pop(node_id, None)
+            self._ignored_offs.pop(node_id, None)
+            self._releasing.pop(node_id, None)
+            # keep the pool at full strength, e.g. after DoneAction.FREE_SYNTH
+            with self._context.at():
+                self._spawn()
+
+    def _on_n_off(self, node_info: NodeInfo) -> None:
+        node_id = node_info.node_id
+        with self._lock:
+            if (synth := self._synths.get(node_id)) is None:
+                return
+            self._context.on_node_off(synth, self._on_n_off)
+            if ignored := self._ignored_offs.get(node_id):
+                if ignored > 1:
+                    self._ignored_offs[node_id] = ignored - 1
+                else:
+                    del self._ignored_offs[node_id]
+                return
+            # paused itself, e.g. via DoneAction.PAUSE_SYNTH
+            if (
+                self._active.pop(node_id, None) is None
+                and self._releasing.pop(node_id, None) is None
+            ):
+                return
+            self._idle[node_id] = synth
+
+    def _spawn(self) -> Synth:
+        synth = self._add_synth(**self._settings)
+        synth.pause()
+        self._ignored_offs[synth.id_] = 1
+        self._idle[synth.id_] = synth
+        return synth
+
+    def _steal(self) -> Voice:
+        if self._releasing:
+            return self._releasing.popitem(last=False)[1]
+        if self._steal_control is None:
+            return self._active.popitem(last=False)[1]
+        while True:
+            _, _, voice = heapq.heappop(self._heap)
+            if self._active.get(voice.synth.id_) is voice:
+                del self._active[voice.synth.id_]
+                return voice
+
+    ### PUBLIC METHODS ###
+
+    def activate(self, **settings: SupportsFloat) -> Voice:
+        """
+        Activate a voice.
+
+        Emit ``/n_set`` and ``/n_run`` requests for an idle voice, or ``/n_free`` and
+        ``/s_new`` requests when stealing a busy one.
+
+        :param settings: The voice's settings.
+        """
+        with self._lock, self._context.at():
+            if self._idle:
+                synth = self._idle.popitem(last=False)[1]
+                if self._gate_control:
+                    settings = {self._gate_control: 1, **settings}
+                synth.set(**settings)
+                synth.unpause()
+            else:
+                stolen = self._steal()
+                self._steal_count += 1
+                del self._synths[stolen.synth.id_]
+                stolen.synth.free(force=True)
+                synth = self._add_synth(**{**self._settings, **settings})
+            voice = Voice(pool=self, synth=synth, settings=settings)
+            self._active[synth.id_] = voice
+            if self._steal_control is not None:
+                heapq.heappush(
+                    self._heap,
+                    (self._get_steal_key(voice), next(self._heap_counter), voice),
+                )
+                # drop stale entries before they outnumber live ones
+                if len(self._heap) > 2 * self._size:
+                    self._heap = [
+                        entry
+                        for entry in self._heap
+                        if self._active.get(entry[2].synth.id_) is entry[2]
+                    ]
+                    heapq.heapify(self._heap)
+        return voice
+
+    def free(self) -> None:
+        """
+        Free the pool's group and every voice in it.
+
+        Emit ``/n_free`` requests.
+        """
+        with self._lock:
+            # per-node callbacks become no-ops, and go when their synths end
+            for mapping in (
+                self._active,
+                self._idle,
+                self._ignored_offs,
+                self._releasing,
+                self._synths,
+            ):
+                mapping.clear()
+            self._heap.clear()
+        self._group.free()
+
+    def release(self, voice: Voice) -> None:
+        """
+        Release a voice.
+
+        Emit ``/n_set <synth.id_> gate 0`` requests. Releasing a voice which was
+        already released or stolen does nothing.
+
+        :param voice: The voice to release.
+        """
+        with self._lock:
+            if self._active.get(voice.synth.id_) is not voice:
+                return
+            del self._active[voice.synth.id_]
+            self._releasing[voice.synth.id_] = voice
+            if self._gate_control:
+                voice.synth.set(**{self._gate_control: 0})
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def active_count(self) -> int:
+        """
+        Get the number of sounding, unreleased voices.
+        """
+        return len(self._active)
+
+    @property
+    def group(self) -> Group:
+        """
+        Get the pool's group.
+        """
+        return self._group
+
+    @property
+    def idle_count(self) -> int:
+        """
+        Get the number of voices ready to activate without stealing.
+        """
+        return len(self._idle)
+
+    @property
+    def releasing_count(self) -> int:
+        """
+        Get the number of released voices still sounding.
+        """
+        return len(self._releasing)
+
+    @property
+    def steal_count(self) -> int:
+        """
+        Get the number of voices stolen so far.
+        """
+        return self._steal_count
+
+    @property
+    def stealing(self) -> str:
+        """
+        Get the voice stealing policy.
+        """
+        return self._stealing
+
+
+class BaseServerPool:
+    """
+    Base class for pools of realtime servers sharing one workload.
+
+    Member servers listen on consecutive ports and allocate temporary node IDs from
+    disjoint ranges, so any node ID identifies the server it lives on. New nodes
+    are placed on the least-loaded online server, judged by each server's latest
+    ``/status`` reply: its average CPU usage, extrapolated over synths placed since
+    that reply, then its synth count. Returned nodes belong to their server, so
+    controlling or freeing them needs no routing.
+
+    :param count: The number of servers.
+    :param options: The options shared by every server. Each server ``i`` listens
+        on ``options.port + i``.
+    :param name: The pool's name, prefixing each server's name.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### CLASS VARIABLES ###
+
+    _server_class: type = BaseServer
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        count: int = 2,
+        options: Optional[Options] = None,
+        name: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        if count < 1:
+            raise ValueError(count)
+        options = new(options or Options(), **kwargs)
+        stride = (options.maximum_node_id + 1 - options.initial_node_id) // count
+        self._lock = threading.Lock()
+        # placements since each server's last seen /status reply
+        self._placements = [0] * count
+        self._servers: List[BaseServer] = [
+            self._server_class(
+                options=new(
+                    options,
+                    port=options.port + i,
+                    initial_node_id=options.initial_node_id + i * stride,
+                    maximum_node_id=options.initial_node_id + (i + 1) * stride - 1,
+                ),
+                name=f"{name}-{i}" if name else None,
+            )
+            for i in range(count)
+        ]
+        self._statuses: List[Optional[StatusInfo]] = [None] * count
+
+    ### SPECIAL METHODS ###
+
+    def __getitem__(self, index: int) -> BaseServer:
+        return self._servers[index]
+
+    def __iter__(self) -> Iterator[BaseServer]:
+        return iter(self._servers)
+
+    def __len__(self) -> int:
+        return len(self._servers)
+
+    ### PRIVATE METHODS ###
+
+    def _get_load(self, index: int) -> Tuple[float, int]:
+        # call with the lock held
+        if (status := self._servers[index].status) is not self._statuses[index]:
+            self._placements[index] = 0
+            self._statuses[index] = status
+        placements = self._placements[index]
+        if status is None:
+            return 0.0, placements
+        cpu_usage_per_synth = SERVER_POOL_CPU_USAGE_PER_SYNTH
+        if status.synth_count:
+            cpu_usage_per_synth = status.average_cpu_usage / status.synth_count
+        return (
+            status.average_cpu_usage + placements * cpu_usage_per_synth,
+            status.synth_count + placements,
+        )
+
+    def _resolve_server(
+        self, server: Optional[BaseServer], target_node: Optional[SupportsInt]
+    ) -> BaseServer:
+        if target_node is not None:
+            target_server = self.get_server(target_node)
+            if server is not None and server is not target_server:
+                raise ValueError(server, target_node)
+            return target_server
+        elif server is not None:
+            if server not in self._servers:
+                raise ValueError(server)
+            return server
+        return self.select_server()
+
+    ### PUBLIC METHODS ###
+
+    def add_group(
+        self,
+        *,
+        add_action: AddActionLike = AddAction.ADD_TO_HEAD,
+        target_node: Optional[SupportsInt] = None,
+        parallel: bool = False,
+        permanent: bool = False,
+        server: Optional[BaseServer] = None,
+    ) -> Group:
+        """
+        Add a new group node to the target's server, the given server, or the
+        least-loaded server.
+
+        Emit ``/g_new`` or ``/p_new`` requests depending on parameters.
+
+        :param add_action: The :term:`add action` to use when placing the new group.
+        :param target_node: The node to place the new group relative to.
+        :param parallel: Flag for parallel vs non-parallel groups.
+        :param permanent: Flag for using a permanent node ID.
+        :param server: The server to add the group to.
+        """
+        return self._resolve_server(server, target_node).add_group(
+            add_action=add_action,
+            target_node=target_node,
+            parallel=parallel,
+            permanent=permanent,
+        )
+
+    def add_synth(
+        self,
+        synthdef: SynthDef,
+        *,
+        add_action: AddActionLike = AddAction.ADD_TO_HEAD,
+        target_node: Optional[SupportsInt] = None,
+        permanent: bool = False,
+        server: Optional[BaseServer] = None,
+        use_control_indices: bool = False,
+        **settings,
+    ) -> Synth:
+        """
+        Add a new synth node to the target's server, the given server, or the
+        least-loaded server.
+
+        Emit ``/s_new`` requests.
+
+        :param synthdef: The :term:`SynthDef` to use for the new synth.
+        :param add_action: The :term:`add action` to use when placing the new synth.
+        :param target_node: The node to place the new synth relative to.
+        :param permanent: Flag for using a permanent node ID.
+        :param server: The server to add the synth to.
+        :param use_control_indices: Flag for addressing controls by index rather
+            than by name, producing smaller datagrams.
+        :param settings: The new synth's control settings.
+        """
+        return self._resolve_server(server, target_node).add_synth(
+            synthdef,
+            add_action=add_action,
+            target_node=target_node,
+            permanent=permanent,
+            use_control_indices=use_control_indices,
+            **settings,
+        )
+
+    @contextlib.contextmanager
+    def at(self, seconds: Optional[float] = None) -> Iterator["BaseServerPool"]:
+        """
+        Open a moment on every server.
+
+        Requests made on any server inside the moment are bundled per server with
+        the same timestamp, so the pool may be driven from clock callbacks like a
+        single server.
+
+        :param seconds: The timestamp of the new moments.
+        """
+        with contextlib.ExitStack() as stack:
+            for server in self._servers:
+                stack.enter_context(server.at(seconds))
+            yield self
+
+    def get_server(self, node: SupportsInt) -> BaseServer:
+        """
+        Get the server a node lives on.
+
+        Permanent node IDs are only resolved for nodes created by this pool.
+
+        :param node: The node or node ID.
+        """
+        if isinstance(node, Node) and node.context in self._servers:
+            return cast(BaseServer, node.context)
+        node_id = int(node) & 0x03FFFFFF
+        for server in self._servers:
+            if (
+                server.options.initial_node_id
+                <= node_id
+                <= server.options.maximum_node_id
+            ):
+                return server
+        raise ValueError(node)
+
+    def select_server(self) -> BaseServer:
+        """
+        Get the least-loaded online server, counting a placement against it.
+        """
+        with self._lock:
+            indices = [
+                index
+                for index, server in enumerate(self._servers)
+                if server.boot_status == BootStatus.ONLINE
+            ]
+            if not indices:
+                raise ServerOffline
+            index = min(indices, key=self._get_load)
+            self._placements[index] += 1
+        return self._servers[index]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def servers(self) -> List[BaseServer]:
+        """
+        Get the pool's servers.
+        """
+        return list(self._servers)
+
+
+class ServerPool(BaseServerPool):
+    """
+    A pool of :py:class:`~supriya.contexts.realtime.Server` instances sharing one
+    workload.
+
+    ::
+
+        >>> from supriya import default
+        >>> from supriya.contexts import ServerPool
+        >>> pool = ServerPool(count=4).boot()  # doctest: +SKIP
+        >>> pool.add_synthdefs(default)  # doctest: +SKIP
+        >>> synth = pool.add_synth(default, frequency=330)  # doctest: +SKIP
+        >>> synth.set(frequency=440)  # doctest: +SKIP
+        >>> pool.quit()  # doctest: +SKIP
+
+    :param count: The number of servers.
+    :param options: The options shared by every server. Each server ``i`` listens
+        on ``options.port + i``.
+    :param name: The pool's name, prefixing each server's name.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### CLASS VARIABLES ###
+
+    _server_class = Server
+
+    ### PRIVATE METHODS ###
+
+    def _map(self, procedure: Callable[[Server], object]) -> None:
+        with concurrent.futures.ThreadPoolExecutor(len(self._servers)) as executor:
+            futures = [
+                executor.submit(procedure, cast(Server, server))
+                for server in self._servers
+            ]
+        for future in futures:
+            future.result()
+
+    ### PUBLIC METHODS ###
+
+    def add_synthdefs(self, *synthdefs: SynthDef) -> "ServerPool":
+        """
+        Add one or more SynthDefs to every server, waiting until all have them.
+
+        Emit ``/d_recv`` and ``/sync`` requests.
+
+        :param synthdefs: The synthdefs to add.
+        """
+        # send everywhere first, so the servers load in parallel
+        for server in self._servers:
+            server.add_synthdefs(*synthdefs)
+        return self.sync()
+
+    def boot(self) -> "ServerPool":
+        """
+        Boot every server in parallel.
+
+        Servers which booted are quit again if any fails.
+        """
+        try:
+            self._map(Server.boot)
+        except Exception:
+            for server in self._servers:
+                if server.boot_status == BootStatus.ONLINE:
+                    cast(Server, server).quit()
+            raise
+        return self
+
+    def connect(self) -> "ServerPool":
+        """
+        Connect to every server in parallel.
+        """
+        self._map(Server.connect)
+        return self
+
+    def disconnect(self) -> "ServerPool":
+        """
+        Disconnect from every server.
+        """
+        self._map(Server.disconnect)
+        return self
+
+    def quit(self, force: bool = False) -> "ServerPool":
+        """
+        Quit every server.
+
+        :param force: Force quitting servers not owned by this process.
+        """
+        self._map(lambda server: server.quit(force=force))
+        return self
+
+    def sync(self, timeout: float = 1.0) -> "ServerPool":
+        """
+        Sync every server in parallel.
+
+        Emit ``/sync`` requests.
+
+        :param timeout: The number of seconds to wait for each sync.
+        """
+        self._map(lambda server: server.sync(timeout=timeout))
+        return self
+
+
+class AsyncServerPool(BaseServerPool):
+    """
+    A pool of :py:class:`~supriya.contexts.realtime.AsyncServer` instances sharing
+    one workload.
+
+    ::
+
+        >>> from supriya import default
+        >>> from supriya.contexts import AsyncServerPool
+        >>> pool = await AsyncServerPool(count=4).boot()  # doctest: +SKIP
+        >>> await pool.add_synthdefs(default)  # doctest: +SKIP
+        >>> synth = pool.add_synth(default, frequency=330)  # doctest: +SKIP
+
+    :param count: The number of servers.
+    :param options: The options shared by every server. Each server ``i`` listens
+        on ``options.port + i``.
+    :param name: The pool's name, prefixing each server's name.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### CLASS VARIABLES ###
+
+    _server_class = AsyncServer
+
+    ### PRIVATE METHODS ###
+
+    async def _map(self, procedure: Callable[[AsyncServer], Awaitable]) -> None:
+        await asyncio.gather(
+            *(procedure(cast(AsyncServer, server)) for server in self._servers)
+        )
+
+    ### PUBLIC METHODS ###
+
+    async def add_synthdefs(self, *synthdefs: SynthDef) -> "AsyncServerPool":
+        """
+        Add one or more SynthDefs to every server, waiting until all have them.
+
+        Emit ``/d_recv`` and ``/sync`` requests.
+
+        :param synthdefs: The synthdefs to add.
+        """
+        for server in self._servers:
+            server.add_synthdefs(*synthdefs)
+        return await self.sync()
+
+    async def boot(self) -> "AsyncServerPool":
+        """
+        Boot every server in parallel.
+
+        Servers which booted are quit again if any fails.
+        """
+        results = await asyncio.gather(
+            *(cast(AsyncServer, server).boot() for server in self._servers),
+            return_exceptions=True,
+        )
+        if errors := [result for result in results if isinstance(result, Exception)]:
+            await asyncio.gather(
+                *(
+                    cast(AsyncServer, server).quit()
+                    for server in self._servers
+                    if server.boot_status == BootStatus.ONLINE
+                )
+            )
+            raise errors[0]
+        return self
+
+    async def connect(self) -> "AsyncServerPool":
+        """
+        Connect to every server in parallel.
+        """
+        await self._map(AsyncServer.connect)
+        return self
+
+    async def disconnect(self) -> "AsyncServerPool":
+        """
+        Disconnect from every server.
+        """
+        await self._map(AsyncServer.disconnect)
+        return self
+
+    async def quit(self, force: bool = False) -> "AsyncServerPool":
+        """
+        Quit every server.
+
+        :param force: Force quitting servers not owned by this process.
+        """
+        await self._map(lambda server: server.quit(force=force))
+        return self
+
+    async def sync(self, timeout: float = 1.0) -> "AsyncServerPool":
+        """
+        Sync every server in parallel.
+
+        Emit ``/sync`` requests.
+
+        :param timeout: The number of seconds to wait for each sync.
+        """
+        await self._map(lambda server: server.sync(timeout=timeout))
+        return self
@@ -3,22 +3,34 @@ Tools for interacting with realtime execution contexts.
 """
 
 import asyncio
+import collections
 import concurrent.futures
+import contextvars
+import dataclasses
 import enum
+import ipaddress
+import itertools
 import logging
+import os
+import struct
+import tempfile
 import threading
 import warnings
 from collections.abc import Sequence as SequenceABC
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Callable,
+    Deque,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
     Set,
     SupportsInt,
+    Tuple,
     Type,
     Union,
     cast,
@@ -26,8 +38,7 @@ from typing import (
 
 from uqbar.objects import new
 
-from ..assets.synthdefs import system_synthdefs
-from ..enums import BootStatus, CalculationRate
+from ..enums import BootStatus, CalculationRate, NodeAction
 from ..exceptions import (
     OwnedServerShutdown,
     ServerCannotBoot,
@@ -36,18 +47,26 @@ from ..exceptions import (
     TooManyClients,
     UnownedServerShutdown,
 )
+from ..io import read_float_wav, write_float_wav
 from ..osc import (
     AsyncOscProtocol,
     HealthCheck,
     OscBundle,
+    OscCallback,
     OscMessage,
     OscProtocol,
     OscProtocolOffline,
     ThreadedOscProtocol,
 )
-from ..scsynth import AsyncProcessProtocol, Options, SyncProcessProtocol
+from ..scsynth import (
+    AsyncProcessProtocol,
+    LateEvent,
+    Options,
+    ProcessPool,
+    SyncProcessProtocol,
+)
 from ..typing import SupportsOsc
-from ..ugens import SynthDef
+from .allocators import BlockAllocator
 from .core import (
     Buffer,
     Bus,
@@ -58,8 +77,16 @@ from .core import (
     Node,
     Synth,
 )
+from .errors import ContextError
+from .manifests import BootManifest, ManifestResources
 from .requests import (
+    BUFFER_TRANSFER_CHUNK_SIZE,
+    AllocateReadBuffer,
+    ClearSchedule,
     DumpTree,
+    FreeAllSynthDefs,
+    FreeBuffer,
+    FreeGroupChildren,
     GetBuffer,
     GetBufferRange,
     GetControlBus,
@@ -72,8 +99,12 @@ from .requests import (
     QueryTree,
     QueryVersion,
     Quit,
+    Request,
+    RequestBundle,
     Sync,
+    ToggleErrorReporting,
     ToggleNotifications,
+    WriteBuffer,
 )
 from .responses import (
     BufferInfo,
@@ -88,12 +119,17 @@ from .responses import (
     NodeInfo,
     QueryTreeGroup,
     QueryTreeInfo,
+    Response,
     StatusInfo,
     VersionInfo,
 )
 
 if TYPE_CHECKING:
+    import numpy
+
     from ..realtime.shm import ServerSHM
+    from .latency import LatencyController
+    from .monitors import BusMonitor, LateMonitor, ReplyStream, ServerTelemetry
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +140,36 @@ class FailWarning(Warning):
 
 warnings.simplefilter("always", FailWarning)
 
+# Maximum chunked /b_getn requests awaiting replies at once
+BUFFER_TRANSFER_WINDOW = 8
+
+# IDs per batched /b_query or /c_get, keeping the single reply well under a datagram
+QUERY_BATCH_SIZE = 1024
+
+# Nodes per bundle of /n_query requests, as every node replies with its own /n_info
+QUERY_NODE_BATCH_SIZE = 32
+
+# Maximum batched query datagrams awaiting replies at once
+QUERY_BATCH_WINDOW = 4
+
+# Unpackers for reply payloads by type tag, compiled as new value counts appear
+_REPLY_DECODERS: Dict[bytes, struct.Struct] = {}
+
+# The sequence number of the last message each server sent from the current thread or
+# task, keyed by server ID. The mapping is replaced rather than mutated.
+_send_sequence_numbers: contextvars.ContextVar[Dict[int, int]] = contextvars.ContextVar(
+    "send_sequence_numbers", default={}
+)
+
+NodeCallback = Union[
+    Callable[[NodeInfo], None],
+    "asyncio.Future[NodeInfo]",
+    "concurrent.futures.Future[NodeInfo]",
+]
+
+# Number of scope buffers scsynth allocates in its shared memory segment
+SCOPE_BUFFER_COUNT = 128
+
 
 DEFAULT_HEALTHCHECK = HealthCheck(
     active=False,
@@ -132,6 +198,125 @@ class ServerLifecycleEvent(enum.Enum):
     QUIT = enum.auto()
 
 
+@dataclasses.dataclass
+class SyncBarrier:
+    """
+    A ``/sync`` shared by every caller whose requests were sent before it.
+
+    :param future: Resolved when the matching ``/synced`` arrives.
+    :param sequence_number: The send sequence number of the ``/sync`` itself, or
+        ``None`` until it has been sent.
+    """
+
+    future: Union["asyncio.Future[None]", "concurrent.futures.Future[None]"]
+    sequence_number: Optional[int] = None
+
+
+class NodeWatch:
+    """
+    A stream of node notifications for a group and everything beneath it.
+
+    Iterate with ``for`` from threads or ``async for`` from the event loop the watch
+    was created on. Iteration ends once the group itself ends, the watch is closed,
+    or the server quits.
+
+    :param context: The watched server.
+    :param group: The watched group.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, context: "BaseServer", group: Group) -> None:
+        self._async_event: Optional[asyncio.Event] = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._context = context
+        self._events: Deque[NodeInfo] = collections.deque()
+        self._group = group
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        try:
+            self._loop = asyncio.get_running_loop()
+            self._async_event = asyncio.Event()
+        except RuntimeError:
+            pass
+
+    ### SPECIAL METHODS ###
+
+    def __aiter__(self) -> "NodeWatch":
+        return self
+
+    async def __anext__(self) -> NodeInfo:
+        if self._async_event is None:
+            raise RuntimeError("watch was not created on an event loop")
+        while True:
+            with self._condition:
+                if self._events:
+                    return self._events.popleft()
+                if self._closed:
+                    raise StopAsyncIteration
+                self._async_event.clear()
+            await self._async_event.wait()
+
+    def __enter__(self) -> "NodeWatch":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[NodeInfo]:
+        return self
+
+    def __next__(self) -> NodeInfo:
+        with self._condition:
+            while not self._events:
+                if self._closed:
+                    raise StopIteration
+                self._condition.wait()
+            return self._events.popleft()
+
+    ### PRIVATE METHODS ###
+
+    def _put(self, node_info: Optional[NodeInfo]) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            if node_info is not None:
+                self._events.append(node_info)
+            if node_info is None or (
+                node_info.node_id == self._group.id_
+                and node_info.action == NodeAction.NODE_REMOVED
+            ):
+                self._closed = True
+            self._condition.notify_all()
+        if self._loop is not None and self._async_event is not None:
+            self._loop.call_soon_threadsafe(self._async_event.set)
+
+    ### PUBLIC METHODS ###
+
+    def close(self) -> None:
+        """
+        Stop watching, ending iteration once pending notifications are consumed.
+        """
+        self._context._remove_node_watch(self)
+        self._put(None)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def group(self) -> Group:
+        """
+        Get the watched group.
+        """
+        return self._group
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        Get whether the watch has stopped receiving notifications.
+        """
+        return self._closed
+
+
 class ServerShutdownEvent(enum.Enum):
     QUIT = enum.auto()
     DISCONNECT = enum.auto()
@@ -163,15 +348,34 @@ class BaseServer(Context):
         super().__init__(options, name=name, **kwargs)
         self._boot_status = BootStatus.OFFLINE
         self._buffers: Set[int] = set()
+        self._bus_monitor: Optional["BusMonitor"] = None
         self._is_owner = False
+        self._late_monitor: Optional["LateMonitor"] = None
         self._latency = 0.1
+        self._latency_controller: Optional["LatencyController"] = None
         self._lifecycle_event_callbacks: Dict[ServerLifecycleEvent, List[Callable]] = {}
+        self._manifest = BootManifest()
+        self._manifest_resources: Optional[ManifestResources] = None
         self._maximum_logins = 1
         self._node_active: Dict[int, bool] = {}
         self._node_children: Dict[int, List[int]] = {}
+        # per-node callbacks and futures, dispatched by ID from /n_go, /n_off and /n_end
+        self._node_end_callbacks: Dict[int, List[NodeCallback]] = {}
+        self._node_off_callbacks: Dict[int, List[NodeCallback]] = {}
         self._node_parents: Dict[int, int] = {}
+        self._node_start_callbacks: Dict[int, List[NodeCallback]] = {}
+        self._node_watches: Dict[int, List[NodeWatch]] = {}
+        self._next_sync_barrier: Optional[SyncBarrier] = None
+        self._reply_streams: Dict[Tuple[bytes, int, int], "ReplyStream"] = {}
+        self._send_counter = itertools.count(1)
+        self._send_lock = threading.Lock()
         self._shm: Optional["ServerSHM"] = None
+        # guards node and buffer state updated by OSC handlers
+        self._state_lock = threading.Lock()
         self._status: Optional[StatusInfo] = None
+        self._sync_barrier: Optional[SyncBarrier] = None
+        self._sync_barrier_lock = threading.Lock()
+        self._telemetry: Optional["ServerTelemetry"] = None
 
     ### SPECIAL METHODS ###
 
@@ -199,6 +403,53 @@ class BaseServer(Context):
 
     ### PRIVATE METHODS ###
 
+    def _abandon_sync_barrier(self, barrier: SyncBarrier) -> None:
+        # a lost /synced must not wedge every later caller behind this barrier
+        with self._sync_barrier_lock:
+            if self._sync_barrier is barrier:
+                self._promote_sync_barrier()
+
+    def _add_node_callback(
+        self,
+        callbacks: Dict[int, List[NodeCallback]],
+        node: Node,
+        callback: NodeCallback,
+    ) -> Callable[[], None]:
+        def remove() -> None:
+            with self._state_lock:
+                if callback in (node_callbacks := callbacks.get(node.id_, [])):
+                    node_callbacks.remove(callback)
+                    if not node_callbacks:
+                        callbacks.pop(node.id_)
+
+        with self._state_lock:
+            callbacks.setdefault(node.id_, []).append(callback)
+        return remove
+
+    def _add_node_future(
+        self,
+        callbacks: Dict[int, List[NodeCallback]],
+        node: Node,
+        future: Union[
+            "asyncio.Future[NodeInfo]", "concurrent.futures.Future[NodeInfo]"
+        ],
+        resolve_if_running: bool = False,
+    ) -> None:
+        with self._state_lock:
+            if resolve_if_running and node.id_ in self._node_parents:
+                future.set_result(self._get_node_info(node.id_))
+            else:
+                callbacks.setdefault(node.id_, []).append(future)
+
+    def _add_reply_stream(self, stream: "ReplyStream") -> None:
+        with self._state_lock:
+            if stream._key in self._reply_streams:
+                raise ContextError(f"Already streaming {stream._key!r}")
+            self._reply_streams[stream._key] = stream
+            self._osc_protocol.register_datagram_handler(
+                stream.address, self._handle_reply_datagram
+            )
+
     def _add_node_to_children(
         self, id_: int, parent_id: int, previous_id: int, next_id: int
     ) -> None:
@@ -213,28 +464,187 @@ class BaseServer(Context):
         elif next_id in children:
             children.insert(children.index(next_id), id_)
 
+    def _dispatch_node_event(
+        self,
+        message: OscMessage,
+        action: NodeAction,
+        callbacks: List[NodeCallback],
+        watches: List[NodeWatch],
+    ) -> None:
+        if not (callbacks or watches):
+            return
+        node_info = cast(NodeInfo, NodeInfo._from_osc(action, message))
+        for callback in callbacks:
+            if isinstance(callback, (asyncio.Future, concurrent.futures.Future)):
+                if not callback.done():
+                    callback.set_result(node_info)
+                continue
+            try:
+                callback(node_info)
+            except Exception:
+                logger.exception(self._log_prefix() + f"{callback!r} failed")
+        for watch in watches:
+            watch._put(node_info)
+
     def _free_id(
         self,
         type_: Type[ContextObject],
         id_: int,
         calculation_rate: Optional[CalculationRate] = None,
     ) -> None:
+        if self._free_batched_id(type_, id_, calculation_rate):
+            return
         self._get_allocator(type_, calculation_rate).free(id_)
 
+    def _get_buffer_array_path(self) -> Path:
+        ip_address = self._options.ip_address
+        try:
+            is_local = (
+                ip_address == "localhost"
+                or ipaddress.ip_address(ip_address).is_loopback
+            )
+        except ValueError:  # other hostnames may not resolve to this machine
+            is_local = False
+        if not is_local:
+            raise ContextError("File-backed buffer exchange requires a local server")
+        # Prefer tmpfs so the round trip never touches a disk
+        directory = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+        file_descriptor, path = tempfile.mkstemp(
+            prefix="supriya-", suffix=".wav", dir=directory
+        )
+        os.close(file_descriptor)
+        return Path(path)
+
+    @staticmethod
+    def _read_buffer_array(path: Path) -> "numpy.ndarray":
+        array, _ = read_float_wav(path)
+        if os.name == "nt":  # Mapped files cannot be unlinked on Windows
+            import numpy
+
+            array = numpy.array(array)
+        path.unlink()
+        return array
+
+    def _write_buffer_array(self, array: "numpy.ndarray") -> Path:
+        path = self._get_buffer_array_path()
+        sample_rate = self._options.sample_rate or (
+            self._status.target_sample_rate if self._status else 44100
+        )
+        write_float_wav(path, array, int(sample_rate))
+        return path
+
+    @staticmethod
+    def _get_buffer_range_requests(
+        buffer: Buffer, index: int, count: int
+    ) -> List[GetBufferRange]:
+        return [
+            GetBufferRange(
+                buffer_id=buffer,
+                items=[(i, min(BUFFER_TRANSFER_CHUNK_SIZE, index + count - i))],
+            )
+            for i in range(index, index + count, BUFFER_TRANSFER_CHUNK_SIZE)
+        ] or [GetBufferRange(buffer_id=buffer, items=[(index, count)])]
+
+    @staticmethod
+    def _join_buffer_range(
+        responses: Sequence[GetBufferRangeInfo], as_array: bool
+    ) -> Union[Sequence[float], "numpy.ndarray"]:
+        chunks = [response.items[0][-1] for response in responses]
+        if not as_array:
+            return tuple(itertools.chain.from_iterable(chunks))
+        import numpy
+
+        array = numpy.empty(sum(len(chunk) for chunk in chunks), dtype=numpy.float32)
+        offset = 0
+        for chunk in chunks:
+            array[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+        return array
+
+    def _get_node_info(self, id_: int) -> NodeInfo:
+        # rebuild an /n_go-style notification from the cached tree
+        parent_id = self._node_parents[id_]
+        previous_id = next_id = head_id = tail_id = -1
+        siblings = self._node_children.get(parent_id, [])
+        if id_ in siblings:
+            index = siblings.index(id_)
+            if index:
+                previous_id = siblings[index - 1]
+            if index + 1 < len(siblings):
+                next_id = siblings[index + 1]
+        if (children := self._node_children.get(id_)) is None:
+            return NodeInfo(
+                action=NodeAction.NODE_CREATED,
+                node_id=id_,
+                parent_id=parent_id,
+                previous_id=previous_id,
+                next_id=next_id,
+                is_group=False,
+            )
+        if children:
+            head_id, tail_id = children[0], children[-1]
+        return NodeInfo(
+            action=NodeAction.NODE_CREATED,
+            node_id=id_,
+            parent_id=parent_id,
+            previous_id=previous_id,
+            next_id=next_id,
+            is_group=True,
+            head_id=head_id,
+            tail_id=tail_id,
+        )
+
+    def _get_node_watches(self, id_: int) -> List[NodeWatch]:
+        # walk up the cached parentage, so only call with the state lock held
+        if not self._node_watches:
+            return []
+        watches: List[NodeWatch] = []
+        while id_ is not None:
+            watches.extend(self._node_watches.get(id_, ()))
+            id_ = self._node_parents.get(id_) if id_ else None
+        return watches
+
+    def _get_query_batches(
+        self, ids: Iterable[SupportsInt], batch_size: int
+    ) -> List[List[int]]:
+        unique_ids = list(dict.fromkeys(int(id_) for id_ in ids))
+        return [
+            unique_ids[i : i + batch_size]
+            for i in range(0, len(unique_ids), batch_size)
+        ]
+
+    def _get_sync_barrier(
+        self,
+        create_future: Callable[[], Union[asyncio.Future, concurrent.futures.Future]],
+    ) -> SyncBarrier:
+        with self._sync_barrier_lock:
+            if (barrier := self._sync_barrier) is None:
+                barrier = SyncBarrier(future=create_future())
+                self._send_sync_barrier(barrier)
+                self._sync_barrier = barrier
+                return barrier
+            # everything this caller sent went out before the in-flight /sync
+            sequence_number = _send_sequence_numbers.get().get(id(self), 0)
+            if sequence_number < cast(int, barrier.sequence_number):
+                return barrier
+            if self._next_sync_barrier is None:
+                self._next_sync_barrier = SyncBarrier(future=create_future())
+            return self._next_sync_barrier
+
     def _handle_done_b_alloc(self, message: OscMessage) -> None:
-        with self._lock:
+        with self._state_lock:
             self._buffers.add(message.contents[1])
 
     def _handle_done_b_alloc_read(self, message: OscMessage) -> None:
-        with self._lock:
+        with self._state_lock:
             self._buffers.add(message.contents[1])
 
     def _handle_done_b_alloc_read_channel(self, message: OscMessage) -> None:
-        with self._lock:
+        with self._state_lock:
             self._buffers.add(message.contents[1])
 
     def _handle_done_b_free(self, message: OscMessage) -> None:
-        with self._lock:
+        with self._state_lock:
             if message.contents[1] in self._buffers:
                 self._buffers.remove(message.contents[1])
             self._free_id(Buffer, message.contents[1])
@@ -242,9 +652,16 @@ class BaseServer(Context):
     def _handle_fail(self, message: OscMessage) -> None:
         warnings.warn(" ".join(str(x) for x in message.contents), FailWarning)
 
+    def _handle_late_event(self, event: LateEvent) -> None:
+        self.late_monitor._record(event)
+
     def _handle_n_end(self, message: OscMessage) -> None:
-        with self._lock:
+        with self._state_lock:
             id_, parent_id, *_ = message.contents
+            watches = self._get_node_watches(id_)
+            callbacks = self._node_end_callbacks.pop(id_, [])
+            self._node_off_callbacks.pop(id_, None)
+            self._node_watches.pop(id_, None)
             if parent_id == -1:
                 parent_id = self._node_parents.get(id_)
             if parent_id is not None:
@@ -252,39 +669,89 @@ class BaseServer(Context):
             self._free_id(Node, id_)
             self._node_active.pop(id_, None)
             self._node_children.pop(id_, None)
+            self._node_control_cache.pop(id_, None)
             self._node_parents.pop(id_, None)
+        self._dispatch_node_event(message, NodeAction.NODE_REMOVED, callbacks, watches)
 
     def _handle_n_go(self, message: OscMessage) -> None:
-        with self._lock:
+        with self._state_lock:
             id_, parent_id, previous_id, next_id, is_group, *_ = message.contents
             self._node_parents[id_] = parent_id
             self._node_active[id_] = True
             if is_group:
                 self._node_children[id_] = []
             self._add_node_to_children(id_, parent_id, previous_id, next_id)
+            callbacks = self._node_start_callbacks.pop(id_, [])
+            watches = self._get_node_watches(id_)
+        self._dispatch_node_event(message, NodeAction.NODE_CREATED, callbacks, watches)
 
     def _handle_n_move(self, message: OscMessage) -> None:
-        with self._lock:
+        with self._state_lock:
             id_, parent_id, previous_id, next_id, *_ = message.contents
             old_parent_id = self._node_parents[id_]
             self._remove_node_from_children(id_, old_parent_id)
             self._add_node_to_children(id_, parent_id, previous_id, next_id)
+            watches = self._get_node_watches(id_)
+        self._dispatch_node_event(message, NodeAction.NODE_MOVED, [], watches)
 
     def _handle_n_off(self, message: OscMessage) -> None:
-        with self._lock:
+        with self._state_lock:
             self._node_active[message.contents[0]] = False
+            callbacks = self._node_off_callbacks.pop(message.contents[0], [])
+            watches = self._get_node_watches(message.contents[0])
+        self._dispatch_node_event(
+            message, NodeAction.NODE_DEACTIVATED, callbacks, watches
+        )
 
     def _handle_n_on(self, message: OscMessage) -> None:
-        with self._lock:
+        with self._state_lock:
             self._node_active[message.contents[0]] = True
+            watches = self._get_node_watches(message.contents[0])
+        self._dispatch_node_event(message, NodeAction.NODE_ACTIVATED, [], watches)
+
+    def _handle_reply_datagram(self, datagram: bytes) -> bool:
+        # decode "<address> ,ii[f...] <node ID> <reply ID> [values...]" in one unpack
+        address_end = datagram.find(b"\x00")
+        tags_start = (address_end + 4) & ~3
+        if (tags_end := datagram.find(b"\x00", tags_start)) < 0:
+            return False
+        if (
+            decoder := _REPLY_DECODERS.get(tags := datagram[tags_start:tags_end])
+        ) is None:
+            if not tags.startswith(b",ii") or tags[3:].strip(b"f"):
+                return False
+            decoder = _REPLY_DECODERS[tags] = struct.Struct(
+                ">ii" + "f" * (len(tags) - 3)
+            )
+        try:
+            node_id, reply_id, *values = decoder.unpack_from(
+                datagram, (tags_end + 4) & ~3
+            )
+        except struct.error:  # truncated
+            return False
+        if (
+            stream := self._reply_streams.get(
+                (datagram[:address_end], node_id, reply_id)
+            )
+        ) is None or len(values) != stream.channel_count:
+            return False
+        stream._append(values)
+        return True
 
     def _handle_status_reply(self, message: OscMessage):
-        with self._lock:
+        with self._state_lock:
             self._status = cast(StatusInfo, StatusInfo.from_osc(message))
 
     def _log_prefix(self) -> str:
         return f"[{self._options.ip_address}:{self._options.port}/{self.name or hex(id(self))}] "
 
+    def _promote_sync_barrier(self) -> None:
+        barrier, self._next_sync_barrier = self._next_sync_barrier, None
+        self._sync_barrier = None
+        if barrier is not None:
+            self._send_sync_barrier(barrier)
+            self._sync_barrier = barrier
+
     def _remove_node_from_children(self, id_: int, parent_id: int) -> None:
         if not (children := self._node_children.get(parent_id, [])):
             return
@@ -293,11 +760,104 @@ class BaseServer(Context):
         except ValueError:
             pass
 
+    def _remove_node_watch(self, watch: NodeWatch) -> None:
+        with self._state_lock:
+            if watch in (watches := self._node_watches.get(watch.group.id_, [])):
+                watches.remove(watch)
+                if not watches:
+                    self._node_watches.pop(watch.group.id_)
+
+    def _remove_reply_stream(self, stream: "ReplyStream") -> None:
+        address = stream.address.encode()
+        with self._state_lock:
+            if self._reply_streams.get(key := stream._key) is stream:
+                self._reply_streams.pop(key)
+            if not any(key[0] == address for key in self._reply_streams):
+                self._osc_protocol.unregister_datagram_handler(stream.address)
+
     def _resolve_node(self, node: Union[Node, SupportsInt, None]) -> int:
         if node is None:
             return self._client_id + 1
         return int(node)
 
+    def _resolve_sync_barrier(self, barrier: SyncBarrier) -> None:
+        with self._sync_barrier_lock:
+            if self._sync_barrier is barrier:
+                self._promote_sync_barrier()
+        if not barrier.future.done():
+            barrier.future.set_result(None)
+
+    def _send(
+        self, message: Union[OscMessage, OscBundle, SupportsOsc, SequenceABC, str]
+    ) -> int:
+        if self._boot_status == BootStatus.OFFLINE:
+            raise ServerOffline
+        osc_protocol: OscProtocol = getattr(self, "_osc_protocol")
+        message = message.to_osc() if isinstance(message, SupportsOsc) else message
+        # numbered under the lock so numbers match the order on the wire
+        with self._send_lock:
+            sequence_number = next(self._send_counter)
+            osc_protocol.send(message)
+        return sequence_number
+
+    def _send_node_query_batch(
+        self,
+        node_ids: Sequence[int],
+        future: Union[
+            "asyncio.Future[Dict[int, NodeInfo]]",
+            "concurrent.futures.Future[Dict[int, NodeInfo]]",
+        ],
+    ) -> Tuple[OscCallback, OscCallback]:
+        # scsynth stops a multi-node /n_query at the first missing node, so query
+        # each node in its own message, and collect the /n_info replies until a
+        # trailing /sync in the same bundle is answered; a leading /error -1 keeps
+        # missing nodes from sending /fail replies for this bundle only
+        node_infos: Dict[int, NodeInfo] = {}
+        pending = set(node_ids)
+        sync_id = self._get_next_sync_id()
+
+        def on_node_info(message: OscMessage) -> None:
+            if message.contents[0] in pending:
+                node_infos[message.contents[0]] = cast(
+                    NodeInfo, Response.from_osc(message)
+                )
+
+        def on_synced(message: OscMessage) -> None:
+            self._osc_protocol.unregister(node_info_callback)
+            if not future.done():
+                future.set_result(node_infos)
+
+        node_info_callback = self._osc_protocol.register(
+            pattern=["/n_info"], procedure=on_node_info
+        )
+        synced_callback = self._osc_protocol.register(
+            pattern=["/synced", sync_id], procedure=on_synced, once=True
+        )
+        self.send(
+            OscBundle(
+                contents=[
+                    ToggleErrorReporting(code=-1).to_osc(),
+                    *(QueryNode(node_ids=[node_id]).to_osc() for node_id in node_ids),
+                    Sync(sync_id=sync_id).to_osc(),
+                ]
+            )
+        )
+        return node_info_callback, synced_callback
+
+    def _send_sync_barrier(self, barrier: SyncBarrier) -> None:
+        sync_id = self._get_next_sync_id()
+        self._osc_protocol.register(
+            pattern=["/synced", sync_id],
+            procedure=lambda message: self._resolve_sync_barrier(barrier),
+            once=True,
+        )
+        barrier.sequence_number = self._send(Sync(sync_id=sync_id))
+
+    def _setup_allocators(self) -> None:
+        super()._setup_allocators()
+        # shared memory scope buffers
+        self._scope_buffer_allocator = BlockAllocator(heap_maximum=SCOPE_BUFFER_COUNT)
+
     def _setup_osc_callbacks(self, osc_protocol: OscProtocol) -> None:
         for pattern, procedure in [
             (["/done", "/b_alloc"], self._handle_done_b_alloc),
@@ -319,30 +879,54 @@ class BaseServer(Context):
             from .shm import ServerSHM
 
             self._shm = ServerSHM(
-                self._options.port, self._options.control_bus_channel_count
+                self._options.port,
+                self._options.control_bus_channel_count,
+                SCOPE_BUFFER_COUNT,
             )
         except (ImportError, ModuleNotFoundError):
             pass
 
     def _setup_system(self) -> None:
-        self._node_children[0] = []
+        # one moment, so the permanent groups merge with the manifest's groups
         with self.at():
-            for i in range(self._maximum_logins):
-                self.add_group(permanent=True, add_action="ADD_TO_TAIL", target_node=0)
-        for name in dir(system_synthdefs):
-            synthdef = getattr(system_synthdefs, name)
-            if isinstance(synthdef, SynthDef):
-                with self.at():
-                    self.add_synthdefs(synthdef)
+            if self._client_id == 0:
+                self._node_children[0] = []
+                for i in range(self._maximum_logins):
+                    self.add_group(
+                        permanent=True, add_action="ADD_TO_TAIL", target_node=0
+                    )
+            self._manifest_resources = self._manifest._apply(
+                self, include_system_synthdefs=self._client_id == 0
+            )
 
     def _teardown_shm(self) -> None:
         self._shm = None
 
     def _teardown_state(self) -> None:
+        self._next_sync_barrier = self._sync_barrier = None
+        for callbacks in [
+            *self._node_end_callbacks.values(),
+            *self._node_off_callbacks.values(),
+            *self._node_start_callbacks.values(),
+        ]:
+            for callback in callbacks:
+                if isinstance(callback, (asyncio.Future, concurrent.futures.Future)):
+                    callback.cancel()
+        watches = [watch for xs in self._node_watches.values() for watch in xs]
+        for stream in list(self._reply_streams.values()):
+            stream.stop()
         self._node_active.clear()
         self._node_children.clear()
+        self._node_control_cache.clear()
+        self._node_end_callbacks.clear()
+        self._node_off_callbacks.clear()
         self._node_parents.clear()
+        self._node_start_callbacks.clear()
+        self._node_watches.clear()
+        for watch in watches:
+            watch._put(None)
         self._buffers.clear()
+        self._manifest_resources = None
 
     def _validate_can_request(self) -> None:
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
@@ -369,6 +953,45 @@ class BaseServer(Context):
             ):
                 callbacks.append(callback)
 
+    def on_node_end(
+        self, node: Node, callback: Callable[[NodeInfo], None]
+    ) -> Callable[[], None]:
+        """
+        Call ``callback`` with the node's next ``/n_end`` notification.
+
+        Callbacks are stored per node ID and dispatched directly by the server's own
+        notification handler, so no OSC callback is registered per node.
+
+        :param node: The node to watch.
+        :param callback: The callable to call.
+        :returns: A callable that removes the callback.
+        """
+        return self._add_node_callback(self._node_end_callbacks, node, callback)
+
+    def on_node_off(
+        self, node: Node, callback: Callable[[NodeInfo], None]
+    ) -> Callable[[], None]:
+        """
+        Call ``callback`` with the node's next ``/n_off`` notification.
+
+        :param node: The node to watch.
+        :param callback: The callable to call.
+        :returns: A callable that removes the callback.
+        """
+        return self._add_node_callback(self._node_off_callbacks, node, callback)
+
+    def on_node_start(
+        self, node: Node, callback: Callable[[NodeInfo], None]
+    ) -> Callable[[], None]:
+        """
+        Call ``callback`` with the node's next ``/n_go`` notification.
+
+        :param node: The node to watch.
+        :param callback: The callable to call.
+        :returns: A callable that removes the callback.
+        """
+        return self._add_node_callback(self._node_start_callbacks, node, callback)
+
     def send(
         self, message: Union[OscMessage, OscBundle, SupportsOsc, SequenceABC, str]
     ) -> None:
@@ -377,23 +1000,90 @@ class BaseServer(Context):
 
         :param message: The message to send.
         """
-        if self._boot_status == BootStatus.OFFLINE:
-            raise ServerOffline
-        osc_protocol: OscProtocol = getattr(self, "_osc_protocol")
-        osc_protocol.send(
-            message.to_osc() if isinstance(message, SupportsOsc) else message
+        sequence_number = self._send(message)
+        _send_sequence_numbers.set(
+            {**_send_sequence_numbers.get(), id(self): sequence_number}
         )
 
+    def set_bus(self, bus: Bus, value: float) -> None:
+        """
+        Set a control bus to a value.
+
+        Emit ``/c_set`` requests, or write shared memory directly on local servers
+        outside of a moment.
+
+        :param bus: The control bus to set.
+        :param value: The value to set the control bus to.
+        """
+        if (
+            self._shm is not None
+            and bus.calculation_rate == CalculationRate.CONTROL
+            and self._get_request_context() is None
+        ):
+            self._validate_can_request()
+            self._shm[bus.id_] = value
+            return
+        super().set_bus(bus, value)
+
+    def set_bus_range(self, bus: Bus, values: Sequence[float]) -> None:
+        """
+        Set a range of control buses.
+
+        Emit ``/c_setn`` requests, or write shared memory directly on local servers
+        outside of a moment.
+
+        :param bus: The bus to start writing at.
+        :param values: The values to write.
+        """
+        if (
+            self._shm is not None
+            and bus.calculation_rate == CalculationRate.CONTROL
+            and self._get_request_context() is None
+        ):
+            self._validate_can_request()
+            self._shm[bus.id_ : bus.id_ + len(values)] = values
+            return
+        super().set_bus_range(bus, values)
+
     def set_latency(self, latency: float) -> None:
         """
         Set the context's latency.
 
+        A running latency controller adapts from it.
+
         :param latency: The latency in seconds.
         """
         self._latency = float(latency)
 
+    def watch(self, group: Group) -> NodeWatch:
+        """
+        Watch node notifications for a group and everything beneath it.
+
+        Notifications already received are not replayed.
+
+        :param group: The group to watch.
+        """
+        watch = NodeWatch(self, group)
+        with self._state_lock:
+            self._node_watches.setdefault(group.id_, []).append(watch)
+        return watch
+
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def bus_monitor(self) -> "BusMonitor":
+        """
+        Get the server's shared control bus monitor.
+
+        Subscribe to it rather than polling buses individually, so any number of
+        observers share a single read per tick.
+        """
+        if self._bus_monitor is None:
+            from .monitors import BusMonitor
+
+            self._bus_monitor = BusMonitor(self)
+        return self._bus_monitor
+
     @property
     def default_group(self) -> Group:
         """
@@ -408,6 +1098,40 @@ class BaseServer(Context):
         """
         return self._is_owner
 
+    @property
+    def late_monitor(self) -> "LateMonitor":
+        """
+        Get the server's late bundle monitor.
+
+        Only servers booted by this process report late bundles.
+        """
+        if self._late_monitor is None:
+            from .monitors import LateMonitor
+
+            self._late_monitor = LateMonitor(self)
+        return self._late_monitor
+
+    @property
+    def latency_controller(self) -> Optional["LatencyController"]:
+        """
+        Get the server's running latency controller, if any.
+        """
+        return self._latency_controller
+
+    @property
+    def manifest(self) -> BootManifest:
+        """
+        Get the server's boot manifest.
+        """
+        return self._manifest
+
+    @property
+    def manifest_resources(self) -> Optional[ManifestResources]:
+        """
+        Get the buffers, buses and groups added by the server's boot manifest.
+        """
+        return self._manifest_resources
+
     @property
     def status(self) -> Optional[StatusInfo]:
         """
@@ -415,6 +1139,17 @@ class BaseServer(Context):
         """
         return self._status
 
+    @property
+    def telemetry(self) -> "ServerTelemetry":
+        """
+        Get the server's telemetry sampler.
+        """
+        if self._telemetry is None:
+            from .monitors import ServerTelemetry
+
+            self._telemetry = ServerTelemetry(self)
+        return self._telemetry
+
 
 class Server(BaseServer):
     """
@@ -448,26 +1183,64 @@ class Server(BaseServer):
                 ServerShutdownEvent.OSC_PANIC
             ),
         )
+        self._process_pool: Optional[ProcessPool] = None
         self._process_protocol = SyncProcessProtocol(
             name=name,
-            on_panic_callback=lambda: self._shutdown_future.set_result(
-                ServerShutdownEvent.PROCESS_PANIC
-            ),
+            on_late_callback=self._handle_late_event,
+            on_panic_callback=self._on_process_panic,
         )
         self._setup_osc_callbacks(self._osc_protocol)
 
     ### PRIVATE METHODS ###
 
-    def _lifecycle(self, owned=True) -> None:
+    def _communicate_windowed(
+        self, requests: Sequence[Request], window: int, timeout: float
+    ) -> List[Response]:
+        pending: Deque[Tuple[concurrent.futures.Future, OscCallback]] = (
+            collections.deque()
+        )
+        responses: List[Response] = []
+        try:
+            for request in requests:
+                if len(pending) >= window:
+                    responses.append(pending[0][0].result(timeout=timeout))
+                    pending.popleft()
+                pending.append(
+                    cast(
+                        Tuple[concurrent.futures.Future, OscCallback],
+                        request._communicate_future_and_callback(self),
+                    )
+                )
+            while pending:
+                responses.append(pending[0][0].result(timeout=timeout))
+                pending.popleft()
+        finally:
+            # don't leave callbacks registered for replies nobody awaits
+            for _, osc_callback in pending:
+                self._osc_protocol.unregister(osc_callback)
+        return responses
+
+    def _lifecycle(self, owned=True, pool: Optional[ProcessPool] = None) -> None:
         log_prefix = self._log_prefix()
         logger.info(log_prefix + "booting ...")
+        process_protocol = self._process_protocol
         if owned:
             self._on_lifecycle_event(ServerLifecycleEvent.BOOTING)
             try:
-                self._process_protocol.boot(self._options)
+                if pool is not None:
+                    self._process_protocol = pool.acquire(
+                        on_late_callback=self._handle_late_event,
+                        on_panic_callback=self._on_process_panic,
+                    )
+                    self._options = self._process_protocol.options
+                else:
+                    self._process_protocol.boot(self._options)
             except ServerCannotBoot:
                 self._on_lifecycle_event(ServerLifecycleEvent.PROCESS_PANICKED)
                 self._boot_status = BootStatus.OFFLINE
+                if not self._shutdown_future.done():
+                    # nothing else resolves it when no pooled process was acquired
+                    self._shutdown_future.set_result(ServerShutdownEvent.PROCESS_PANIC)
                 self._boot_future.set_result(False)
                 self._exit_future.set_result(False)
                 return
@@ -486,9 +1259,9 @@ class Server(BaseServer):
             self._contexts.add(self)
             self._osc_protocol.activate_healthcheck()
             self._setup_allocators()
-            if self._client_id == 0:
-                self._setup_system()
-                self.sync()
+            self._setup_system()
+            if self._client_id == 0 or not self._manifest.is_empty:
+                self.sync(timeout=self._manifest.timeout)
             if self._osc_protocol.boot_future.result():
                 self._boot_status = BootStatus.ONLINE
                 self._on_lifecycle_event(ServerLifecycleEvent.OSC_CONNECTED)
@@ -507,10 +1280,19 @@ class Server(BaseServer):
         if shutdown == ServerShutdownEvent.QUIT:
             logger.info(log_prefix + "quitting ...")
         self._boot_status = BootStatus.QUITTING
+        # only a pooled process reset without error may be lent out again
+        is_reusable = False
         if shutdown == ServerShutdownEvent.QUIT:
             try:
-                Quit().communicate(server=self, timeout=1)
-            except (OscProtocolOffline, asyncio.TimeoutError):
+                if pool is not None:
+                    is_reusable = self._reset_pooled_process()
+                else:
+                    Quit().communicate(server=self, timeout=1)
+            except (
+                OscProtocolOffline,
+                asyncio.TimeoutError,
+                concurrent.futures.TimeoutError,
+            ):
                 pass
         elif shutdown == ServerShutdownEvent.DISCONNECT:
             pass
@@ -535,7 +1317,15 @@ class Server(BaseServer):
             self._contexts.remove(self)
         logger.info(log_prefix + "disconnected!")
         self._on_lifecycle_event(ServerLifecycleEvent.DISCONNECTED)
-        if owned:
+        if owned and pool is not None:
+            pool.release(
+                cast(SyncProcessProtocol, self._process_protocol),
+                reusable=is_reusable,
+            )
+            self._process_protocol = process_protocol
+            if shutdown == ServerShutdownEvent.QUIT:
+                self._on_lifecycle_event(ServerLifecycleEvent.PROCESS_QUIT)
+        elif owned:
             self._process_protocol.quit()
             if shutdown == ServerShutdownEvent.QUIT:
                 self._on_lifecycle_event(ServerLifecycleEvent.PROCESS_QUIT)
@@ -556,6 +1346,21 @@ class Server(BaseServer):
         for callback in self._lifecycle_event_callbacks.get(event, []):
             callback(event)
 
+    def _on_process_panic(self) -> None:
+        self._shutdown_future.set_result(ServerShutdownEvent.PROCESS_PANIC)
+
+    def _reset_pooled_process(self) -> bool:
+        # leave the process as booted, for its next user
+        requests: List[Request] = [
+            ClearSchedule(),
+            FreeGroupChildren(node_ids=[0]),
+            FreeAllSynthDefs(),
+        ]
+        requests.extend(FreeBuffer(buffer_id=id_) for id_ in sorted(self._buffers))
+        self.send(RequestBundle(contents=requests))
+        response = ToggleNotifications(False).communicate(server=self, timeout=1)
+        return isinstance(response, DoneInfo)
+
     def _setup_notifications(self) -> None:
         logger.info(self._log_prefix() + "setting up notifications ...")
         response = ToggleNotifications(True).communicate(server=self)
@@ -578,23 +1383,40 @@ class Server(BaseServer):
 
     ### PUBLIC METHODS ###
 
-    def boot(self, *, options: Optional[Options] = None, **kwargs) -> "Server":
+    def boot(
+        self,
+        *,
+        manifest: Optional[BootManifest] = None,
+        options: Optional[Options] = None,
+        pool: Optional[ProcessPool] = None,
+        **kwargs,
+    ) -> "Server":
         """
         Boot the server.
 
+        With a process pool, attach to one of its already-booted processes instead
+        of spawning one, adopting the pool's options. Quitting resets the process
+        and returns it to the pool.
+
+        :param manifest: The boot manifest to apply, replacing the server's current
+            manifest, which is otherwise applied again.
         :param options: The context's options.
+        :param pool: The process pool to take a booted process from.
         :param kwargs: Keyword arguments for options.
         """
         if self._boot_status != BootStatus.OFFLINE:
             raise ServerOnline
         self._boot_status = BootStatus.BOOTING
+        if manifest is not None:
+            self._manifest = manifest
         self._options = new(options or self._options, **kwargs)
+        self._process_pool = pool
         self._boot_future = concurrent.futures.Future()
         self._exit_future = concurrent.futures.Future()
         self._shutdown_future = concurrent.futures.Future()
         self._lifecycle_thread = threading.Thread(
             daemon=True,
-            kwargs=dict(owned=True),
+            kwargs=dict(owned=True, pool=pool),
             target=self._lifecycle,
         )
         self._lifecycle_thread.start()
@@ -685,33 +1507,70 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def get_buffer_array(
+        self, buffer: Buffer, timeout: float = 10.0
+    ) -> "numpy.ndarray":
+        """
+        Get a buffer's contents as a ``(frames, channels)`` NumPy array.
+
+        Emit ``/b_write`` requests, writing a float WAV file to a temporary (tmpfs,
+        where available) directory and memory-mapping it back. Requires a local
+        server.
+
+        :param buffer: The buffer whose contents to get.
+        :param timeout: The number of seconds to wait for the write to complete.
+        """
+        path = self._get_buffer_array_path()
+        try:
+            WriteBuffer(
+                buffer_id=int(buffer),
+                path=path,
+                header_format="wav",
+                sample_format="float",
+            ).communicate(server=self, timeout=timeout)
+            return self._read_buffer_array(path)
+        finally:
+            path.unlink(missing_ok=True)
+
     def get_buffer_range(
-        self, buffer: Buffer, index: int, count: int, sync: bool = True
-    ) -> Optional[Sequence[float]]:
+        self,
+        buffer: Buffer,
+        index: int,
+        count: int,
+        sync: bool = True,
+        as_array: bool = False,
+        timeout: float = 1.0,
+    ) -> Optional[Union[Sequence[float], "numpy.ndarray"]]:
         """
         Get a buffer sample range.
 
-        Emit ``/b_getn`` requests.
+        Emit ``/b_getn`` requests, split into datagram-sized chunks with several
+        chunks in flight at once.
 
         :param buffer: The buffer whose samples to get.
         :param index: The sample index to start reading at.
         :param count: The number of samples to read.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
-        """
-        request = GetBufferRange(buffer_id=buffer, items=[(index, count)])
-        if sync:
-            return cast(GetBufferRangeInfo, request.communicate(server=self)).items[0][
-                -1
-            ]
-        self._add_requests(request)
-        return None
+        :param as_array: If true, return a NumPy array rather than a tuple.
+        :param timeout: The number of seconds to wait for each chunk's reply.
+        """
+        requests = self._get_buffer_range_requests(buffer, index, count)
+        if not sync:
+            self._add_requests(*requests)
+            return None
+        responses = self._communicate_windowed(
+            requests, BUFFER_TRANSFER_WINDOW, timeout
+        )
+        return self._join_buffer_range(
+            cast(List[GetBufferRangeInfo], responses), as_array
+        )
 
     def get_bus(self, bus: Bus, sync: bool = True) -> Optional[float]:
         """
         Get a control bus value.
 
-        Emit ``/c_get`` requests.
+        Emit ``/c_get`` requests, or read shared memory directly on local servers.
 
         :param bus: The control bus whose value to get.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
@@ -719,6 +1578,8 @@ class Server(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and self._shm is not None:
+            return self._shm[bus.id_]
         request = GetControlBus(bus_ids=[bus.id_])
         if sync:
             return cast(GetControlBusInfo, request.communicate(server=self)).items[0][
@@ -733,7 +1594,7 @@ class Server(BaseServer):
         """
         Get a range of control bus values.
 
-        Emit ``/c_getn`` requests.
+        Emit ``/c_getn`` requests, or read shared memory directly on local servers.
 
         :param bus: The control bus to start reading at.
         :param count: The number of contiguous buses whose values to get.
@@ -742,6 +1603,8 @@ class Server(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and self._shm is not None:
+            return tuple(self._shm[bus.id_ : bus.id_ + count])
         request = GetControlBusRange(items=[(bus.id_, count)])
         if sync:
             return cast(GetControlBusRangeInfo, request.communicate(server=self)).items[
@@ -750,6 +1613,41 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def get_buses(
+        self,
+        buses: Sequence[Bus],
+        *,
+        batch_size: int = QUERY_BATCH_SIZE,
+        window: int = QUERY_BATCH_WINDOW,
+        timeout: float = 1.0,
+    ) -> List[float]:
+        """
+        Get many control bus values.
+
+        Emit batched ``/c_get`` requests, or read shared memory directly on local
+        servers.
+
+        :param buses: The control buses whose values to get.
+        :param batch_size: The maximum number of buses per request.
+        :param window: The maximum number of requests awaiting replies at once.
+        :param timeout: The number of seconds to wait for each request's reply.
+        """
+        if any(bus.calculation_rate != CalculationRate.CONTROL for bus in buses):
+            raise InvalidCalculationRate
+        if self._shm is not None:
+            return [self._shm[bus.id_] for bus in buses]
+        values: Dict[int, float] = {}
+        for response in self._communicate_windowed(
+            [
+                GetControlBus(bus_ids=batch)
+                for batch in self._get_query_batches(buses, batch_size)
+            ],
+            window,
+            timeout,
+        ):
+            values.update(cast(GetControlBusInfo, response).items)
+        return [values[bus.id_] for bus in buses]
+
     def get_synth_controls(
         self, synth: Synth, *controls: Union[int, str], sync: bool = True
     ) -> Optional[Dict[Union[int, str], float]]:
@@ -793,6 +1691,30 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def node_ended(self, node: Node) -> concurrent.futures.Future[NodeInfo]:
+        """
+        Get a future resolved with the node's next ``/n_end`` notification.
+
+        :param node: The node to watch.
+        """
+        future: concurrent.futures.Future[NodeInfo] = concurrent.futures.Future()
+        self._add_node_future(self._node_end_callbacks, node, future)
+        return future
+
+    def node_started(self, node: Node) -> concurrent.futures.Future[NodeInfo]:
+        """
+        Get a future resolved once the node is running.
+
+        Resolves immediately if the node is already running.
+
+        :param node: The node to watch.
+        """
+        future: concurrent.futures.Future[NodeInfo] = concurrent.futures.Future()
+        self._add_node_future(
+            self._node_start_callbacks, node, future, resolve_if_running=True
+        )
+        return future
+
     def query_buffer(self, buffer: Buffer, sync: bool = True) -> Optional[BufferInfo]:
         """
         Query a buffer.
@@ -809,6 +1731,38 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def query_buffers(
+        self,
+        buffers: Sequence[Buffer],
+        *,
+        batch_size: int = QUERY_BATCH_SIZE,
+        window: int = QUERY_BATCH_WINDOW,
+        timeout: float = 1.0,
+    ) -> List[BufferInfo.Item]:
+        """
+        Query many buffers.
+
+        Emit batched ``/b_query`` requests.
+
+        :param buffers: The buffers to query.
+        :param batch_size: The maximum number of buffers per request.
+        :param window: The maximum number of requests awaiting replies at once.
+        :param timeout: The number of seconds to wait for each request's reply.
+        """
+        items: Dict[int, BufferInfo.Item] = {}
+        for response in self._communicate_windowed(
+            [
+                QueryBuffer(buffer_ids=batch)
+                for batch in self._get_query_batches(buffers, batch_size)
+            ],
+            window,
+            timeout,
+        ):
+            items.update(
+                (item.buffer_id, item) for item in cast(BufferInfo, response).items
+            )
+        return [items[buffer.id_] for buffer in buffers]
+
     def query_node(self, node: Node, sync: bool = True) -> Optional[NodeInfo]:
         """
         Query a node.
@@ -825,6 +1779,46 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def query_nodes(
+        self,
+        nodes: Sequence[Node],
+        *,
+        batch_size: int = QUERY_NODE_BATCH_SIZE,
+        window: int = QUERY_BATCH_WINDOW,
+        timeout: float = 1.0,
+    ) -> List[Optional[NodeInfo]]:
+        """
+        Query many nodes.
+
+        Emit bundles of ``/n_query`` requests, one per node, each bundle followed by a
+        ``/sync``. Nodes which no longer exist on the server are reported as
+        ``None``, without ``/fail`` replies.
+
+        :param nodes: The nodes to query.
+        :param batch_size: The maximum number of nodes per bundle.
+        :param window: The maximum number of bundles awaiting replies at once.
+        :param timeout: The number of seconds to wait for each bundle's replies.
+        """
+        node_infos: Dict[int, NodeInfo] = {}
+        pending: Deque[
+            Tuple[concurrent.futures.Future, Tuple[OscCallback, OscCallback]]
+        ] = collections.deque()
+        try:
+            for batch in self._get_query_batches(nodes, batch_size):
+                if len(pending) >= window:
+                    node_infos.update(pending[0][0].result(timeout=timeout))
+                    pending.popleft()
+                future: concurrent.futures.Future = concurrent.futures.Future()
+                pending.append((future, self._send_node_query_batch(batch, future)))
+            while pending:
+                node_infos.update(pending[0][0].result(timeout=timeout))
+                pending.popleft()
+        finally:
+            for _, callbacks in pending:
+                for callback in callbacks:
+                    self._osc_protocol.unregister(callback)
+        return [node_infos.get(node.id_) for node in nodes]
+
     def query_status(self, sync: bool = True) -> Optional[StatusInfo]:
         """
         Query the server's status.
@@ -900,10 +1894,10 @@ class Server(BaseServer):
 
     def reboot(self) -> "Server":
         """
-        Reboot the server.
+        Reboot the server, from the same process pool if booted from one.
         """
         self.quit()
-        self.boot()
+        self.boot(pool=self._process_pool)
         return self
 
     def reset(self) -> "Server":
@@ -918,22 +1912,56 @@ class Server(BaseServer):
         self._teardown_state()
         self._setup_allocators()
         self._setup_system()
-        self.sync()
+        self.sync(timeout=self._manifest.timeout)
         return self
 
+    def set_buffer_array(
+        self, buffer: Buffer, array: "numpy.ndarray", timeout: float = 10.0
+    ) -> None:
+        """
+        Replace a buffer's contents with a ``(frames, channels)`` NumPy array.
+
+        Emit ``/b_allocRead`` requests, reallocating the buffer from a float WAV file
+        written to a temporary (tmpfs, where available) directory. Requires a local
+        server.
+
+        :param buffer: The buffer to replace.
+        :param array: The array to upload. One-dimensional arrays are uploaded as a
+            single channel.
+        :param timeout: The number of seconds to wait for the read to complete.
+        """
+        path = self._write_buffer_array(array)
+        try:
+            AllocateReadBuffer(buffer_id=int(buffer), path=path).communicate(
+                server=self, timeout=timeout
+            )
+        finally:
+            path.unlink(missing_ok=True)
+
     def sync(self, sync_id: Optional[int] = None, timeout: float = 1.0) -> "Server":
         """
         Sync the server.
 
         Emit ``/sync`` requests.
 
-        :param sync_id: The sync ID to wait on.
+        Concurrent callers share barriers: a caller waits on the ``/sync`` already
+        in flight if everything it sent went out before it, or otherwise on a single
+        follow-up ``/sync`` sent once the in-flight one is answered.
+
+        :param sync_id: The sync ID to wait on. Bypasses barrier sharing.
+        :param timeout: The number of seconds to wait.
         """
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
             raise ServerOffline
-        Sync(
-            sync_id=sync_id if sync_id is not None else self._get_next_sync_id()
-        ).communicate(server=self, timeout=timeout)
+        if sync_id is not None:
+            Sync(sync_id=sync_id).communicate(server=self, timeout=timeout)
+            return self
+        barrier = self._get_sync_barrier(concurrent.futures.Future)
+        try:
+            cast(concurrent.futures.Future, barrier.future).result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            self._abandon_sync_barrier(barrier)
+            raise
         return self
 
     ### PUBLIC PROPERTIES ###
@@ -1002,6 +2030,7 @@ class AsyncServer(BaseServer):
         )
         self._process_protocol = AsyncProcessProtocol(
             name=name,
+            on_late_callback=self._handle_late_event,
             on_panic_callback=lambda: self._shutdown_future.set_result(
                 ServerShutdownEvent.PROCESS_PANIC
             ),
@@ -1010,6 +2039,22 @@ class AsyncServer(BaseServer):
 
     ### PRIVATE METHODS ###
 
+    async def _communicate_windowed(
+        self, requests: Sequence[Request], window: int, timeout: float
+    ) -> List[Response]:
+        semaphore = asyncio.Semaphore(window)
+
+        async def communicate(request: Request) -> Response:
+            async with semaphore:
+                return cast(
+                    Response,
+                    await request.communicate_async(server=self, timeout=timeout),
+                )
+
+        return list(
+            await asyncio.gather(*(communicate(request) for request in requests))
+        )
+
     async def _lifecycle(self, owned=True) -> None:
         log_prefix = self._log_prefix()
         logger.info(log_prefix + "booting ...")
@@ -1038,9 +2083,9 @@ class AsyncServer(BaseServer):
             self._contexts.add(self)
             self._osc_protocol.activate_healthcheck()
             self._setup_allocators()
-            if self._client_id == 0:
-                self._setup_system()
-                await self.sync()
+            self._setup_system()
+            if self._client_id == 0 or not self._manifest.is_empty:
+                await self.sync(timeout=self._manifest.timeout)
             if await self._osc_protocol.boot_future:
                 self._boot_status = BootStatus.ONLINE
                 await self._on_lifecycle_event(ServerLifecycleEvent.OSC_CONNECTED)
@@ -1131,17 +2176,25 @@ class AsyncServer(BaseServer):
     ### PUBLIC METHODS ###
 
     async def boot(
-        self, *, options: Optional[Options] = None, **kwargs
+        self,
+        *,
+        manifest: Optional[BootManifest] = None,
+        options: Optional[Options] = None,
+        **kwargs,
     ) -> "AsyncServer":
         """
         Boot the server.
 
+        :param manifest: The boot manifest to apply, replacing the server's current
+            manifest, which is otherwise applied again.
         :param options: The context's options.
         :param kwargs: Keyword arguments for options.
         """
         if self._boot_status != BootStatus.OFFLINE:
             raise ServerOnline
         self._boot_status = BootStatus.BOOTING
+        if manifest is not None:
+            self._manifest = manifest
         self._options = new(options or self._options, **kwargs)
         loop = asyncio.get_running_loop()
         self._boot_future = loop.create_future()
@@ -1235,33 +2288,70 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def get_buffer_array(
+        self, buffer: Buffer, timeout: float = 10.0
+    ) -> "numpy.ndarray":
+        """
+        Get a buffer's contents as a ``(frames, channels)`` NumPy array.
+
+        Emit ``/b_write`` requests, writing a float WAV file to a temporary (tmpfs,
+        where available) directory and memory-mapping it back. Requires a local
+        server.
+
+        :param buffer: The buffer whose contents to get.
+        :param timeout: The number of seconds to wait for the write to complete.
+        """
+        path = self._get_buffer_array_path()
+        try:
+            await WriteBuffer(
+                buffer_id=int(buffer),
+                path=path,
+                header_format="wav",
+                sample_format="float",
+            ).communicate_async(server=self, timeout=timeout)
+            return self._read_buffer_array(path)
+        finally:
+            path.unlink(missing_ok=True)
+
     async def get_buffer_range(
-        self, buffer: Buffer, index: int, count: int, sync: bool = True
-    ) -> Optional[Sequence[float]]:
+        self,
+        buffer: Buffer,
+        index: int,
+        count: int,
+        sync: bool = True,
+        as_array: bool = False,
+        timeout: float = 1.0,
+    ) -> Optional[Union[Sequence[float], "numpy.ndarray"]]:
         """
         Get a buffer sample range.
 
-        Emit ``/b_getn`` requests.
+        Emit ``/b_getn`` requests, split into datagram-sized chunks with several
+        chunks in flight at once.
 
         :param buffer: The buffer whose samples to get.
         :param index: The sample index to start reading at.
         :param count: The number of samples to read.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
-        """
-        request = GetBufferRange(buffer_id=buffer, items=[(index, count)])
-        if sync:
-            return cast(
-                GetBufferRangeInfo, await request.communicate_async(server=self)
-            ).items[0][-1]
-        self._add_requests(request)
-        return None
+        :param as_array: If true, return a NumPy array rather than a tuple.
+        :param timeout: The number of seconds to wait for each chunk's reply.
+        """
+        requests = self._get_buffer_range_requests(buffer, index, count)
+        if not sync:
+            self._add_requests(*requests)
+            return None
+        responses = await self._communicate_windowed(
+            requests, BUFFER_TRANSFER_WINDOW, timeout
+        )
+        return self._join_buffer_range(
+            cast(List[GetBufferRangeInfo], responses), as_array
+        )
 
     async def get_bus(self, bus: Bus, sync: bool = True) -> Optional[float]:
         """
         Get a control bus value.
 
-        Emit ``/c_get`` requests.
+        Emit ``/c_get`` requests, or read shared memory directly on local servers.
 
         :param bus: The control bus whose value to get.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
@@ -1269,6 +2359,8 @@ class AsyncServer(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and self._shm is not None:
+            return self._shm[bus.id_]
         request = GetControlBus(bus_ids=[bus.id_])
         if sync:
             return cast(
@@ -1283,7 +2375,7 @@ class AsyncServer(BaseServer):
         """
         Get a range of control bus values.
 
-        Emit ``/c_getn`` requests.
+        Emit ``/c_getn`` requests, or read shared memory directly on local servers.
 
         :param bus: The control bus to start reading at.
         :param count: The number of contiguous buses whose values to get.
@@ -1292,6 +2384,8 @@ class AsyncServer(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and self._shm is not None:
+            return tuple(self._shm[bus.id_ : bus.id_ + count])
         request = GetControlBusRange(items=[(bus.id_, count)])
         if sync:
             return cast(
@@ -1300,6 +2394,41 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def get_buses(
+        self,
+        buses: Sequence[Bus],
+        *,
+        batch_size: int = QUERY_BATCH_SIZE,
+        window: int = QUERY_BATCH_WINDOW,
+        timeout: float = 1.0,
+    ) -> List[float]:
+        """
+        Get many control bus values.
+
+        Emit batched ``/c_get`` requests, or read shared memory directly on local
+        servers.
+
+        :param buses: The control buses whose values to get.
+        :param batch_size: The maximum number of buses per request.
+        :param window: The maximum number of requests awaiting replies at once.
+        :param timeout: The number of seconds to wait for each request's reply.
+        """
+        if any(bus.calculation_rate != CalculationRate.CONTROL for bus in buses):
+            raise InvalidCalculationRate
+        if self._shm is not None:
+            return [self._shm[bus.id_] for bus in buses]
+        values: Dict[int, float] = {}
+        for response in await self._communicate_windowed(
+            [
+                GetControlBus(bus_ids=batch)
+                for batch in self._get_query_batches(buses, batch_size)
+            ],
+            window,
+            timeout,
+        ):
+            values.update(cast(GetControlBusInfo, response).items)
+        return [values[bus.id_] for bus in buses]
+
     async def get_synth_controls(
         self, synth: Synth, *controls: Union[int, str], sync: bool = True
     ) -> Optional[Dict[Union[int, str], float]]:
@@ -1345,6 +2474,30 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    def node_ended(self, node: Node) -> asyncio.Future[NodeInfo]:
+        """
+        Get a future resolved with the node's next ``/n_end`` notification.
+
+        :param node: The node to watch.
+        """
+        future: asyncio.Future[NodeInfo] = asyncio.get_running_loop().create_future()
+        self._add_node_future(self._node_end_callbacks, node, future)
+        return future
+
+    def node_started(self, node: Node) -> asyncio.Future[NodeInfo]:
+        """
+        Get a future resolved once the node is running.
+
+        Resolves immediately if the node is already running.
+
+        :param node: The node to watch.
+        """
+        future: asyncio.Future[NodeInfo] = asyncio.get_running_loop().create_future()
+        self._add_node_future(
+            self._node_start_callbacks, node, future, resolve_if_running=True
+        )
+        return future
+
     async def query_buffer(
         self, buffer: Buffer, sync: bool = True
     ) -> Optional[BufferInfo]:
@@ -1363,6 +2516,38 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def query_buffers(
+        self,
+        buffers: Sequence[Buffer],
+        *,
+        batch_size: int = QUERY_BATCH_SIZE,
+        window: int = QUERY_BATCH_WINDOW,
+        timeout: float = 1.0,
+    ) -> List[BufferInfo.Item]:
+        """
+        Query many buffers.
+
+        Emit batched ``/b_query`` requests.
+
+        :param buffers: The buffers to query.
+        :param batch_size: The maximum number of buffers per request.
+        :param window: The maximum number of requests awaiting replies at once.
+        :param timeout: The number of seconds to wait for each request's reply.
+        """
+        items: Dict[int, BufferInfo.Item] = {}
+        for response in await self._communicate_windowed(
+            [
+                QueryBuffer(buffer_ids=batch)
+                for batch in self._get_query_batches(buffers, batch_size)
+            ],
+            window,
+            timeout,
+        ):
+            items.update(
+                (item.buffer_id, item) for item in cast(BufferInfo, response).items
+            )
+        return [items[buffer.id_] for buffer in buffers]
+
     async def query_node(self, node: Node, sync: bool = True) -> Optional[NodeInfo]:
         """
         Query a node.
@@ -1379,6 +2564,50 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def query_nodes(
+        self,
+        nodes: Sequence[Node],
+        *,
+        batch_size: int = QUERY_NODE_BATCH_SIZE,
+        window: int = QUERY_BATCH_WINDOW,
+        timeout: float = 1.0,
+    ) -> List[Optional[NodeInfo]]:
+        """
+        Query many nodes.
+
+        Emit bundles of ``/n_query`` requests, one per node, each bundle followed by a
+        ``/sync``. Nodes which no longer exist on the server are reported as
+        ``None``, without ``/fail`` replies.
+
+        :param nodes: The nodes to query.
+        :param batch_size: The maximum number of nodes per bundle.
+        :param window: The maximum number of bundles awaiting replies at once.
+        :param timeout: The number of seconds to wait for each bundle's replies.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(window)
+
+        async def query_batch(batch: List[int]) -> Dict[int, NodeInfo]:
+            async with semaphore:
+                future: asyncio.Future[Dict[int, NodeInfo]] = loop.create_future()
+                callbacks = self._send_node_query_batch(batch, future)
+                try:
+                    return await asyncio.wait_for(future, timeout=timeout)
+                finally:
+                    if not future.done() or future.cancelled():
+                        for callback in callbacks:
+                            self._osc_protocol.unregister(callback)
+
+        node_infos: Dict[int, NodeInfo] = {}
+        for batch_node_infos in await asyncio.gather(
+            *(
+                query_batch(batch)
+                for batch in self._get_query_batches(nodes, batch_size)
+            )
+        ):
+            node_infos.update(batch_node_infos)
+        return [node_infos.get(node.id_) for node in nodes]
+
     async def query_status(self, sync: bool = True) -> Optional[StatusInfo]:
         """
         Query the server's status.
@@ -1472,9 +2701,32 @@ class AsyncServer(BaseServer):
         self._teardown_state()
         self._setup_allocators()
         self._setup_system()
-        await self.sync()
+        await self.sync(timeout=self._manifest.timeout)
         return self
 
+    async def set_buffer_array(
+        self, buffer: Buffer, array: "numpy.ndarray", timeout: float = 10.0
+    ) -> None:
+        """
+        Replace a buffer's contents with a ``(frames, channels)`` NumPy array.
+
+        Emit ``/b_allocRead`` requests, reallocating the buffer from a float WAV file
+        written to a temporary (tmpfs, where available) directory. Requires a local
+        server.
+
+        :param buffer: The buffer to replace.
+        :param array: The array to upload. One-dimensional arrays are uploaded as a
+            single channel.
+        :param timeout: The number of seconds to wait for the read to complete.
+        """
+        path = self._write_buffer_array(array)
+        try:
+            await AllocateReadBuffer(
+                buffer_id=int(buffer), path=path
+            ).communicate_async(server=self, timeout=timeout)
+        finally:
+            path.unlink(missing_ok=True)
+
     async def sync(
         self, sync_id: Optional[int] = None, timeout: float = 1.0
     ) -> "AsyncServer":
@@ -1483,13 +2735,27 @@ class AsyncServer(BaseServer):
 
         Emit ``/sync`` requests.
 
-        :param sync_id: The sync ID to wait on.
+        Concurrent callers share barriers: a caller waits on the ``/sync`` already
+        in flight if everything it sent went out before it, or otherwise on a single
+        follow-up ``/sync`` sent once the in-flight one is answered.
+
+        :param sync_id: The sync ID to wait on. Bypasses barrier sharing.
+        :param timeout: The number of seconds to wait.
         """
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
             raise ServerOffline
-        await Sync(
-            sync_id=sync_id if sync_id is not None else self._get_next_sync_id()
-        ).communicate_async(server=self, timeout=timeout)
+        if sync_id is not None:
+            await Sync(sync_id=sync_id).communicate_async(server=self, timeout=timeout)
+            return self
+        barrier = self._get_sync_barrier(asyncio.get_running_loop().create_future)
+        try:
+            # shielded, as other callers may be waiting on the same barrier
+            await asyncio.wait_for(
+                asyncio.shield(cast(asyncio.Future, barrier.future)), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            self._abandon_sync_barrier(barrier)
+            raise
         return self
 
     ### PUBLIC PROPERTIES ###
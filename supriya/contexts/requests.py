@@ -27,7 +27,7 @@ except ImportError:
 from uqbar.objects import new
 
 from ..enums import AddAction, HeaderFormat, RequestName, SampleFormat
-from ..osc import OscBundle, OscMessage
+from ..osc import OscBundle, OscCallback, OscMessage
 from ..typing import AddActionLike, HeaderFormatLike, SampleFormatLike, SupportsOsc
 from ..ugens import SynthDef, compile_synthdefs
 from .responses import Response
@@ -39,6 +39,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Floats per /b_getn or /b_setn chunk, matching sclang's bulk buffer transfers
+BUFFER_TRANSFER_CHUNK_SIZE = 1633
+
 
 class Requestable(ABC):
     """
@@ -57,7 +60,12 @@ class Requestable(ABC):
 
     ### PUBLIC METHODS ###
 
-    def communicate(self, server: "Server", timeout: float = 1.0) -> Optional[Response]:
+    def _communicate_future(self, server: "Server") -> Optional["Future[Response]"]:
+        return self._communicate_future_and_callback(server)[0]
+
+    def _communicate_future_and_callback(
+        self, server: "Server"
+    ) -> Tuple[Optional["Future[Response]"], Optional[OscCallback]]:
         (
             success_pattern,
             failure_pattern,
@@ -65,15 +73,20 @@ class Requestable(ABC):
         ) = self._get_response_patterns_and_requestable(server)
         if not success_pattern:
             server.send(self)
-            return None
+            return None, None
         future: Future[Response] = Future()
-        server._osc_protocol.register(
+        osc_callback = server._osc_protocol.register(
             pattern=success_pattern,
             failure_pattern=failure_pattern,
             procedure=lambda message: future.set_result(Response.from_osc(message)),
             once=True,
         )
         server.send(requestable)
+        return future, osc_callback
+
+    def communicate(self, server: "Server", timeout: float = 1.0) -> Optional[Response]:
+        if (future := self._communicate_future(server)) is None:
+            return None
         return future.result(timeout=timeout)
 
     async def communicate_async(
@@ -793,6 +806,9 @@ class GetBufferRange(Request):
     items: Sequence[Tuple[int, int]]
 
     def _get_response_patterns(self):
+        if len(self.items) == 1:
+            # Disambiguate concurrent single-range requests against one buffer
+            return ["/b_setn", int(self.buffer_id), int(self.items[0][0])], None
         return ["/b_setn", int(self.buffer_id)], None
 
     def to_osc(self) -> OscMessage:
@@ -1311,6 +1327,26 @@ class NewSynth(Request):
         Dict[Union[int, str], Union[float, str, Tuple[Union[float, str], ...]]]
     ] = None
 
+    def _get_ordered_controls(
+        self,
+    ) -> List[Tuple[Union[int, str], Union[float, str, Tuple[Union[float, str], ...]]]]:
+        controls = self.controls or {}
+        if not controls or not isinstance(self.synthdef, SynthDef):
+            return sorted(controls.items())
+        # Slot controls by their layout position rather than sorting them
+        layout = self.synthdef.control_layout
+        slots: List[Optional[Tuple]] = [None] * len(layout.names)
+        for key, value in controls.items():
+            position = layout.positions.get(key)
+            if position is None or slots[position] is not None:
+                return sorted(controls.items())
+            slots[position] = (key, value)
+        if isinstance(next(iter(controls)), str):
+            order: Sequence[int] = layout.name_order
+        else:
+            order = range(len(slots))
+        return [slot for slot in (slots[position] for position in order) if slot]
+
     def to_osc(self) -> OscMessage:
         contents: List[Union[float, str, Tuple[Union[float, str], ...]]] = [
             (
@@ -1322,7 +1358,7 @@ class NewSynth(Request):
             int(AddAction.from_expr(self.add_action)),
             int(self.target_node_id),
         ]
-        for key, value in sorted((self.controls or {}).items()):
+        for key, value in self._get_ordered_controls():
             contents.append(key if isinstance(key, str) else int(key))
             if isinstance(value, tuple):
                 if len(value) == 1:
@@ -1412,8 +1448,8 @@ class QueryBuffer(Request):
     buffer_ids: Sequence[int]
 
     def _get_response_patterns(self):
-        # TODO: We should be able to gather multiple responses
-        return ["/b_info", self.buffer_ids[-1]], None
+        # scsynth answers every queried buffer in a single /b_info
+        return ["/b_info", self.buffer_ids[0]], None
 
     def to_osc(self) -> OscMessage:
         return OscMessage(
@@ -1766,10 +1802,19 @@ class SetBufferRange(Request):
                 items_by_buffer_id.setdefault(int(request.buffer_id), []).extend(
                     request.items
                 )
-        return [
-            cls(buffer_id=buffer_id, items=items)
-            for buffer_id, items in sorted(items_by_buffer_id.items())
-        ]
+        # Pack items into requests of at most one transfer chunk each
+        merged: List["Request"] = []
+        for buffer_id, items in sorted(items_by_buffer_id.items()):
+            packed: List[Tuple[int, Sequence[float]]] = []
+            size = 0
+            for item in items:
+                if packed and size + len(item[1]) > BUFFER_TRANSFER_CHUNK_SIZE:
+                    merged.append(cls(buffer_id=buffer_id, items=packed))
+                    packed, size = [], 0
+                packed.append(item)
+                size += len(item[1])
+            merged.append(cls(buffer_id=buffer_id, items=packed))
+        return merged
 
     def to_osc(self) -> OscMessage:
         contents: List[float] = [int(self.buffer_id)]
@@ -1862,20 +1907,23 @@ class SetNodeControl(Request):
         ...         (3, 1.234),
         ...         ("positions", [0.5, 0.25, 0.75]),
         ...         (4, [0.1, 0.2]),
+        ...         ("pan", "c0"),
         ...     ],
         ... )
         >>> request.to_osc()
-        OscMessage('/n_set', 1000, 'frequency', 440.0, 'amplitude', 1.0, 3, 1.234, 'positions', [0.5, 0.25, 0.75], 4, [0.1, 0.2])
+        OscMessage('/n_set', 1000, 'frequency', 440.0, 'amplitude', 1.0, 3, 1.234, 'positions', [0.5, 0.25, 0.75], 4, [0.1, 0.2], 'pan', 'c0')
     """
 
     node_id: SupportsInt
-    items: Sequence[Tuple[Union[int, str], Union[float, Sequence[float]]]]
+    items: Sequence[Tuple[Union[int, str], Union[float, str, Sequence[float]]]]
 
     def to_osc(self) -> OscMessage:
         contents: List[Union[float, str, List[float]]] = [int(self.node_id)]
         for control, values in self.items:
             contents.append(control if isinstance(control, str) else int(control))
-            if isinstance(values, Sequence):
+            if isinstance(values, str):  # bus-mapping symbols, e.g. "c0"
+                contents.append(values)
+            elif isinstance(values, Sequence):
                 contents.append([float(value) for value in values])
             else:
                 contents.append(float(values))
@@ -3,9 +3,11 @@ Classes for modeling responses from :term:`scsynth`.
 """
 
 import dataclasses
+import functools
 import re
 from collections import deque
 from typing import (
+    Callable,
     Deque,
     Dict,
     Generator,
@@ -18,7 +20,7 @@ from typing import (
     cast,
 )
 
-from ..enums import NodeAction
+from ..enums import NodeAction, RequestName
 from ..osc import OscMessage
 
 
@@ -26,30 +28,7 @@ from ..osc import OscMessage
 class Response:
     @classmethod
     def from_osc(cls, osc_message: OscMessage) -> "Response":
-        mapping: Dict[str, Type[Response]] = {
-            "/b_info": BufferInfo,
-            "/b_set": GetBufferInfo,
-            "/b_setn": GetBufferRangeInfo,
-            "/c_set": GetControlBusInfo,
-            "/c_setn": GetControlBusRangeInfo,
-            "/d_removed": SynthDefRemovedInfo,
-            "/done": DoneInfo,
-            "/fail": FailInfo,
-            "/g_queryTree.reply": QueryTreeInfo,
-            "/n_end": NodeInfo,
-            "/n_go": NodeInfo,
-            "/n_info": NodeInfo,
-            "/n_move": NodeInfo,
-            "/n_off": NodeInfo,
-            "/n_on": NodeInfo,
-            "/n_set": GetNodeControlInfo,
-            "/n_setn": GetNodeControlRangeInfo,
-            "/status.reply": StatusInfo,
-            "/synced": SyncedInfo,
-            "/tr": TriggerInfo,
-            "/version.reply": VersionInfo,
-        }
-        return mapping[str(osc_message.address)].from_osc(osc_message)
+        return _RESPONSE_DECODERS[osc_message.address](osc_message)
 
 
 @dataclasses.dataclass
@@ -258,7 +237,10 @@ class NodeInfo(Response):
 
     @classmethod
     def from_osc(cls, osc_message: OscMessage) -> "Response":
-        action = osc_message.address
+        return cls._from_osc(NodeAction.from_expr(osc_message.address), osc_message)
+
+    @classmethod
+    def _from_osc(cls, action: NodeAction, osc_message: OscMessage) -> "Response":
         (
             node_id,
             parent_id,
@@ -273,7 +255,7 @@ class NodeInfo(Response):
         else:
             head_id, tail_id = None, None
         return cls(
-            action=NodeAction.from_expr(action),
+            action=action,
             node_id=int(node_id),
             parent_id=int(parent_id),
             previous_id=int(previous_id),
@@ -604,3 +586,44 @@ class VersionInfo(Response):
     @classmethod
     def from_osc(cls, osc_message: OscMessage) -> "Response":
         return cls(*osc_message.contents)
+
+
+# Built once at import: replies are decoded with one lookup and one call
+_RESPONSE_DECODERS: Dict[Union[int, str], Callable[[OscMessage], Response]] = {
+    "/b_info": BufferInfo.from_osc,
+    "/b_set": GetBufferInfo.from_osc,
+    "/b_setn": GetBufferRangeInfo.from_osc,
+    "/c_set": GetControlBusInfo.from_osc,
+    "/c_setn": GetControlBusRangeInfo.from_osc,
+    "/d_removed": SynthDefRemovedInfo.from_osc,
+    "/done": DoneInfo.from_osc,
+    "/fail": FailInfo.from_osc,
+    "/g_queryTree.reply": QueryTreeInfo.from_osc,
+    "/n_end": functools.partial(NodeInfo._from_osc, NodeAction.NODE_REMOVED),
+    "/n_go": functools.partial(NodeInfo._from_osc, NodeAction.NODE_CREATED),
+    "/n_info": functools.partial(NodeInfo._from_osc, NodeAction.NODE_QUERIED),
+    "/n_move": functools.partial(NodeInfo._from_osc, NodeAction.NODE_MOVED),
+    "/n_off": functools.partial(NodeInfo._from_osc, NodeAction.NODE_DEACTIVATED),
+    "/n_on": functools.partial(NodeInfo._from_osc, NodeAction.NODE_ACTIVATED),
+    "/n_set": GetNodeControlInfo.from_osc,
+    "/n_setn": GetNodeControlRangeInfo.from_osc,
+    "/status.reply": StatusInfo.from_osc,
+    "/synced": SyncedInfo.from_osc,
+    "/tr": TriggerInfo.from_osc,
+    "/version.reply": VersionInfo.from_osc,
+}
+
+# Replies which echo a request's name may also be addressed by its command number
+_RESPONSE_DECODERS.update(
+    {
+        int(request_name.request_id): _RESPONSE_DECODERS[request_name.value]
+        for request_name in (
+            RequestName.BUFFER_SET,
+            RequestName.BUFFER_SET_CONTIGUOUS,
+            RequestName.CONTROL_BUS_SET,
+            RequestName.CONTROL_BUS_SET_CONTIGUOUS,
+            RequestName.NODE_SET,
+            RequestName.NODE_SET_CONTIGUOUS,
+        )
+    }
+)
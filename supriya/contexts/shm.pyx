@@ -1,17 +1,23 @@
 # cython: language_level=3
 # distutils: language = c++
 
-from typing import List, Union
+import array
+from typing import List, Optional, Union
 
-from .entities import Bus, BusGroup
-from .shm cimport server_shared_memory_client
+from cython.view cimport array as cvarray
+from libc.string cimport memcpy
 
+from .entities import Bus, BusGroup
+from .shm cimport scope_buffer_reader, server_shared_memory_client
 
 cdef class ServerSHM:
     """
     Server shared memory interface.
 
-    Currently supports reading control busses only.
+    Supports reading and writing control busses, and reading scope buffers.
+
+    Control busses are exposed as a float32 view directly over the shared memory
+    segment, so slice reads are a single copy and slice writes a single loop.
 
     .. warning::
 
@@ -20,10 +26,20 @@ cdef class ServerSHM:
     """
     cdef server_shared_memory_client* client
     cdef unsigned int bus_count
+    cdef float[::1] busses
+    cdef unsigned int scope_buffer_count
 
-    def __cinit__(self, unsigned int port_number, unsigned int bus_count):
+    def __cinit__(
+        self,
+        unsigned int port_number,
+        unsigned int bus_count,
+        unsigned int scope_buffer_count,
+    ):
         self.bus_count = bus_count
+        self.scope_buffer_count = scope_buffer_count
         self.client = new server_shared_memory_client(port_number)
+        if bus_count:
+            self.busses = <float[:bus_count]> self.client.get_control_busses()
 
     def __dealloc__(self) -> None:
         del self.client
@@ -36,15 +52,14 @@ cdef class ServerSHM:
         if isinstance(item, int):
             if item < 0 or item >= self.bus_count:
                 raise ValueError("index out of bounds")
-            return self.client.get_control_busses()[item]
+            return self.busses[item]
         elif isinstance(item, slice):
-            result = []
-            for bus_index in range(*item.indices(self.bus_count)):
-                result.append(self.client.get_control_busses()[bus_index])
-            return result
+            return self.control_busses[item].tolist()
         raise ValueError(item)
 
     def __setitem__(self, item: Union[int, slice, Bus, BusGroup], value: Union[float, List[float]]) -> None:
+        cdef const float[:] source
+        cdef Py_ssize_t start, stop, step, i, count
         if isinstance(item, BusGroup):
             item = slice(int(item), int(item) + len(item), 1)
         elif isinstance(item, Bus):
@@ -52,11 +67,113 @@ cdef class ServerSHM:
         if isinstance(item, int):
             if item < 0 or item >= self.bus_count:
                 raise ValueError("index out of bounds")
-            self.client.set_control_bus(item, float(value))
+            self.busses[item] = float(value)
             return
         elif isinstance(item, slice):
-            for value_index, bus_index in enumerate(range(*item.indices(self.bus_count))):
-                value_ = float(value[value_index])
-                self.client.set_control_bus(bus_index, value_)
+            start, stop, step = item.indices(self.bus_count)
+            count = len(range(start, stop, step))
+            try:
+                # float32 buffers (NumPy arrays, array.array) are read in place
+                source = value
+            except (TypeError, ValueError):
+                source = array.array("f", [float(x) for x in value])
+            if source.shape[0] < count:
+                raise ValueError(item, value)
+            for i in range(count):
+                self.busses[start + i * step] = source[i]
             return
         raise ValueError(item, value)
+
+    @property
+    def control_busses(self) -> memoryview:
+        """
+        Get a writable float32 memoryview over all control busses.
+
+        Wrap with ``numpy.asarray()`` for a zero-copy NumPy view. The view is only
+        valid while the server is running.
+        """
+        return memoryview(self.busses)
+
+    def get_scope_buffer_reader(self, unsigned int index) -> "ScopeBufferReader":
+        """
+        Get a reader for one of the server's scope buffers.
+
+        :param index: The scope buffer index, as passed to ``ScopeOut2``.
+        """
+        if index >= self.scope_buffer_count:
+            raise ValueError("index out of bounds")
+        return ScopeBufferReader(self, index)
+
+
+cdef class ScopeBufferReader:
+    """
+    Lock-free reader for a single shared memory scope buffer.
+
+    scsynth's ``ScopeOut2`` writes into one of three regions and publishes each
+    completed block by swapping it into a staging slot. Reading pulls the staging
+    slot (if changed) into the reader's own region, so reads never block the audio
+    thread and never observe a partially-written block.
+    """
+    cdef ServerSHM shm
+    cdef scope_buffer_reader reader
+    cdef unsigned int frames
+    cdef readonly unsigned int index
+
+    def __cinit__(self, ServerSHM shm, unsigned int index):
+        self.shm = shm
+        self.index = index
+        self.frames = 0
+        self.reader = shm.client.get_scope_buffer_reader(index)
+
+    def read(self, bint changed_only=False) -> Optional[memoryview]:
+        """
+        Read the most recently published block.
+
+        Returns a ``(frames, channels)`` float32 memoryview over a copy of the block,
+        or ``None`` if no ``ScopeOut2`` is currently writing this scope buffer.
+
+        :param changed_only: Flag for returning ``None`` rather than re-reading a
+            block which has already been read.
+        """
+        cdef unsigned int channels
+        cdef cvarray result
+        cdef float* previous
+        if not self.reader.valid():
+            return None
+        # pulling only swaps in a new region when a block has been published since
+        # the last pull, and keeps reporting the last block's frame count otherwise
+        previous = self.reader.data()
+        self.reader.pull(self.frames)
+        if changed_only and self.reader.data() == previous:
+            return None
+        channels = self.reader.channels()
+        if not self.frames or not channels:
+            return None
+        result = cvarray(
+            shape=(self.frames, channels), itemsize=sizeof(float), format="f"
+        )
+        memcpy(
+            result.data, self.reader.data(), self.frames * channels * sizeof(float)
+        )
+        return memoryview(result)
+
+    @property
+    def channel_count(self) -> int:
+        """
+        Get the scope buffer's channel count, or zero if not being written.
+        """
+        return self.reader.channels() if self.reader.valid() else 0
+
+    @property
+    def max_frame_count(self) -> int:
+        """
+        Get the scope buffer's maximum block size, or zero if not being written.
+        """
+        return self.reader.max_frames() if self.reader.valid() else 0
+
+    @property
+    def valid(self) -> bool:
+        """
+        Get whether a ``ScopeOut2`` is currently writing this scope buffer.
+        """
+        return self.reader.valid()
@@ -0,0 +1,338 @@
+"""
+Tools for streaming control values to realtime servers.
+"""
+
+import asyncio
+import collections
+import threading
+from typing import Deque, Dict, List, Optional, Tuple, Union, cast
+
+from ..clocks import BaseClock, ClockContext, Quantization
+from ..enums import CalculationRate
+from .entities import Bus, Node
+from .errors import InvalidCalculationRate
+from .realtime import AsyncServer, BaseServer
+from .requests import SetControlBus, SetNodeControl
+
+
+class ControlStream:
+    """
+    The latest value of a node control or control bus, awaiting its next flush.
+
+    Setting a stream only records the value and, if the stream was clean, queues it
+    on its flusher, so it may be called from any thread at any rate without taking
+    a lock. Values set between flushes overwrite each other and only the latest is
+    sent. Values identical to the last one sent are dropped.
+
+    Create streams with :py:meth:`ControlStreamFlusher.stream`.
+
+    :param flusher: The stream's flusher.
+    :param target: The node or control bus to stream values to.
+    :param control: The node control to stream values to.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        flusher: "ControlStreamFlusher",
+        target: Union[Bus, Node],
+        control: Optional[Union[int, str]] = None,
+    ) -> None:
+        self._control = control
+        self._dirty = False
+        self._flusher = flusher
+        self._sent_value: Optional[float] = None
+        self._target = target
+        self._value: Optional[float] = None
+
+    ### PUBLIC METHODS ###
+
+    def set(self, value: float) -> None:
+        """
+        Set the stream's value.
+
+        :param value: The value to send on the next flush.
+        """
+        self._value = float(value)
+        if self._dirty:
+            return
+        # a racing flush may queue the stream twice, which flushing tolerates
+        self._dirty = True
+        self._flusher._dirty_streams.append(self)
+        self._flusher._wake()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def control(self) -> Optional[Union[int, str]]:
+        """
+        Get the stream's node control, if streaming to a node.
+        """
+        return self._control
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Get whether the stream holds a value not yet flushed.
+        """
+        return self._dirty
+
+    @property
+    def target(self) -> Union[Bus, Node]:
+        """
+        Get the stream's node or control bus.
+        """
+        return self._target
+
+    @property
+    def value(self) -> Optional[float]:
+        """
+        Get the stream's latest value.
+        """
+        return self._value
+
+
+class ControlStreamFlusher:
+    """
+    A rate limiter batching control streams into bundles.
+
+    Each flush sends every dirty stream's latest value in one bundle: a single
+    ``/n_set`` per node and a single ``/c_set`` covering every bus.
+
+    Without a clock, the flusher wakes when any stream becomes dirty and flushes at
+    most ``rate`` times per second, on a daemon thread for
+    :py:class:`~supriya.contexts.realtime.Server` or as a task on the running event
+    loop for :py:class:`~supriya.contexts.realtime.AsyncServer`. With a clock, it
+    flushes on every ``quantization`` tick instead, timestamping each bundle with
+    the tick's time.
+
+    ::
+
+        >>> from supriya import default
+        >>> from supriya.contexts import ControlStreamFlusher, Server
+        >>> server = Server().boot()  # doctest: +SKIP
+        >>> synth = server.add_synth(default)  # doctest: +SKIP
+        >>> flusher = ControlStreamFlusher(server, rate=60).start()  # doctest: +SKIP
+        >>> frequency = flusher.stream(synth, "frequency")  # doctest: +SKIP
+        >>> for i in range(1000):  # doctest: +SKIP
+        ...     frequency.set(440 + i)
+        ...
+
+    :param context: The server to send values to.
+    :param rate: The maximum number of flushes per second, when not using a clock.
+    :param clock: The clock to flush on, instead of rate limiting.
+    :param quantization: The clock tick to flush on.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        context: BaseServer,
+        rate: float = 100.0,
+        *,
+        clock: Optional[BaseClock] = None,
+        quantization: Quantization = "1/16",
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(rate)
+        self._async_event: Optional[asyncio.Event] = None
+        self._clock = clock
+        self._clock_event_id: Optional[int] = None
+        self._context = context
+        self._dirty_streams: Deque[ControlStream] = collections.deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._quantization = quantization
+        self._rate = float(rate)
+        self._stop_event = threading.Event()
+        self._streams: Dict[Tuple[int, Optional[Union[int, str]]], ControlStream] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake_event = threading.Event()
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "ControlStreamFlusher":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ### PRIVATE METHODS ###
+
+    def _clock_callback(self, clock_context: ClockContext, *args, **kwargs) -> float:
+        self.flush(seconds=clock_context.desired_moment.seconds)
+        return cast(BaseClock, self._clock).quantization_to_beats(self._quantization)
+
+    async def _run_async(
+        self, event: asyncio.Event, stop_event: threading.Event
+    ) -> None:
+        while not stop_event.is_set():
+            await event.wait()
+            event.clear()
+            if stop_event.is_set():
+                break
+            self.flush()
+            await asyncio.sleep(1 / self._rate)
+
+    def _run_threaded(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            self._wake_event.wait()
+            self._wake_event.clear()
+            if stop_event.is_set():
+                break
+            self.flush()
+            stop_event.wait(1 / self._rate)
+
+    def _wake(self) -> None:
+        if self._clock is not None:
+            return
+        if self._thread is not None and not self._wake_event.is_set():
+            self._wake_event.set()
+        elif self._loop is not None and not self._wake_event.is_set():
+            # the flag spares a cross-thread call per value while a wake is pending
+            self._wake_event.set()
+            self._loop.call_soon_threadsafe(self._wake_async)
+
+    def _wake_async(self) -> None:
+        self._wake_event.clear()
+        if self._async_event is not None:
+            self._async_event.set()
+
+    ### PUBLIC METHODS ###
+
+    def flush(self, seconds: Optional[float] = None) -> int:
+        """
+        Send every dirty stream's latest value in one bundle.
+
+        Emit ``/n_set`` and ``/c_set`` requests.
+
+        :param seconds: The bundle's timestamp.
+        :returns: The number of values sent.
+        """
+        bus_items: List[Tuple[int, float]] = []
+        node_items: Dict[int, List[Tuple[Union[int, str], float]]] = {}
+        while True:
+            try:
+                stream = self._dirty_streams.popleft()
+            except IndexError:
+                break
+            if not stream._dirty:
+                continue
+            # clear before reading, so a concurrent set() re-queues the stream
+            stream._dirty = False
+            if (value := stream._value) is None or value == stream._sent_value:
+                continue
+            stream._sent_value = value
+            if stream._control is None:
+                bus_items.append((stream._target.id_, value))
+            else:
+                node_items.setdefault(stream._target.id_, []).append(
+                    (stream._control, value)
+                )
+        if not (bus_items or node_items):
+            return 0
+        requests: List[Union[SetControlBus, SetNodeControl]] = [
+            SetNodeControl(node_id=node_id, items=items)
+            for node_id, items in node_items.items()
+        ]
+        if bus_items:
+            requests.append(SetControlBus(items=bus_items))
+        with self._context.at(seconds):
+            self._context._add_requests(*requests)
+        return len(bus_items) + sum(len(items) for items in node_items.values())
+
+    def start(self) -> "ControlStreamFlusher":
+        """
+        Start flushing.
+        """
+        if (
+            self._clock_event_id is not None
+            or self._task is not None
+            or self._thread is not None
+        ):
+            return self
+        self._stop_event = threading.Event()
+        if self._clock is not None:
+            self._clock_event_id = self._clock.cue(
+                self._clock_callback, quantization=self._quantization
+            )
+        elif isinstance(self._context, AsyncServer):
+            self._async_event = asyncio.Event()
+            self._loop = asyncio.get_running_loop()
+            self._task = self._loop.create_task(
+                self._run_async(self._async_event, self._stop_event)
+            )
+        else:
+            self._thread = threading.Thread(
+                target=self._run_threaded, args=(self._stop_event,), daemon=True
+            )
+            self._thread.start()
+        # values set before starting are flushed straight away
+        self._wake_event.clear()
+        if self._dirty_streams:
+            self._wake()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop flushing.
+
+        Values still pending are discarded unless flushed explicitly.
+        """
+        self._stop_event.set()
+        if self._clock_event_id is not None:
+            cast(BaseClock, self._clock).cancel(self._clock_event_id)
+        if self._async_event is not None:
+            self._async_event.set()
+        self._wake_event.set()
+        self._async_event = None
+        self._clock_event_id = None
+        self._loop = None
+        self._task = None
+        self._thread = None
+
+    def stream(
+        self, target: Union[Bus, Node], control: Optional[Union[int, str]] = None
+    ) -> ControlStream:
+        """
+        Get the stream for a node control or control bus.
+
+        Repeated calls with the same target and control return the same stream.
+
+        :param target: The node or control bus to stream values to.
+        :param control: The node control to stream values to. Required for nodes,
+            and disallowed for buses.
+        """
+        if isinstance(target, Bus):
+            if control is not None:
+                raise ValueError(control)
+            if target.calculation_rate != CalculationRate.CONTROL:
+                raise InvalidCalculationRate
+        elif control is None:
+            raise ValueError(control)
+        key = (target.id_, control)
+        if (stream := self._streams.get(key)) is None:
+            stream = self._streams[key] = ControlStream(self, target, control)
+        return stream
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Get the flusher's running status.
+        """
+        return (
+            self._clock_event_id is not None
+            or self._task is not None
+            or self._thread is not None
+        )
+
+    @property
+    def rate(self) -> float:
+        """
+        Get the maximum number of flushes per second.
+        """
+        return self._rate
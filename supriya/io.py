@@ -3,10 +3,11 @@ import dataclasses
 import datetime
 import hashlib
 import platform
+import struct
 import subprocess
 from os import PathLike
 from pathlib import Path
-from typing import Coroutine, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Coroutine, Optional, Tuple, Union
 
 from uqbar.graphs import Grapher
 from uqbar.io import open_path
@@ -15,6 +16,9 @@ import supriya
 
 from .typing import SupportsPlot, SupportsRender, SupportsRenderMemo
 
+if TYPE_CHECKING:
+    import numpy
+
 
 @dataclasses.dataclass(frozen=True)
 class PlayMemo:
@@ -132,6 +136,61 @@ def plot(plottable: SupportsPlot, format_="png", **kwargs):
     return Plotter(plottable, format_=format_, **kwargs)()
 
 
+def read_float_wav(path: PathLike) -> Tuple["numpy.ndarray", int]:
+    """
+    Memory-map a 32-bit float WAV file as a ``(frames, channels)`` array.
+
+    Returns the array and the file's sample rate.
+
+    ::
+
+        >>> import numpy, tempfile
+        >>> from pathlib import Path
+        >>> from supriya.io import read_float_wav, write_float_wav
+        >>> with tempfile.TemporaryDirectory() as temp_directory:
+        ...     path = Path(temp_directory) / "tmp.wav"
+        ...     write_float_wav(path, numpy.array([[0.0, 0.5], [0.25, -1.0]]), 48000)
+        ...     array, sample_rate = read_float_wav(path)
+        ...     array.tolist(), sample_rate
+        ...
+        ([[0.0, 0.5], [0.25, -1.0]], 48000)
+    """
+    import numpy
+
+    channel_count = sample_rate = 0
+    with open(path, "rb") as file_pointer:
+        riff, _, wave = struct.unpack("<4sI4s", file_pointer.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise ValueError(f"{path} is not a WAV file")
+        while len(header := file_pointer.read(8)) == 8:
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                chunk = file_pointer.read(chunk_size + (chunk_size & 1))
+                format_tag, channel_count, sample_rate, _, _, bit_depth = struct.unpack(
+                    "<HHIIHH", chunk[:16]
+                )
+                if format_tag == 0xFFFE:  # WAVE_FORMAT_EXTENSIBLE
+                    format_tag = struct.unpack("<H", chunk[24:26])[0]
+                if format_tag != 3 or bit_depth != 32:  # WAVE_FORMAT_IEEE_FLOAT
+                    raise ValueError(f"{path} is not a 32-bit float WAV file")
+            elif chunk_id == b"data":
+                if not channel_count:
+                    raise ValueError(f"{path} has no format chunk")
+                offset = file_pointer.tell()
+                frame_count = chunk_size // (4 * channel_count)
+                break
+            else:
+                file_pointer.seek(chunk_size + (chunk_size & 1), 1)
+        else:
+            raise ValueError(f"{path} has no data chunk")
+    if not frame_count:
+        return numpy.zeros((0, channel_count), dtype=numpy.float32), sample_rate
+    array = numpy.memmap(
+        path, dtype="<f4", mode="r", offset=offset, shape=(frame_count, channel_count)
+    )
+    return array, sample_rate
+
+
 def render(
     renderable: Union[SupportsRender, SupportsRenderMemo],
     output_file_path: Optional[PathLike] = None,
@@ -151,4 +210,46 @@ def render(
     )
 
 
-__all__ = ["Player", "Plotter", "graph", "play", "plot", "render"]
+def write_float_wav(path: PathLike, array: "numpy.ndarray", sample_rate: int) -> None:
+    """
+    Write a ``(frames, channels)`` or ``(frames,)`` array as a 32-bit float WAV file.
+    """
+    import numpy
+
+    array = numpy.ascontiguousarray(array, dtype="<f4")
+    if array.ndim == 1:
+        array = array[:, None]
+    frame_count, channel_count = array.shape
+    with open(path, "wb") as file_pointer:
+        file_pointer.write(
+            struct.pack(
+                "<4sI4s4sIHHIIHHH4sI",
+                b"RIFF",
+                38 + array.nbytes,
+                b"WAVE",
+                b"fmt ",
+                18,
+                3,  # WAVE_FORMAT_IEEE_FLOAT
+                channel_count,
+                sample_rate,
+                sample_rate * channel_count * 4,
+                channel_count * 4,
+                32,
+                0,
+                b"data",
+                array.nbytes,
+            )
+        )
+        array.tofile(file_pointer)
+
+
+__all__ = [
+    "Player",
+    "Plotter",
+    "graph",
+    "play",
+    "plot",
+    "read_float_wav",
+    "render",
+    "write_float_wav",
+]
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from collections.abc import Sequence as SequenceABC
 from typing import Awaitable, Callable, Dict, Optional, Sequence, Set, Tuple, Union
 
@@ -114,6 +115,7 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
 
     def datagram_received(self, data, addr):
         loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
         for callback, message in self._validate_receive(data):
             if asyncio.iscoroutine(
                 result := callback.procedure(
@@ -122,6 +124,7 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
             ):
                 self.background_tasks.add(task := loop.create_task(result))
                 task.add_done_callback(self.background_tasks.discard)
+        self.callback_seconds += time.perf_counter() - start_time
 
     def error_received(self, exc):
         osc_out_logger.warning(
@@ -197,7 +200,8 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         return callback
 
     def send(self, message: Union[OscBundle, OscMessage, SequenceABC, str]) -> None:
-        self.transport.sendto(self._send(message))
+        for datagram in self._send(message):
+            self.transport.sendto(datagram)
 
     def unregister(self, callback: OscCallback):
         self._remove_callback(callback)
@@ -1,4 +1,3 @@
-import collections
 import datetime
 import enum
 import struct
@@ -471,21 +470,32 @@ class OscBundle:
         return osc_bundle
 
     @classmethod
-    def partition(cls, messages, timestamp=None):
+    def partition(cls, messages, timestamp=None, maximum_size=8192):
+        """
+        Partition `messages` into bundles whose datagrams fit in `maximum_size`.
+
+        ::
+
+            >>> from supriya.osc import OscBundle, OscMessage
+            >>> messages = [OscMessage("/n_set", i, "amplitude", 0.5) for i in range(100)]
+            >>> bundles = OscBundle.partition(messages, maximum_size=512)
+            >>> [len(bundle.contents) for bundle in bundles]
+            [12, 12, 12, 12, 12, 12, 12, 12, 4]
+            >>> all(len(bundle.to_datagram()) <= 512 for bundle in bundles)
+            True
+        """
         bundles = []
-        contents = []
-        message = collections.deque(messages)
-        remaining = maximum = 8192 - len(BUNDLE_PREFIX) - 4
-        while messages:
-            message = messages.popleft()
-            datagram = message.to_datagram()
-            remaining -= len(datagram) + 4
-            if remaining > 0:
-                contents.append(message)
-            else:
+        contents: List = []
+        # bundle prefix plus 8-byte timetag
+        remaining = maximum = maximum_size - len(BUNDLE_PREFIX) - 8
+        for message in messages:
+            # content datagram plus its 4-byte length prefix
+            size = len(message.to_datagram()) + 4
+            if contents and size > remaining:
                 bundles.append(cls(timestamp=timestamp, contents=contents))
-                contents = [message]
-                remaining = maximum
+                contents, remaining = [], maximum
+            contents.append(message)
+            remaining -= size
         if contents:
             bundles.append(cls(timestamp=timestamp, contents=contents))
         return bundles
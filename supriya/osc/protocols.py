@@ -28,6 +28,9 @@ osc_out_logger = logging.getLogger("supriya.osc.out")
 udp_in_logger = logging.getLogger("supriya.udp.in")
 udp_out_logger = logging.getLogger("supriya.udp.out")
 
+# Largest UDP payload over IPv4
+MAXIMUM_DATAGRAM_SIZE = 65507
+
 
 def find_free_port():
     with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM)) as s:
@@ -144,9 +147,18 @@ class OscProtocol:
     ) -> None:
         self.callbacks: Dict[Any, Any] = {}
         self.captures: Set[Capture] = set()
+        # raw datagram handlers by address, run before decoding; returning True
+        # consumes the datagram, skipping callback matching
+        self.datagram_handlers: Dict[bytes, Callable[[bytes], bool]] = {}
         self.healthcheck: Optional[HealthCheck] = None
         self.healthcheck_osc_callback: Optional[OscCallback] = None
         self.attempts = 0
+        # client-side traffic counters, for telemetry
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.callback_seconds = 0.0
+        self.datagrams_received = 0
+        self.datagrams_sent = 0
         self.ip_address = "127.0.0.1"
         self.name = name
         self.port = 57551
@@ -293,7 +305,7 @@ class OscProtocol:
             kwargs=kwargs,
         )
 
-    def _send(self, message):
+    def _send(self, message) -> List[bytes]:
         if self.status not in (BootStatus.BOOTING, BootStatus.ONLINE):
             raise OscProtocolOffline
         if not isinstance(message, (str, SequenceABC, OscBundle, OscMessage)):
@@ -310,12 +322,25 @@ class OscProtocol:
             capture.messages.append(
                 CaptureEntry(timestamp=time.time(), label="S", message=message)
             )
-        datagram = message.to_datagram()
-        udp_out_logger.debug(
-            f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
-            f"{datagram}"
-        )
-        return datagram
+        datagrams = [message.to_datagram()]
+        if len(datagrams[0]) > MAXIMUM_DATAGRAM_SIZE and isinstance(message, OscBundle):
+            # Split oversized bundles into consecutive same-timestamp bundles
+            datagrams = [
+                bundle.to_datagram()
+                for bundle in OscBundle.partition(
+                    message.contents,
+                    timestamp=message.timestamp,
+                    maximum_size=MAXIMUM_DATAGRAM_SIZE,
+                )
+            ]
+        self.datagrams_sent += len(datagrams)
+        for datagram in datagrams:
+            self.bytes_sent += len(datagram)
+            udp_out_logger.debug(
+                f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
+                f"{datagram}"
+            )
+        return datagrams
 
     def _setup(
         self, ip_address: str, port: int, healthcheck: Optional[HealthCheck]
@@ -331,6 +356,14 @@ class OscProtocol:
             )
 
     def _validate_receive(self, datagram):
+        self.bytes_received += len(datagram)
+        self.datagrams_received += 1
+        handled = False
+        if self.datagram_handlers and (
+            handler := self.datagram_handlers.get(datagram[: datagram.find(b"\x00")])
+        ):
+            if (handled := handler(datagram)) and not self.captures:
+                return
         udp_in_logger.debug(
             f"[{self.ip_address}:{self.port}/{self.name or hex(id(self))}] "
             f"{datagram}"
@@ -347,6 +380,8 @@ class OscProtocol:
             capture.messages.append(
                 CaptureEntry(timestamp=time.time(), label="R", message=message)
             )
+        if handled:
+            return
         for callback in self._match_callbacks(message):
             yield callback, message
 
@@ -373,8 +408,16 @@ class OscProtocol:
     ) -> OscCallback:
         raise NotImplementedError
 
+    def register_datagram_handler(
+        self, address: str, handler: Callable[[bytes], bool]
+    ) -> None:
+        self.datagram_handlers[address.encode()] = handler
+
     def send(self, message: Union[OscBundle, OscMessage, SequenceABC, str]) -> None:
         raise NotImplementedError
 
     def unregister(self, callback: OscCallback) -> None:
         raise NotImplementedError
+
+    def unregister_datagram_handler(self, address: str) -> None:
+        self.datagram_handlers.pop(address.encode(), None)
@@ -44,12 +44,13 @@ class ThreadedOscProtocol(OscProtocol):
     class Handler(socketserver.BaseRequestHandler):
         def handle(self) -> None:
             data = self.request[0]
-            for callback, message in cast(
-                ThreadedOscProtocol.Server, self.server
-            ).osc_protocol._validate_receive(data):
+            osc_protocol = cast(ThreadedOscProtocol.Server, self.server).osc_protocol
+            start_time = time.perf_counter()
+            for callback, message in osc_protocol._validate_receive(data):
                 callback.procedure(
                     message, *(callback.args or ()), **(callback.kwargs or {})
                 )
+            osc_protocol.callback_seconds += time.perf_counter() - start_time
 
     ### INITIALIZER ###
 
@@ -233,10 +234,8 @@ class ThreadedOscProtocol(OscProtocol):
 
     def send(self, message: Union[OscBundle, OscMessage, SequenceABC, str]) -> None:
         try:
-            self.osc_server.socket.sendto(
-                self._send(message),
-                (self.ip_address, self.port),
-            )
+            for datagram in self._send(message):
+                self.osc_server.socket.sendto(datagram, (self.ip_address, self.port))
         except OSError:
             # print(message)
             raise
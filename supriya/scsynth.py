@@ -1,16 +1,33 @@
 import asyncio
 import atexit
+import collections
 import concurrent.futures
+import contextlib
 import enum
+import itertools
 import logging
 import os
 import platform
 import shlex
+import socket
 import subprocess
 import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import IO, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
+from typing import (
+    IO,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import psutil
 import uqbar.io
@@ -18,6 +35,7 @@ import uqbar.objects
 
 from .enums import BootStatus
 from .exceptions import ServerCannotBoot
+from .osc import OscMessage, find_free_port
 from .typing import FutureLike
 
 logger = logging.getLogger(__name__)
@@ -49,6 +67,7 @@ class Options:
     load_synthdefs: bool = True
     maximum_logins: int = 1
     maximum_node_count: int = 1024
+    maximum_node_id: int = 0x03FFFFFF
     maximum_synthdef_count: int = 1024
     memory_locking: bool = False
     memory_size: int = 8192
@@ -260,6 +279,22 @@ class LineStatus(enum.IntEnum):
     CONTINUE = 0
     READY = 1
     ERROR = 2
+    LATE = 3
+
+
+@dataclass(frozen=True)
+class LateEvent:
+    """
+    A timestamped bundle which reached scsynth after its scheduled time.
+
+    :param lateness: How late the bundle was, in seconds.
+    :param timestamp: The wall-clock time the report was read.
+    :param count: The number of late bundles reported so far, including this one.
+    """
+
+    lateness: float
+    timestamp: float
+    count: int
 
 
 class Capture:
@@ -288,14 +323,17 @@ class ProcessProtocol:
         *,
         name: Optional[str] = None,
         on_boot_callback: Optional[Callable] = None,
+        on_late_callback: Optional[Callable[[LateEvent], None]] = None,
         on_panic_callback: Optional[Callable] = None,
         on_quit_callback: Optional[Callable] = None,
     ) -> None:
         self.buffer_ = ""
         self.captures: Set[Capture] = set()
         self.error_text = ""
+        self.late_count = 0
         self.name = name
         self.on_boot_callback = on_boot_callback
+        self.on_late_callback = on_late_callback
         self.on_panic_callback = on_panic_callback
         self.on_quit_callback = on_quit_callback
         self.status = BootStatus.OFFLINE
@@ -316,6 +354,7 @@ class ProcessProtocol:
         self.status = BootStatus.BOOTING
         self.error_text = ""
         self.buffer_ = ""
+        self.late_count = 0
         logger.info(
             f"[{self.options.ip_address}:{self.options.port}/{self.name or hex(id(self))}] "
             "command: {}".format(shlex.join(options))
@@ -336,7 +375,9 @@ class ProcessProtocol:
                 for capture in self.captures:
                     capture.lines.append(line)
                 line_status = self._parse_line(line)
-                if line_status == LineStatus.READY:
+                if line_status == LineStatus.LATE:
+                    self._handle_late_line(line)
+                elif line_status == LineStatus.READY:
                     boot_future.set_result(True)
                     self.status = BootStatus.ONLINE
                     resolved = True
@@ -356,7 +397,26 @@ class ProcessProtocol:
             self.buffer_ = text
         return resolved, errored
 
+    def _handle_late_line(self, line: str) -> None:
+        try:
+            lateness = float(line.split()[1])
+        except (IndexError, ValueError):
+            return
+        self.late_count += 1
+        if self.on_late_callback is None:
+            return
+        self.on_late_callback(
+            LateEvent(lateness=lateness, timestamp=time.time(), count=self.late_count)
+        )
+
     def _parse_line(self, line: str) -> LineStatus:
+        if line.startswith("late "):
+            # frequent under load, so kept out of the info log
+            logger.debug(
+                f"[{self.options.ip_address}:{self.options.port}/{self.name or hex(id(self))}] "
+                f"received: {line}"
+            )
+            return LineStatus.LATE
         logger.info(
             f"[{self.options.ip_address}:{self.options.port}/{self.name or hex(id(self))}] "
             f"received: {line}"
@@ -391,12 +451,14 @@ class SyncProcessProtocol(ProcessProtocol):
         *,
         name: Optional[str] = None,
         on_boot_callback: Optional[Callable] = None,
+        on_late_callback: Optional[Callable[[LateEvent], None]] = None,
         on_panic_callback: Optional[Callable] = None,
         on_quit_callback: Optional[Callable] = None,
     ) -> None:
         super().__init__(
             name=name,
             on_boot_callback=on_boot_callback,
+            on_late_callback=on_late_callback,
             on_panic_callback=on_panic_callback,
             on_quit_callback=on_quit_callback,
         )
@@ -475,6 +537,7 @@ class AsyncProcessProtocol(asyncio.SubprocessProtocol, ProcessProtocol):
         *,
         name: Optional[str] = None,
         on_boot_callback: Optional[Callable] = None,
+        on_late_callback: Optional[Callable[[LateEvent], None]] = None,
         on_panic_callback: Optional[Callable] = None,
         on_quit_callback: Optional[Callable] = None,
     ) -> None:
@@ -482,6 +545,7 @@ class AsyncProcessProtocol(asyncio.SubprocessProtocol, ProcessProtocol):
             self,
             name=name,
             on_boot_callback=on_boot_callback,
+            on_late_callback=on_late_callback,
             on_panic_callback=on_panic_callback,
             on_quit_callback=on_quit_callback,
         )
@@ -601,3 +665,306 @@ class AsyncNonrealtimeProcessProtocol(asyncio.SubprocessProtocol, ProcessProtoco
                 self.boot_future.set_result(False)
         except asyncio.exceptions.InvalidStateError:
             pass
+
+
+class ProcessPool:
+    """
+    A pool of idle scsynth processes, booted ahead of time.
+
+    A background thread keeps ``size`` processes booted with the pool's options,
+    each on its own free port, booting replacements as processes are acquired.
+    Idle processes are health-checked with ``/status`` every
+    ``health_check_interval`` seconds, and dead or unresponsive ones are replaced.
+
+    Released processes return to the pool until they have been used
+    ``maximum_uses`` times, after which they are quit and replaced.
+
+    ::
+
+        >>> from supriya.contexts import Server
+        >>> from supriya.scsynth import ProcessPool
+        >>> pool = ProcessPool(size=2).start()  # doctest: +SKIP
+        >>> server = Server().boot(pool=pool)  # doctest: +SKIP
+        >>> server.quit()  # doctest: +SKIP
+        >>> pool.stop()  # doctest: +SKIP
+
+    :param options: The options every process boots with. Ports are chosen by the
+        pool.
+    :param size: The number of idle processes to keep.
+    :param maximum_uses: The number of uses after which a process is replaced.
+    :param health_check_interval: The number of seconds between health checks.
+    :param kwargs: Keyword arguments for options.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        options: Optional[Options] = None,
+        size: int = 2,
+        *,
+        maximum_uses: int = 10,
+        health_check_interval: float = 5.0,
+        **kwargs,
+    ) -> None:
+        if size < 1:
+            raise ValueError(size)
+        if maximum_uses < 1:
+            raise ValueError(maximum_uses)
+        self._booting_count = 0
+        self._condition = threading.Condition()
+        self._counter = itertools.count()
+        self._health_check_interval = float(health_check_interval)
+        self._idle: Deque[SyncProcessProtocol] = collections.deque()
+        self._lent: Set[SyncProcessProtocol] = set()
+        self._maximum_uses = maximum_uses
+        self._options = uqbar.objects.new(options or Options(), **kwargs)
+        self._retiring: List[SyncProcessProtocol] = []
+        self._size = size
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._use_counts: Dict[SyncProcessProtocol, int] = {}
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "ProcessPool":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ### PRIVATE METHODS ###
+
+    def _check_health(self, process_protocol: SyncProcessProtocol) -> bool:
+        if not self._is_alive(process_protocol):
+            return False
+        options = process_protocol.options
+        with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM)) as s:
+            s.settimeout(1.0)
+            try:
+                s.sendto(
+                    OscMessage("/status").to_datagram(),
+                    (options.ip_address, options.port),
+                )
+                datagram, _ = s.recvfrom(65536)
+            except OSError:
+                return False
+        return OscMessage.from_datagram(datagram).address == "/status.reply"
+
+    def _is_alive(self, process_protocol: SyncProcessProtocol) -> bool:
+        return (
+            process_protocol.status == BootStatus.ONLINE
+            and process_protocol.process.poll() is None
+        )
+
+    def _retire(self, process_protocol: SyncProcessProtocol) -> None:
+        self._use_counts.pop(process_protocol, None)
+        try:
+            process_protocol.quit()
+        except Exception:
+            logger.exception("Failed to quit pooled process")
+
+    def _run(self, stop_event: threading.Event) -> None:
+        next_health_check = time.monotonic() + self._health_check_interval
+        while True:
+            with self._condition:
+                retiring, self._retiring = self._retiring, []
+                if stop_event.is_set():
+                    retiring.extend(self._idle)
+                    self._idle.clear()
+                    spawn_count = 0
+                else:
+                    spawn_count = max(
+                        0, self._size - len(self._idle) - self._booting_count
+                    )
+                    self._booting_count += spawn_count
+            for process_protocol in retiring:
+                self._retire(process_protocol)
+            if stop_event.is_set():
+                return
+            # boot in parallel, as each boot mostly waits on scsynth
+            for _ in range(spawn_count):
+                threading.Thread(target=self._spawn, daemon=True).start()
+            if time.monotonic() >= next_health_check:
+                next_health_check = time.monotonic() + self._health_check_interval
+                with self._condition:
+                    idle = list(self._idle)
+                for process_protocol in idle:
+                    if self._check_health(process_protocol):
+                        continue
+                    with self._condition:
+                        if process_protocol in self._idle:
+                            self._idle.remove(process_protocol)
+                            self._retiring.append(process_protocol)
+                continue
+            with self._condition:
+                if not (self._retiring or stop_event.is_set()):
+                    self._condition.wait(max(0.0, next_health_check - time.monotonic()))
+
+    def _spawn(self) -> None:
+        process_protocol = SyncProcessProtocol(name=f"pool-{next(self._counter)}")
+        options = uqbar.objects.new(self._options, port=find_free_port())
+        try:
+            # fail here rather than in the process thread, which would never resolve
+            find(options.executable)
+            process_protocol.boot(options)
+        except (RuntimeError, ServerCannotBoot):
+            logger.exception("Failed to boot pooled process")
+            with self._condition:
+                self._booting_count -= 1
+            return
+        with self._condition:
+            self._booting_count -= 1
+            if not (stopped := self._stop_event.is_set()):
+                self._idle.append(process_protocol)
+                self._condition.notify_all()
+        if stopped:
+            self._retire(process_protocol)
+
+    ### PUBLIC METHODS ###
+
+    def acquire(
+        self,
+        timeout: float = 10.0,
+        *,
+        on_late_callback: Optional[Callable[[LateEvent], None]] = None,
+        on_panic_callback: Optional[Callable] = None,
+    ) -> SyncProcessProtocol:
+        """
+        Acquire a booted process, starting the pool if needed.
+
+        Raises :py:class:`~supriya.exceptions.ServerCannotBoot` if no process is
+        ready within ``timeout`` seconds.
+
+        :param timeout: The number of seconds to wait for a process.
+        :param on_late_callback: The callable to notify of late bundle reports.
+        :param on_panic_callback: The callable to notify if the process exits.
+        """
+        self.start()
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                while self._idle:
+                    process_protocol = self._idle.popleft()
+                    if self._is_alive(process_protocol):
+                        break
+                    self._retiring.append(process_protocol)
+                else:
+                    self._condition.notify_all()
+                    if not self._condition.wait(deadline - time.monotonic()):
+                        raise ServerCannotBoot("No pooled process became ready")
+                    continue
+                break
+            process_protocol.on_late_callback = on_late_callback
+            process_protocol.on_panic_callback = on_panic_callback
+            self._lent.add(process_protocol)
+            # wake the refill thread to replace it
+            self._condition.notify_all()
+        return process_protocol
+
+    def release(
+        self, process_protocol: SyncProcessProtocol, *, reusable: bool = True
+    ) -> None:
+        """
+        Return an acquired process to the pool.
+
+        Its user must have reset the process's state, as with ``/g_freeAll``, and
+        turned off its notifications first. Otherwise, release it as not reusable, to
+        quit and replace it.
+
+        :param process_protocol: The process to return.
+        :param reusable: Flag for returning the process to the idle processes.
+        """
+        with self._condition:
+            if process_protocol not in self._lent:
+                raise ValueError(process_protocol)
+            self._lent.remove(process_protocol)
+            process_protocol.on_late_callback = None
+            process_protocol.on_panic_callback = None
+            uses = self._use_counts[process_protocol] = (
+                self._use_counts.get(process_protocol, 0) + 1
+            )
+            if (
+                not reusable
+                or self._stop_event.is_set()
+                or uses >= self._maximum_uses
+                or len(self._idle) >= self._size
+                or not self._is_alive(process_protocol)
+            ):
+                self._retiring.append(process_protocol)
+            else:
+                self._idle.append(process_protocol)
+            self._condition.notify_all()
+            retiring: List[SyncProcessProtocol] = []
+            if self._thread is None:
+                # once stopped, nothing else quits retiring processes
+                retiring, self._retiring = self._retiring, []
+        for process_protocol in retiring:
+            self._retire(process_protocol)
+
+    def start(self) -> "ProcessPool":
+        """
+        Start booting processes in the background.
+        """
+        with self._condition:
+            if self._thread is not None:
+                return self
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stop_event,), daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Quit every idle process and stop booting more.
+
+        Processes still acquired are quit when released.
+        """
+        with self._condition:
+            if (thread := self._thread) is None:
+                return
+            self._stop_event.set()
+            self._thread = None
+            self._condition.notify_all()
+        thread.join()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def idle_count(self) -> int:
+        """
+        Get the number of booted processes ready to acquire.
+        """
+        with self._condition:
+            return len(self._idle)
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Get the pool's running state.
+        """
+        return self._thread is not None
+
+    @property
+    def lent_count(self) -> int:
+        """
+        Get the number of acquired processes not yet released.
+        """
+        with self._condition:
+            return len(self._lent)
+
+    @property
+    def options(self) -> Options:
+        """
+        Get the options every process boots with.
+        """
+        return self._options
+
+    @property
+    def size(self) -> int:
+        """
+        Get the number of idle processes kept.
+        """
+        return self._size
@@ -8,6 +8,7 @@ from .core import (  # isort:skip
     BinaryOpUGen,
     Check,
     Control,
+    ControlLayout,
     LagControl,
     OutputProxy,
     Parameter,
@@ -197,7 +198,17 @@ from .info import (
     SampleRate,
     SubsampleOffset,
 )
-from .inout import In, InFeedback, LocalIn, LocalOut, OffsetOut, Out, ReplaceOut, XOut
+from .inout import (
+    In,
+    InFeedback,
+    LocalIn,
+    LocalOut,
+    OffsetOut,
+    Out,
+    ReplaceOut,
+    ScopeOut2,
+    XOut,
+)
 from .lines import A2K, DC, K2A, AmpComp, AmpCompA, LinExp, LinLin, Line, Silence, XLine
 from .mac import KeyState, MouseButton, MouseX, MouseY
 from .ml import (
@@ -413,6 +424,7 @@ __all__ = [
     "CompanderD",
     "Control",
     "ControlDur",
+    "ControlLayout",
     "ControlRate",
     "Convolution",
     "Convolution2",
@@ -658,6 +670,7 @@ __all__ = [
     "Sanitize",
     "Saw",
     "Schmidt",
+    "ScopeOut2",
     "Select",
     "SendPeakRMS",
     "SendReply",
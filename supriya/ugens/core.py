@@ -5368,6 +5368,65 @@ class SynthDefError(Exception):
     pass
 
 
+class ControlLayout(NamedTuple):
+    """
+    A SynthDef's controls, ordered by control index.
+
+    ::
+
+        >>> from supriya import default
+        >>> layout = default.control_layout
+        >>> for name, index in zip(layout.names, layout.indices):
+        ...     name, index
+        ...
+        ('amplitude', 0)
+        ('frequency', 1)
+        ('gate', 2)
+        ('pan', 3)
+        ('out', 4)
+
+    ::
+
+        >>> [layout.names[i] for i in layout.name_order]
+        ['amplitude', 'frequency', 'gate', 'out', 'pan']
+    """
+
+    names: Tuple[str, ...]
+    indices: Tuple[int, ...]
+    defaults: Tuple[Tuple[float, ...], ...]
+    rates: Tuple[ParameterRate, ...]
+    mappable: Tuple[bool, ...]
+    positions: Mapping[Union[int, str], int]
+    name_order: Tuple[int, ...]
+
+    @classmethod
+    def from_parameters(
+        cls, parameters: Mapping[str, Tuple["Parameter", int]]
+    ) -> "ControlLayout":
+        indexed = sorted((index, parameter) for parameter, index in parameters.values())
+        names = tuple(cast(str, parameter.name) for _, parameter in indexed)
+        indices = tuple(index for index, _ in indexed)
+        positions: Dict[Union[int, str], int] = {}
+        for position, (name, index) in enumerate(zip(names, indices)):
+            positions[name] = positions[index] = position
+        return cls(
+            names=names,
+            indices=indices,
+            defaults=tuple(parameter.value for _, parameter in indexed),
+            rates=tuple(parameter.rate for _, parameter in indexed),
+            mappable=tuple(
+                parameter.rate is not ParameterRate.SCALAR
+                and parameter.name not in ("in_", "out")
+                for _, parameter in indexed
+            ),
+            positions=MappingProxyType(positions),
+            name_order=tuple(
+                position
+                for _, position in sorted((name, i) for i, name in enumerate(names))
+            ),
+        )
+
+
 class SynthDef:
 
     def __init__(self, ugens: Sequence[UGen], name: Optional[str] = None) -> None:
@@ -5387,6 +5446,10 @@ class SynthDef:
         self._parameters: Dict[str, Tuple[Parameter, int]] = (
             self._collect_indexed_parameters(self._controls)
         )
+        self._control_layout = ControlLayout.from_parameters(self._parameters)
+        self._indexed_parameters = tuple(
+            sorted((value[1], value[0]) for value in self._parameters.values())
+        )
         self._compiled_graph = _compile_ugen_graph(self)
 
     def __graph__(self) -> Graph:
@@ -5684,6 +5747,10 @@ class SynthDef:
     def constants(self) -> Sequence[float]:
         return self._constants
 
+    @property
+    def control_layout(self) -> ControlLayout:
+        return self._control_layout
+
     @property
     def controls(self) -> Sequence[Control]:
         return self._controls
@@ -5698,7 +5765,7 @@ class SynthDef:
 
     @property
     def indexed_parameters(self) -> Sequence[Tuple[int, Parameter]]:
-        return sorted((value[1], value[0]) for value in self.parameters.values())
+        return list(self._indexed_parameters)
 
     @property
     def name(self) -> Optional[str]:
@@ -6215,7 +6282,7 @@ def _compile_synthdef(synthdef: SynthDef, name: str) -> bytes:
     return b"".join(
         [
             _encode_string(name),
-            _compile_ugen_graph(synthdef),
+            synthdef._compiled_graph,
         ]
     )
 
@@ -141,6 +141,30 @@ class ReplaceOut(UGen):
     source = param(unexpanded=True)
 
 
+@ugen(ar=True, kr=True, channel_count=0, fixed_channel_count=True)
+class ScopeOut2(UGen):
+    """
+    A shared memory scope buffer writer.
+
+    ::
+
+        >>> source = supriya.ugens.In.ar(bus=0, channel_count=2)
+        >>> scope_out = supriya.ugens.ScopeOut2.ar(
+        ...     scope_id=0,
+        ...     max_frames=4096,
+        ...     scope_frames=1024,
+        ...     source=source,
+        ... )
+        >>> scope_out
+        <ScopeOut2.ar()>
+    """
+
+    scope_id = param(0)
+    max_frames = param(4096)
+    scope_frames = param(4096)
+    source = param(unexpanded=True)
+
+
 @ugen(ar=True, kr=True, is_output=True, channel_count=0, fixed_channel_count=True)
 class XOut(UGen):
     """
@@ -399,6 +399,25 @@ def test_set_buffer_range(context):
     ]
 
 
+def test_set_buffer_range_chunked(context):
+    values = [float(i) for i in range(4000)]
+    with context.at(0):
+        buffer = context.add_buffer(channel_count=1, frame_count=4096)
+        buffer.set_range(10, values)
+        buffer.set_range(0, (0.5, 0.25))
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/b_alloc", 0, 4096, 1),
+                OscMessage("/b_setn", 0, 10, 1633, *values[:1633]),
+                OscMessage("/b_setn", 0, 1643, 1633, *values[1633:3266]),
+                OscMessage("/b_setn", 0, 3276, 734, *values[3266:], 0, 2, 0.5, 0.25),
+            ),
+            timestamp=0.0,
+        )
+    ]
+
+
 def test_write_buffer(context, tmp_path):
     with context.at(0):
         buffer_a = context.add_buffer(channel_count=1, frame_count=23)
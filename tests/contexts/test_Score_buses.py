@@ -2,6 +2,7 @@ import logging
 
 import pytest
 
+from supriya.contexts.entities import Bus
 from supriya.contexts.errors import ContextError, InvalidCalculationRate
 from supriya.contexts.nonrealtime import Score
 from supriya.osc import OscBundle, OscMessage
@@ -134,3 +135,61 @@ async def test_set_bus_range(context):
             contents=(OscMessage("/c_setn", 0, 4, 0.1, 0.2, 0.3, 0.4),), timestamp=1.23
         )
     ]
+
+
+def test_allocation_batch(context):
+    with context.at(0):
+        with context.allocation_batch(audio_buses=4, control_buses=8) as batch:
+            audio_bus_group = context.add_bus_group("AUDIO", count=2)
+            control_buses = [context.add_bus("CONTROL") for _ in range(3)]
+            # exhausted reservations fall back to the allocators
+            overflow_bus_group = context.add_bus_group("AUDIO", count=4)
+        assert batch.remaining == {}
+        assert audio_bus_group.id_ == 16
+        assert [bus.id_ for bus in control_buses] == [0, 1, 2]
+        assert overflow_bus_group.id_ == 20
+        # unused reservations were returned
+        assert context.add_bus("AUDIO").id_ == 18
+        assert context.add_bus("CONTROL").id_ == 3
+        with pytest.raises(RuntimeError):
+            with context.allocation_batch(control_buses=16):
+                assert context.add_bus("CONTROL").id_ == 4
+                raise RuntimeError
+        assert context.add_bus_group("CONTROL", count=16).id_ == 5
+
+
+def test_allocation_batch_free(context):
+    with context.at(0):
+        with context.allocation_batch(control_buses=8):
+            bus_group = context.add_bus_group("CONTROL", count=4)
+            bus = context.add_bus("CONTROL")
+            # freeing by an index inside a handed-out block frees the whole block
+            assert context._free_batched_id(
+                Bus, bus_group.id_ + 2, calculation_rate=bus_group.calculation_rate
+            )
+            with pytest.raises(ValueError):
+                context._free_batched_id(
+                    Bus, bus_group.id_, calculation_rate=bus_group.calculation_rate
+                )
+            with pytest.raises(ValueError):
+                context._free_batched_id(
+                    Bus, 6, calculation_rate=bus_group.calculation_rate
+                )
+        assert not context._free_batched_id(
+            Bus, bus.id_, calculation_rate=bus.calculation_rate
+        )
+        assert context.add_bus_group("CONTROL", count=4).id_ == 0
+        assert context.add_bus("CONTROL").id_ == 5
+
+
+def test_plan_bus_compaction(context):
+    with context.at(0):
+        bus_groups = [context.add_bus_group("AUDIO", count=x) for x in (2, 4, 2)]
+        bus = context.add_bus("AUDIO")
+    # scores never free buses, so free from the allocator directly
+    context._audio_bus_allocator.free(bus_groups[0].id_)
+    assert context.plan_bus_compaction("CONTROL") == []
+    # free: [16, 18); moves fill it from the top down
+    (bus_group, bus_id), *moves = context.plan_bus_compaction("AUDIO")
+    assert (bus_group[0], len(bus_group), bus_id) == (bus, 1, 16)
+    assert moves == [(bus_groups[1], 17)]
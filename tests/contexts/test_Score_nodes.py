@@ -1,7 +1,10 @@
+import asyncio
+
 import pytest
 
 from supriya import default
 from supriya.assets.synthdefs import test_two_voice
+from supriya.contexts.errors import ContextError
 from supriya.contexts.nonrealtime import Score
 from supriya.osc import OscBundle, OscMessage
 from supriya.ugens import compile_synthdefs
@@ -121,6 +124,21 @@ def test_add_synth(context):
             synth.add_synth(default, add_action="ADD_TO_TAIL")
 
 
+def test_add_synth_use_control_indices(context):
+    with context.at(0):
+        context.add_synth(
+            default, use_control_indices=True, pan=0.25, frequency=443, out=2
+        )
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/s_new", "default", 1000, 0, 0, 1, 443.0, 3, 0.25, 4, 2.0),
+            ),
+            timestamp=0.0,
+        )
+    ]
+
+
 def test_free_group_children(context):
     with context.at(0):
         grandparent = context.add_group()
@@ -278,6 +296,67 @@ def test_set_node_range(context):
     ]
 
 
+def test_set_nodes(context):
+    with context.at(0):
+        groups = [context.add_group() for _ in range(3)]
+        context.set_nodes(
+            groups, amp=0.5, freq=[440, 550, 660], pos=[[0, 1], [1, 2], [2, 3]]
+        )
+    with context.at(1):
+        context.set_nodes(groups, skip_unchanged=True, amp=0.5, freq=[440, 551, 660])
+    with context.at(2):
+        context.set_nodes(groups, skip_unchanged=True, amp=0.5, freq=[440, 551, 660])
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/g_new", 1000, 0, 0, 1001, 0, 0, 1002, 0, 0),
+                OscMessage("/n_set", 1000, "amp", 0.5, "freq", 440.0),
+                OscMessage("/n_set", 1001, "amp", 0.5, "freq", 550.0),
+                OscMessage("/n_set", 1002, "amp", 0.5, "freq", 660.0),
+                OscMessage("/n_setn", 1000, "pos", 2, 0.0, 1.0),
+                OscMessage("/n_setn", 1001, "pos", 2, 1.0, 2.0),
+                OscMessage("/n_setn", 1002, "pos", 2, 2.0, 3.0),
+            ),
+            timestamp=0.0,
+        ),
+        OscBundle(
+            contents=(OscMessage("/n_set", 1001, "freq", 551.0),),
+            timestamp=1.0,
+        ),
+    ]
+
+
+def test_set_nodes_after_other_writes(context):
+    with context.at(0):
+        groups = [context.add_group() for _ in range(2)]
+        context.set_nodes(groups, skip_unchanged=True, amp=1.0)
+    with context.at(1):
+        groups[0].set(amp=2.0)
+    with context.at(2):
+        # the set() above invalidated what set_nodes() last sent to the first group
+        context.set_nodes(groups, skip_unchanged=True, amp=1.0, pan="c0")
+    assert list(context.iterate_osc_bundles())[1:] == [
+        OscBundle(
+            contents=(OscMessage("/n_set", 1000, "amp", 2.0),),
+            timestamp=1.0,
+        ),
+        OscBundle(
+            contents=(
+                OscMessage("/n_set", 1000, "amp", 1.0, "pan", "c0"),
+                OscMessage("/n_set", 1001, "pan", "c0"),
+            ),
+            timestamp=2.0,
+        ),
+    ]
+
+
+def test_set_nodes_mismatched_length(context):
+    with context.at(0):
+        groups = [context.add_group() for _ in range(3)]
+        with pytest.raises(ValueError):
+            context.set_nodes(groups, freq=[440, 550])
+
+
 def test_unpause_node(context):
     with context.at(0):
         group_a = context.add_group()
@@ -297,3 +376,44 @@ def test_unpause_node(context):
         ),
         OscBundle(contents=(OscMessage("/n_run", 1001, 1, 1002, 1),), timestamp=1.23),
     ]
+
+
+@pytest.mark.asyncio
+async def test_moments_are_task_local(context):
+    async def build(seconds: float, count: int) -> None:
+        with context.at(seconds):
+            for _ in range(count):
+                context.add_group()
+                await asyncio.sleep(0)
+
+    await asyncio.gather(build(0, 3), build(1, 2))
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(OscMessage("/g_new", 1000, 0, 0, 1002, 0, 0, 1004, 0, 0),),
+            timestamp=0.0,
+        ),
+        OscBundle(
+            contents=(OscMessage("/g_new", 1001, 0, 0, 1003, 0, 0),),
+            timestamp=1.0,
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_moments_closed_before_child_tasks_run(context):
+    async def build() -> None:
+        await asyncio.sleep(0)
+        # the moment this task was created in has been closed and sent
+        with pytest.raises(ContextError):
+            context.add_group()
+        with context.at(1):
+            context.add_group()
+
+    with context.at(0):
+        context.add_group()
+        task = asyncio.create_task(build())
+    await task
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(contents=(OscMessage("/g_new", 1000, 0, 0),), timestamp=0.0),
+        OscBundle(contents=(OscMessage("/g_new", 1001, 0, 0),), timestamp=1.0),
+    ]
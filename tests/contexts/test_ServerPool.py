@@ -0,0 +1,83 @@
+import asyncio
+import logging
+
+import pytest
+import pytest_asyncio
+
+from supriya import default
+from supriya.contexts.entities import Group, Synth
+from supriya.contexts.pools import AsyncServerPool, ServerPool
+from supriya.enums import BootStatus
+from supriya.osc import OscBundle, OscMessage, find_free_port
+
+
+async def get(x):
+    if asyncio.iscoroutine(x):
+        return await x
+    return x
+
+
+@pytest.fixture(autouse=True)
+def use_caplog(caplog):
+    caplog.set_level(logging.INFO)
+
+
+@pytest_asyncio.fixture(autouse=True, params=[AsyncServerPool, ServerPool])
+async def pool(request):
+    pool = request.param(count=2, port=find_free_port())
+    await get(pool.boot())
+    yield pool
+    await get(pool.quit())
+
+
+@pytest.mark.asyncio
+async def test_add_synthdefs(pool):
+    with pool[0].osc_protocol.capture() as transcript_0:
+        with pool[1].osc_protocol.capture() as transcript_1:
+            await get(pool.add_synthdefs(default))
+    for transcript in (transcript_0, transcript_1):
+        addresses = [
+            message.address
+            for message in transcript.filtered(received=False, status=False)
+        ]
+        assert addresses == ["/d_recv", "/sync"]
+
+
+@pytest.mark.asyncio
+async def test_at(pool):
+    await get(pool.add_synthdefs(default))
+    with pool[0].osc_protocol.capture() as transcript:
+        with pool.at(0.5):
+            pool.add_synth(default, server=pool[0])
+            pool.add_synth(default, server=pool[1])
+    sent = transcript.filtered(received=False, status=False)
+    assert len(sent) == 1 and isinstance(sent[0], OscBundle)
+    assert sent[0].timestamp == 0.5 + pool[0].latency
+
+
+@pytest.mark.asyncio
+async def test_lifecycle(pool):
+    assert len(pool) == 2
+    assert [server.boot_status for server in pool] == [BootStatus.ONLINE] * 2
+    assert pool[1].options.port == pool[0].options.port + 1
+    assert pool[0].options.maximum_node_id < pool[1].options.initial_node_id
+
+
+@pytest.mark.asyncio
+async def test_placement(pool):
+    await get(pool.add_synthdefs(default))
+    synths = [pool.add_synth(default) for _ in range(4)]
+    assert all(isinstance(synth, Synth) for synth in synths)
+    # placements count against a server until its next /status reply
+    assert {synth.context for synth in synths} == set(pool.servers)
+    for synth in synths:
+        assert pool.get_server(int(synth)) is synth.context
+    group = pool.add_group(target_node=synths[0], add_action="ADD_AFTER")
+    assert isinstance(group, Group) and group.context is synths[0].context
+    with pool[1].osc_protocol.capture() as transcript:
+        synth = pool.add_synth(default, server=pool[1], frequency=330)
+    assert transcript.filtered(received=False, status=False) == [
+        OscMessage("/s_new", "default", int(synth), 0, 1, "frequency", 330.0)
+    ]
+    with pytest.raises(ValueError):
+        pool.add_synth(default, server=pool[0], target_node=synth)
@@ -1,9 +1,11 @@
 import platform
 import random
+import time
 
 import pytest
 
 from supriya import Server
+from supriya.contexts import ScopeMonitor
 
 
 @pytest.mark.skipif(
@@ -48,3 +50,69 @@ def test_shared_memory(server: Server) -> None:
     assert server._shm[int(bus)] == values[-1]
     assert server._shm[bus] == values[-1]
     assert server._shm[bus_group] == values[: len(bus_group)]
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="SHM not built under Windows"
+)
+def test_shared_memory_control_busses(server: Server) -> None:
+    numpy = pytest.importorskip("numpy")
+
+    view = numpy.asarray(server._shm.control_busses)
+    assert view.dtype == numpy.float32
+    assert view.shape == (server.options.control_bus_channel_count,)
+
+    bus_group = server.add_bus_group(calculation_rate="CONTROL", count=8)
+    values = numpy.linspace(0.0, 1.0, 8, dtype=numpy.float32)
+    server._shm[bus_group] = values
+    assert numpy.array_equal(view[int(bus_group) : int(bus_group) + 8], values)
+    view[int(bus_group)] = 0.5
+    assert server._shm[bus_group[0]] == 0.5
+    assert bus_group[0].get() == 0.5
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="SHM not built under Windows"
+)
+def test_scope_monitor(server: Server) -> None:
+    numpy = pytest.importorskip("numpy")
+
+    bus_group = server.add_bus_group(calculation_rate="CONTROL", count=2)
+    bus_group.set_range([0.25, 0.75])
+    with ScopeMonitor(server, bus_group, frame_count=8) as monitor:
+        assert monitor.scope_id is not None
+        server.sync()
+        array = None
+        for _ in range(100):
+            if (array := monitor.read()) is not None:
+                break
+            time.sleep(0.01)
+        assert array is not None
+        assert array.shape == (8, 2)
+        assert numpy.allclose(array, [0.25, 0.75])
+    assert not monitor.is_running
+    assert monitor.read() is None
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="SHM not built under Windows"
+)
+def test_scope_monitor_changed_only(server: Server) -> None:
+    pytest.importorskip("numpy")
+
+    bus_group = server.add_bus_group(calculation_rate="CONTROL", count=2)
+    with ScopeMonitor(server, bus_group, frame_count=8) as monitor:
+        assert monitor.synth is not None
+        server.sync()
+        array = None
+        for _ in range(100):
+            if (array := monitor.read(changed_only=True)) is not None:
+                break
+            time.sleep(0.01)
+        assert array is not None
+        monitor.synth.pause()
+        server.sync()
+        # drain any block published before the pause took effect
+        monitor.read(changed_only=True)
+        assert monitor.read(changed_only=True) is None
+        assert monitor.read() is not None
@@ -10,6 +10,7 @@ import pytest_asyncio
 
 from supriya import assets, default
 from supriya.contexts.errors import MomentClosed
+from supriya.contexts.pools import AsyncBufferPool, BufferPool
 from supriya.contexts.realtime import AsyncServer, Server
 from supriya.contexts.responses import BufferInfo
 from supriya.osc import OscBundle, OscMessage
@@ -150,6 +151,34 @@ async def test_add_buffer_group(context):
     ]
 
 
+@pytest.mark.asyncio
+async def test_buffer_pool(context):
+    pool_class = AsyncBufferPool if isinstance(context, AsyncServer) else BufferPool
+    with context.osc_protocol.capture() as transcript:
+        pool = pool_class(context, frame_count=64, channel_count=2, size=4)
+    # a single bundle of /b_alloc requests
+    assert transcript.filtered(received=False, status=False) == [
+        OscBundle(contents=tuple(OscMessage("/b_alloc", i, 64, 2) for i in range(4)))
+    ]
+    buffers = [await get(pool.acquire()) for _ in range(6)]
+    assert [buffer.id_ for buffer in buffers] == [0, 1, 2, 3, 4, 5]
+    assert len(pool) == 8
+    assert pool.high_water_mark == 6
+    assert pool.in_use_count == 6
+    for buffer in buffers[:2]:
+        pool.release(buffer)
+    with pytest.raises(ValueError):
+        pool.release(buffers[0])
+    await get(context.sync())
+    # released buffers are zeroed, then returned to the pool
+    assert pool.free_count == 4
+    assert pool.pending_count == 0
+    pool.free()
+    assert len(pool) == 0
+    await get(context.sync())
+    assert not any(buffer in context for buffer in buffers)
+
+
 @pytest.mark.asyncio
 async def test_close_buffer(context):
     buffer_a = context.add_buffer(channel_count=1, frame_count=23)
@@ -329,6 +358,31 @@ async def test_get_buffer_range(context):
     ]
 
 
+@pytest.mark.asyncio
+async def test_buffer_numpy_round_trip(context):
+    numpy = pytest.importorskip("numpy")
+    array = numpy.random.uniform(-1.0, 1.0, (20000, 2)).astype(numpy.float32)
+    buffer = context.add_buffer(channel_count=1, frame_count=1)
+    await get(buffer.from_numpy(array))
+    info = (await get(buffer.query())).items[0]
+    assert (info.frame_count, info.channel_count) == (20000, 2)
+    result = await get(buffer.to_numpy())
+    assert result.shape == (20000, 2)
+    assert numpy.array_equal(result, array)
+
+
+@pytest.mark.asyncio
+async def test_get_buffer_range_chunked(context):
+    numpy = pytest.importorskip("numpy")
+    buffer = context.add_buffer(channel_count=1, frame_count=10000)
+    buffer.set_range(0, numpy.linspace(-1.0, 1.0, 10000, dtype=numpy.float32))
+    await get(context.sync())
+    values = await get(buffer.get_range(0, 10000, as_array=True))
+    assert isinstance(values, numpy.ndarray)
+    assert numpy.allclose(values, numpy.linspace(-1.0, 1.0, 10000))
+    assert await get(buffer.get_range(1633, 3)) == tuple(values[1633:1636].tolist())
+
+
 @pytest.mark.asyncio
 async def test_normalize_buffer(context):
     buffer = context.add_buffer(channel_count=1, frame_count=23)
@@ -366,6 +420,22 @@ async def test_query_buffer(context):
     ]
 
 
+@pytest.mark.asyncio
+async def test_query_buffers(context):
+    buffers = [
+        context.add_buffer(channel_count=1 + i % 3, frame_count=128 + i)
+        for i in range(10)
+    ]
+    await asyncio.sleep(0.1)
+    items = await get(context.query_buffers(buffers[::-1], batch_size=4, window=2))
+    assert [
+        (item.buffer_id, item.frame_count, item.channel_count) for item in items
+    ] == [
+        (buffer.id_, 128 + i, 1 + i % 3)
+        for i, buffer in reversed(list(enumerate(buffers)))
+    ]
+
+
 @pytest.mark.asyncio
 async def test_read_buffer(audio_paths, context):
     buffer_a = context.add_buffer(channel_count=1, frame_count=23)
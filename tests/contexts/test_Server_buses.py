@@ -6,8 +6,10 @@ import pytest_asyncio
 
 from supriya import default
 from supriya.contexts.errors import InvalidCalculationRate
+from supriya.contexts.monitors import BusMonitor
 from supriya.contexts.realtime import AsyncServer, Server
-from supriya.osc import OscMessage
+from supriya.contexts.streams import ControlStreamFlusher
+from supriya.osc import OscBundle, OscMessage
 
 
 async def get(x):
@@ -145,6 +147,20 @@ async def test_get_bus(context):
     ]
 
 
+@pytest.mark.asyncio
+async def test_get_buses(context):
+    audio_bus = context.add_bus("audio")
+    with pytest.raises(InvalidCalculationRate):
+        await get(context.get_buses([audio_bus]))
+    buses = [context.add_bus() for _ in range(8)]
+    for i, bus in enumerate(buses):
+        bus.set(i * 0.5)
+    await get(context.sync())
+    assert await get(
+        context.get_buses(buses[::-1] + buses[:1], batch_size=3, window=2)
+    ) == [3.5, 3.0, 2.5, 2.0, 1.5, 1.0, 0.5, 0.0, 0.0]
+
+
 @pytest.mark.asyncio
 async def test_get_bus_range(context):
     audio_bus_group = context.add_bus_group("audio", count=4)
@@ -179,10 +195,12 @@ async def test_set_bus(context):
         with context.at():
             control_bus_b.set(0.25)
             control_bus_c.set(0.125)
-    assert transcript.filtered(received=False, status=False) == [
-        OscMessage("/c_set", 0, 0.5),
-        OscMessage("/c_set", 1, 0.25, 2, 0.125),
-    ]
+    expected = [OscMessage("/c_set", 1, 0.25, 2, 0.125)]
+    if context._shm is None:
+        expected.insert(0, OscMessage("/c_set", 0, 0.5))
+    else:  # written directly into shared memory
+        assert context._shm[control_bus_a] == 0.5
+    assert transcript.filtered(received=False, status=False) == expected
 
 
 @pytest.mark.asyncio
@@ -193,6 +211,102 @@ async def test_set_bus_range(context):
         with pytest.raises(InvalidCalculationRate):
             audio_bus_group[0].set_range((0.1, 0.2, 0.3, 0.4))
         control_bus_group[0].set_range((0.1, 0.2, 0.3, 0.4))
+    expected = []
+    if context._shm is None:
+        expected.append(OscMessage("/c_setn", 0, 4, 0.1, 0.2, 0.3, 0.4))
+    else:  # written directly into shared memory
+        assert context._shm[control_bus_group] == pytest.approx([0.1, 0.2, 0.3, 0.4])
+    assert transcript.filtered(received=False, status=False) == expected
+
+
+@pytest.mark.asyncio
+async def test_bus_group_range(context):
+    bus_group = context.add_bus_group("CONTROL", count=4)
+    bus_group.set_range((0.5, 0.25, 0.125, 0.0625))
+    await get(context.sync())
+    assert await get(bus_group.get_range()) == (0.5, 0.25, 0.125, 0.0625)
+
+
+@pytest.mark.asyncio
+async def test_bus_monitor(context):
+    pytest.importorskip("numpy")
+    bus_group = context.add_bus_group("CONTROL", count=4)
+    bus_group.set_range((0.5, 0.25, 0.125, 0.0625))
+    await get(context.sync())
+    assert isinstance(context.bus_monitor, BusMonitor)
+    # poll only explicitly, as background polls would consume the changes
+    monitor = BusMonitor(context, rate=0.001)
+    changes_a, changes_b = [], []
+    unsubscribe_a = monitor.subscribe(bus_group[:2], changes_a.append)
+    unsubscribe_b = monitor.subscribe(bus_group[1:], changes_b.append)
+    assert monitor.ranges == [(int(bus_group), 4)]
+    assert await get(monitor.poll()) == {
+        int(bus_group) + i: x for i, x in enumerate((0.5, 0.25, 0.125, 0.0625))
+    }
+    assert changes_a == [{bus_group[0]: 0.5, bus_group[1]: 0.25}]
+    assert changes_b == [
+        {bus_group[1]: 0.25, bus_group[2]: 0.125, bus_group[3]: 0.0625}
+    ]
+    bus_group[3].set(1.0)
+    await get(context.sync())
+    assert await get(monitor.poll()) == {int(bus_group) + 3: 1.0}
+    assert len(changes_a) == 1
+    assert changes_b[-1] == {bus_group[3]: 1.0}
+    assert monitor.snapshot().tolist() == [0.5, 0.25, 0.125, 1.0]
+    unsubscribe_a()
+    assert monitor.ranges == [(int(bus_group) + 1, 3)]
+    unsubscribe_b()
+    assert not monitor.is_running
+
+
+@pytest.mark.asyncio
+async def test_control_stream(context):
+    audio_bus = context.add_bus("AUDIO")
+    control_bus = context.add_bus("CONTROL")
+    synth = context.add_synth(default)
+    await get(context.sync())
+    flusher = ControlStreamFlusher(context)
+    with pytest.raises(InvalidCalculationRate):
+        flusher.stream(audio_bus)
+    with pytest.raises(ValueError):
+        flusher.stream(synth)
+    frequency = flusher.stream(synth, "frequency")
+    amplitude = flusher.stream(synth, "amplitude")
+    bus = flusher.stream(control_bus)
+    assert flusher.stream(synth, "frequency") is frequency
+    with context.osc_protocol.capture() as transcript:
+        for i in range(100):
+            frequency.set(440 + i)
+            bus.set(i / 100)
+        amplitude.set(0.5)
+        assert frequency.is_dirty
+        assert flusher.flush() == 3
+        assert not frequency.is_dirty
+        # unchanged values are suppressed
+        frequency.set(539)
+        amplitude.set(0.25)
+        assert flusher.flush() == 1
+        assert flusher.flush() == 0
+    # node controls are sent in the order they became dirty
+    assert transcript.filtered(received=False, status=False) == [
+        OscBundle(
+            contents=(
+                OscMessage("/n_set", synth.id_, "frequency", 539.0, "amplitude", 0.5),
+                OscMessage("/c_set", control_bus.id_, 0.99),
+            ),
+            timestamp=None,
+        ),
+        OscMessage("/n_set", synth.id_, "amplitude", 0.25),
+    ]
+    # a running flusher wakes on the first dirty stream
+    with context.osc_protocol.capture() as transcript:
+        with flusher:
+            bus.set(0.125)
+            for _ in range(100):
+                if transcript.filtered(received=False, status=False):
+                    break
+                await asyncio.sleep(0.01)
+        assert not flusher.is_running
     assert transcript.filtered(received=False, status=False) == [
-        OscMessage("/c_setn", 0, 4, 0.1, 0.2, 0.3, 0.4),
+        OscMessage("/c_set", control_bus.id_, 0.125)
     ]
@@ -1,15 +1,19 @@
 import asyncio
+import concurrent.futures
 import logging
 import re
 import subprocess
 import sys
+from pathlib import Path
 
 import pytest
 import pytest_asyncio
 from uqbar.strings import normalize
 
-from supriya import default, scsynth
+from supriya import assets, default, scsynth
 from supriya.contexts.entities import Group
+from supriya.contexts.latency import LatencyController
+from supriya.contexts.manifests import BootManifest
 from supriya.contexts.realtime import AsyncServer, Server
 from supriya.contexts.responses import StatusInfo, VersionInfo
 from supriya.exceptions import ServerOffline
@@ -1182,8 +1186,142 @@ async def test_sync(context):
         await get(context.sync())
 
 
+@pytest.mark.asyncio
+async def test_sync_coalesced(context):
+    with context.osc_protocol.capture() as transcript:
+        if isinstance(context, AsyncServer):
+            await asyncio.gather(*(context.sync() for _ in range(100)))
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+                list(executor.map(lambda _: context.sync(), range(100)))
+    syncs = [
+        message
+        for message in transcript.filtered(received=False, status=False)
+        if message.address == "/sync"
+    ]
+    # callers arriving while a /sync is in flight share it, or the one after it
+    assert 1 <= len(syncs) < 100
+    # explicit sync IDs are never shared
+    with context.osc_protocol.capture() as transcript:
+        await get(context.sync(sync_id=1000))
+    assert transcript.filtered(received=False, status=False) == [
+        OscMessage("/sync", 1000)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_latency_controller(context):
+    context.set_latency(0.5)
+    changes = []
+    controller = LatencyController(context, minimum=0.01, maximum=0.25)
+    controller.subscribe(changes.append)
+    with controller:
+        assert context.latency_controller is controller
+        assert context.telemetry.is_running
+        # the starting latency is clamped into bounds
+        assert context.latency == controller.latency == 0.25
+        context.set_latency(0.05)
+        context._handle_late_event(
+            scsynth.LateEvent(lateness=0.1, timestamp=0.0, count=1)
+        )
+        # late bundles raise the latency immediately, by at least their lateness
+        assert context.latency == pytest.approx(0.155)
+        assert controller.demand == pytest.approx(0.155)
+        assert [change.latency for change in changes] == [0.25, context.latency]
+        assert controller.change_count == len(controller.changes) == 2
+        lines = context.telemetry.export().splitlines()
+        assert "# TYPE supriya_client_latency_changes_total counter" in lines
+    assert context.latency_controller is None
+    assert not context.telemetry.is_running
+    assert not controller.is_running
+
+
+@pytest.mark.asyncio
+async def test_manifest(context):
+    file_path = Path(assets.__path__[0]) / "audio" / "sine_440hz_44100sr_16bit_mono.wav"
+    manifest = BootManifest(
+        synthdefs=[default],
+        buffers={"sine": file_path},
+        buses={"lfo": ("CONTROL", 2)},
+        groups=["sources", "effects"],
+    )
+    await get(context.quit())
+    await get(context.boot(manifest=manifest))
+    assert context.manifest is manifest
+    resources = context.manifest_resources
+    assert {name: group.id_ for name, group in resources.groups.items()} == {
+        "sources": 1000,
+        "effects": 1001,
+    }
+    assert resources.buffers["sine"].id_ == 0
+    assert len(resources.buses["lfo"]) == 2
+    # everything is loaded by the time the boot returns
+    assert (await get(resources.buffers["sine"].query())).items[0].frame_count > 0
+    tree = await get(context.query_tree())
+    assert [child.node_id for child in tree.children[0].children] == [1000, 1001]
+    # the manifest is applied again on reboot
+    await get(context.reboot())
+    assert context.manifest is manifest
+    assert context.manifest_resources is not resources
+    assert context.manifest_resources.groups["effects"].id_ == 1001
+
+
 @pytest.mark.asyncio
 async def test_root_node(context):
     assert isinstance(context.root_node, Group)
     assert context.root_node.context is context
     assert context.root_node.id_ == 0
+
+
+@pytest.mark.asyncio
+async def test_telemetry(context):
+    samples = []
+    unsubscribe = context.telemetry.subscribe(samples.append)
+    with context.osc_protocol.capture() as transcript:
+        sample = await get(context.telemetry.sample())
+    assert OscMessage("/status") in transcript.filtered(received=False)
+    assert samples == [sample] == context.telemetry.history
+    assert sample.round_trip_time > 0
+    assert sample.group_count == 2
+    assert sample.datagrams_sent > 0 and sample.bytes_sent > 0
+    unsubscribe()
+    await get(context.telemetry.sample())
+    assert len(samples) == 1 and len(context.telemetry.history) == 2
+    server = f'{{server="{context.options.ip_address}:{context.options.port}"}}'
+    prometheus = context.telemetry.export().splitlines()
+    assert prometheus[:3] == [
+        "# HELP supriya_server_cpu_average_percent Average DSP CPU usage.",
+        "# TYPE supriya_server_cpu_average_percent gauge",
+        prometheus[2],
+    ]
+    assert prometheus[2].startswith(f"supriya_server_cpu_average_percent{server} ")
+    assert "# TYPE supriya_client_sent_datagrams_total counter" in prometheus
+    openmetrics = context.telemetry.export(openmetrics=True).splitlines()
+    assert "# TYPE supriya_client_sent_datagrams counter" in openmetrics
+    assert openmetrics[-1] == "# EOF"
+
+
+@pytest.mark.asyncio
+async def test_late_monitor(context):
+    monitor = context.late_monitor
+    events = []
+    unsubscribe = monitor.subscribe(events.append)
+    for i, lateness in enumerate([0.01, 0.02, 0.03, 0.04, 0.05], 1):
+        context._handle_late_event(
+            scsynth.LateEvent(lateness=lateness, timestamp=0.0, count=i)
+        )
+    unsubscribe()
+    assert len(events) == monitor.count == 5
+    assert monitor.maximum == 0.05
+    assert monitor.total == pytest.approx(0.15)
+    assert monitor.percentiles(0.0, 0.5, 0.9) == pytest.approx(
+        {0.0: 0.01, 0.5: 0.03, 0.9: 0.046}
+    )
+    lines = context.telemetry.export().splitlines()
+    assert "# TYPE supriya_server_late_seconds summary" in lines
+    assert any(
+        line.startswith("supriya_server_late_seconds_count{") and line.endswith(" 5")
+        for line in lines
+    )
+    monitor.reset()
+    assert monitor.count == 0 and not monitor.history
@@ -7,10 +7,13 @@ from uqbar.strings import normalize
 
 from supriya import default
 from supriya.assets.synthdefs import test_two_voice
+from supriya.contexts.monitors import ReplyStream
+from supriya.contexts.pools import VoicePool
 from supriya.contexts.realtime import AsyncServer, Server
 from supriya.contexts.responses import NodeInfo
 from supriya.enums import NodeAction
 from supriya.osc import OscBundle, OscMessage
+from supriya.ugens import DC, Impulse, SendReply, SynthDefBuilder
 
 
 async def get(x):
@@ -414,6 +417,33 @@ async def test_query_node(context):
     ]
 
 
+@pytest.mark.asyncio
+async def test_query_nodes(context):
+    groups = [context.add_group() for _ in range(100)]
+    groups[50].free()
+    await asyncio.sleep(0.1)
+    nodes = list(reversed(groups))
+    with context.osc_protocol.capture() as transcript:
+        node_infos = await get(context.query_nodes(nodes, batch_size=16, window=2))
+    # results come back in input order, with freed nodes reported as None
+    assert [
+        node_info.node_id if node_info else None for node_info in node_infos
+    ] == [None if node is groups[50] else node.id_ for node in nodes]
+    assert all(
+        node_info.action == NodeAction.NODE_QUERIED
+        for node_info in node_infos
+        if node_info
+    )
+    # 100 nodes in 7 bundles of per-node /n_query requests and a /sync
+    assert len(transcript.filtered(received=False, status=False)) == 7
+    # the freed node isn't reported as a failure
+    assert not [
+        message
+        for message in transcript.filtered(sent=False, status=False)
+        if message.address == "/fail"
+    ]
+
+
 @pytest.mark.asyncio
 async def test_set_node(context):
     group = context.add_group()
@@ -464,3 +494,137 @@ async def test_unpause_node(context):
             timestamp=1.23 + context.latency,
         ),
     ]
+
+
+@pytest.mark.asyncio
+async def test_voice_pool(context):
+    with context.osc_protocol.capture() as transcript:
+        pool = VoicePool(context, default, size=2, amplitude=0.0)
+    # group, synths and pauses in a single bundle
+    assert transcript.filtered(received=False, status=False) == [
+        OscBundle(
+            contents=(
+                OscMessage("/g_new", 1000, 0, 1),
+                OscMessage("/s_new", "default", 1001, 0, 1000, "amplitude", 0.0),
+                OscMessage("/n_run", 1001, 0),
+                OscMessage("/s_new", "default", 1002, 0, 1000, "amplitude", 0.0),
+                OscMessage("/n_run", 1002, 0),
+            )
+        )
+    ]
+    await get(context.sync())
+    # activate idle voices with one /n_set + /n_run bundle each
+    with context.osc_protocol.capture() as transcript:
+        voice_a = pool.activate(frequency=440)
+        voice_b = pool.activate(frequency=220)
+    assert transcript.filtered(received=False, status=False) == [
+        OscBundle(
+            contents=(
+                OscMessage("/n_set", 1001, "frequency", 440.0, "gate", 1.0),
+                OscMessage("/n_run", 1001, 1),
+            )
+        ),
+        OscBundle(
+            contents=(
+                OscMessage("/n_set", 1002, "frequency", 220.0, "gate", 1.0),
+                OscMessage("/n_run", 1002, 1),
+            )
+        ),
+    ]
+    assert pool.active_count == 2 and pool.idle_count == 0
+    # saturated, so the oldest voice is stolen
+    voice_c = pool.activate(frequency=330)
+    assert not voice_a.is_active and voice_c.is_active
+    assert pool.steal_count == 1
+    # released voices free themselves and are replaced by fresh paused synths
+    voice_b.release()
+    voice_c.release()
+    voice_a.release()  # already stolen, so a no-op
+    await asyncio.sleep(0.5)
+    assert pool.idle_count == 2
+    assert pool.active_count == pool.releasing_count == 0
+    assert len(pool.group.children) == 2
+    pool.free()
+    await get(context.sync())
+    # per-node callbacks go with their synths
+    assert not context._node_end_callbacks and not context._node_off_callbacks
+
+
+@pytest.mark.asyncio
+async def test_node_lifecycle(context):
+    async def result(future):
+        if isinstance(future, asyncio.Future):
+            return await asyncio.wait_for(future, 1.0)
+        return await asyncio.wait_for(asyncio.wrap_future(future), 1.0)
+
+    group = context.add_group()
+    watch = group.watch()
+    synth = group.add_synth(default)
+    started, ended, on_end = synth.started(), synth.ended(), []
+    synth.on_end(on_end.append)
+    remove = synth.on_end(on_end.append)
+    remove()
+    assert (await result(started)).node_id == synth.id_
+    # already running, so resolves immediately
+    assert (await result(synth.started())).parent_id == group.id_
+    synth.free(force=True)
+    node_info = await result(ended)
+    assert node_info.action == NodeAction.NODE_REMOVED
+    assert on_end == [node_info]
+    group.free()
+    await get(context.sync())
+    if isinstance(context, AsyncServer):
+        events = [event async for event in watch]
+    else:
+        events = list(watch)
+    assert [(event.action, event.node_id) for event in events] == [
+        (NodeAction.NODE_CREATED, group.id_),
+        (NodeAction.NODE_CREATED, synth.id_),
+        (NodeAction.NODE_REMOVED, synth.id_),
+        (NodeAction.NODE_REMOVED, group.id_),
+    ]
+    assert watch.is_closed
+    assert not context._node_end_callbacks and not context._node_watches
+
+
+@pytest.mark.asyncio
+async def test_reply_stream(context):
+    pytest.importorskip("numpy")
+    with SynthDefBuilder() as builder:
+        trigger = Impulse.kr(frequency=500)
+        SendReply.kr(
+            reply_id=1, source=[DC.kr(source=0.5), DC.kr(source=0.25)], trigger=trigger
+        )
+        SendReply.kr(reply_id=2, source=DC.kr(source=1.0), trigger=trigger)
+    with context.add_synthdefs(synthdef := builder.build()):
+        synth = context.add_synth(synthdef)
+    await get(context.sync())
+    others = []
+    context.osc_protocol.register(
+        pattern=["/reply", synth.id_], procedure=others.append
+    )
+    stream = ReplyStream(context, synth, 1, channel_count=2, block_size=8).start()
+    # replies whose value count doesn't match the stream fall back to dispatch
+    mismatched = ReplyStream(context, synth, 2, channel_count=2).start()
+    if isinstance(context, AsyncServer):
+        blocks = []
+        async for block in stream:
+            blocks.append(block)
+            if len(blocks) == 2:
+                break
+        assert [block.shape for block in blocks] == [(8, 2), (8, 2)]
+    else:
+        for _ in range(100):
+            if stream.reply_count >= 16:
+                break
+            await asyncio.sleep(0.01)
+    assert stream.latest(4).tolist() == [[0.5, 0.25]] * 4
+    # replies not routed into the stream still reach registered callbacks
+    assert others and {message.contents[1] for message in others} == {2}
+    assert mismatched.reply_count == 0
+    # truncated datagrams are left to the OSC protocol too
+    assert not context._handle_reply_datagram(b"/reply\x00\x00,iif\x00\x00\x00\x00")
+    synth.free()
+    await get(context.sync())
+    assert not stream.is_running
+    assert not context._reply_streams
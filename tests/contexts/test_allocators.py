@@ -1,4 +1,6 @@
-from supriya.contexts.allocators import BlockAllocator
+import pytest
+
+from supriya.contexts.allocators import BlockAllocator, NodeIdAllocator
 
 
 def test_allocate():
@@ -33,3 +35,88 @@ def test_allocate_block_within_block():
     assert allocator.allocate_at(0, 9) is None
     assert allocator.allocate_at(3, 3) == 3
     assert allocator.free(99) is None
+
+
+@pytest.mark.parametrize(
+    "fit, expected",
+    [
+        ("best", [12, 5, 0]),
+        ("first", [0, 1, 5]),
+    ],
+)
+def test_allocate_fit(fit, expected):
+    allocator = BlockAllocator(heap_maximum=32, fit=fit)
+    for index, size in [(4, 1), (8, 4), (13, 7), (28, 4)]:
+        assert allocator.allocate_at(index, size) == index
+    # free blocks: [0, 4), [5, 8), [12, 13), [20, 28)
+    assert [allocator.allocate(size) for size in (1, 3, 2)] == expected
+
+
+def test_allocate_lowest_address_by_default():
+    allocator = BlockAllocator()
+    assert [allocator.allocate(size) for size in (4, 1, 2, 1)] == [0, 4, 5, 7]
+    allocator.free(0)
+    allocator.free(5)
+    # free: [0, 4), [5, 7) and everything from 8 up
+    assert allocator.allocate(2) == 0
+    assert allocator.allocate(2) == 2
+    assert allocator.allocate(2) == 5
+
+
+def test_allocate_many():
+    allocator = BlockAllocator()
+    block_ids = [allocator.allocate(2) for _ in range(10_000)]
+    assert block_ids == list(range(0, 20_000, 2))
+    for block_id in block_ids[::2]:
+        allocator.free(block_id + 1)
+    for block_id in block_ids[1::2]:
+        allocator.free(block_id)
+    assert allocator.allocate(20_000) == 0
+
+
+def test_stats():
+    allocator = BlockAllocator(heap_minimum=16, heap_maximum=48)
+    block_ids = [allocator.allocate(4) for _ in range(8)]
+    stats = allocator.stats()
+    assert (stats.live_block_count, stats.used_size, stats.free_size) == (8, 32, 0)
+    assert stats.fragmentation == 0.0
+    for block_id in block_ids[::2]:
+        allocator.free(block_id)
+    assert allocator.allocate(8) is None
+    assert allocator.allocate_at(16, 8) is None
+    stats = allocator.stats()
+    assert stats.live_block_count == 4
+    assert stats.free_block_count == 4
+    assert stats.free_size == 16
+    assert stats.largest_free_block_size == 4
+    assert stats.fragmentation == 0.75
+    assert stats.failure_count == 2
+    assert not stats.unbounded
+    allocator.free(block_ids[1])
+    stats = allocator.stats()
+    assert stats.free_block_count == 3
+    assert stats.largest_free_block_size == 12
+    assert BlockAllocator().stats().unbounded
+
+
+def test_plan_compaction():
+    allocator = BlockAllocator()
+    block_ids = [allocator.allocate(size) for size in (1, 2, 3, 1, 2, 3)]
+    assert block_ids == [0, 1, 3, 6, 7, 9]
+    allocator.free(1)
+    allocator.free(3)
+    # free: [1, 6); moves fill it from the top down, leaving the allocator as-is
+    assert allocator.plan_compaction() == [(9, 1, 3), (7, 4, 2)]
+    assert allocator.stats().live_block_count == 4
+
+
+def test_node_id_allocator_wraps_blocks():
+    allocator = NodeIdAllocator(client_id=1, maximum_node_id=1009)
+    mask = 1 << 26
+    node_ids = [allocator.allocate_node_id(4) - mask for _ in range(4)]
+    # blocks never run past the maximum, restarting at the initial node ID instead
+    assert node_ids == [1000, 1004, 1000, 1004]
+    assert allocator.allocate_node_id(2) - mask == 1008
+    assert allocator.allocate_node_id() - mask == 1000
+    with pytest.raises(ValueError):
+        allocator.allocate_node_id(11)
@@ -1,6 +1,16 @@
+import pytest
 from uqbar.strings import normalize
 
 from supriya import Server, default
+from supriya.contexts.responses import (
+    GetControlBusRangeInfo,
+    GetNodeControlInfo,
+    NodeInfo,
+    Response,
+    SyncedInfo,
+)
+from supriya.enums import NodeAction
+from supriya.osc import OscMessage
 
 
 def test_QueryTreeGroup_annotate() -> None:
@@ -70,3 +80,51 @@ def test_QueryTreeGroup_annotate() -> None:
                             amplitude: 0.1, frequency: 440.0, gate: 1.0, pan: 0.5, out: 0.0
         """
     )
+
+
+@pytest.mark.parametrize(
+    "osc_message, expected",
+    [
+        (
+            OscMessage("/c_setn", 0, 2, 0.5, 0.25),
+            GetControlBusRangeInfo(items=[(0, (0.5, 0.25))]),
+        ),
+        (
+            OscMessage("/n_go", 1000, 1, -1, -1, 0),
+            NodeInfo(
+                action=NodeAction.NODE_CREATED,
+                node_id=1000,
+                parent_id=1,
+                previous_id=-1,
+                next_id=-1,
+                is_group=False,
+            ),
+        ),
+        (
+            OscMessage("/n_end", 1000, 1, -1, -1, 1, -1, -1),
+            NodeInfo(
+                action=NodeAction.NODE_REMOVED,
+                node_id=1000,
+                parent_id=1,
+                previous_id=-1,
+                next_id=-1,
+                is_group=True,
+                head_id=-1,
+                tail_id=-1,
+            ),
+        ),
+        (
+            OscMessage(15, 1000, "frequency", 440.0),
+            GetNodeControlInfo(node_id=1000, items=[("frequency", 440.0)]),
+        ),
+        (OscMessage("/synced", 3), SyncedInfo(sync_id=3)),
+    ],
+)
+def test_Response_from_osc(osc_message: OscMessage, expected: Response) -> None:
+    assert Response.from_osc(osc_message) == expected
+    assert type(expected).from_osc(osc_message) == expected
+
+
+def test_Response_from_osc_unknown() -> None:
+    with pytest.raises(KeyError):
+        Response.from_osc(OscMessage("/unknown"))
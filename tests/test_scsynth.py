@@ -128,3 +128,42 @@ def test_Options(kwargs: Dict, expected: List[str]) -> None:
     actual = list(options)
     actual[0] = "/path/to/scsynth"  # replace to make it portable
     assert actual == expected
+
+
+def test_ProcessProtocol_late_lines():
+    import concurrent.futures
+
+    events: List[scsynth.LateEvent] = []
+    protocol = scsynth.ProcessProtocol(on_late_callback=events.append)
+    boot_future: concurrent.futures.Future[bool] = concurrent.futures.Future()
+    protocol._handle_data_received(
+        boot_future=boot_future,
+        text="late 0.0123\nSuperCollider 3 server ready.\nlate 0.5\nlate oops\nla",
+    )
+    assert boot_future.result(timeout=0) is True
+    assert [(event.lateness, event.count) for event in events] == [
+        (0.0123, 1),
+        (0.5, 2),
+    ]
+    assert protocol.late_count == 2
+    assert protocol.buffer_ == "la"
+
+
+def test_ProcessPool():
+    from supriya.contexts import Server
+
+    server = Server()
+    with scsynth.ProcessPool(size=1) as pool:
+        for _ in range(2):
+            server.boot(pool=pool)
+            assert server.is_owner
+            assert server.options.port == server.process_protocol.options.port
+            assert pool.lent_count == 1
+            server.quit()
+            assert pool.lent_count == 0
+        # processes released as not reusable are quit rather than lent out again
+        process_protocol = pool.acquire()
+        pool.release(process_protocol, reusable=False)
+        assert process_protocol not in pool._idle
+    assert pool.idle_count == 0
+    assert not pool.is_running